@@ -28,7 +28,7 @@ from src.data_loader import (
 from src.dispatch_engine import dispatch, DispatchResult
 from src.validator import validate_scenarios, validate_cases
 from src.triage_engine import triage, SYMPTOM_POINTS, RED_FLAGS
-from src.medic_matcher import assign_medic
+from src.medic_matcher import MedicMapView, assign_medic
 from src.gemini_engine import (
     analyze_audio_call,
     is_gemini_available,
@@ -37,6 +37,11 @@ from src.gemini_engine import (
 from src.map_utils import render_mission_map
 
 
+# Medics shown on the mission map: a box around the patient (~11 km each way,
+# well past the zoom-14 viewport), capped so a large roster stays cheap.
+MISSION_MAP_MEDICS = MedicMapView(radius_deg=0.1, limit=200)
+
+
 
 
 
@@ -642,7 +647,10 @@ def render_live_command(data: Dict[str, Any]):
             "category": category,
         }
         scenario_id = scenario.get("scenario_id", 1) if scenario else 999
-        assignment = assign_medic(decision_output, triage_output, scenario_seed=scenario_id)
+        assignment = assign_medic(
+            decision_output, triage_output, scenario_seed=scenario_id, medic_view=MISSION_MAP_MEDICS,
+            time_of_day=scenario.get("time_of_day") if scenario else None,
+        )
         ops_location = resolve_ops_location(assignment.get("patient_location"))
         all_medics = assignment.get("all_medics", [])
 
@@ -898,7 +906,9 @@ def render_triage_tab(data: Dict[str, Any]):
         decision_output = {"response_mode": matcher_mode}
         triage_output = {"severity_level": sev, "category": cat}
         triage_seed = stable_int_seed(cat, sev, duration, ",".join(sorted(symptoms)))
-        assignment = assign_medic(decision_output, triage_output, scenario_seed=triage_seed)
+        assignment = assign_medic(
+            decision_output, triage_output, scenario_seed=triage_seed, medic_view=MISSION_MAP_MEDICS
+        )
         ops_location = resolve_ops_location(assignment.get("patient_location"))
         all_medics = assignment.get("all_medics", [])
 
@@ -0,0 +1,76 @@
+"""
+Benchmark: binary audit log vs JSON lines for a large decision history.
+
+Run with: python -m benchmarks.bench_audit_log [records]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from src.audit_log import AuditLogWriter, read_audit_log
+from src.dispatch_engine import RESPONSE_MODE_CODES, RULE_CODES, dispatch, dispatch_batch
+from benchmarks.bench_fleet_allocator import surge_columns
+
+
+CHUNK = 100_000
+YEAR_START = 1_767_225_600.0  # 2026-01-01 UTC
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+
+    print("=" * 80)
+    print("AUDIT LOG BENCHMARK")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "decisions.audit")
+
+        start = time.perf_counter()
+        with AuditLogWriter(path) as log:
+            for offset in range(0, n, CHUNK):
+                size = min(CHUNK, n - offset)
+                columns = surge_columns(size, seed=offset)
+                timestamps = YEAR_START + (offset + np.arange(size)) * (365 * 86400 / n)
+                log.append_batch(dispatch_batch(*columns), *columns, timestamps=timestamps)
+        write_s = time.perf_counter() - start
+        binary_size = os.path.getsize(path)
+
+        sample = [dispatch(*row) for row in zip(*(c.tolist() for c in surge_columns(10_000)))]
+        start = time.perf_counter()
+        with AuditLogWriter(os.path.join(tmp, "scalar.audit")) as log:
+            for result in sample:
+                log.append(result)
+        scalar_us = (time.perf_counter() - start) / len(sample) * 1e6
+
+        json_bytes = sum(len(json.dumps({**r._asdict(), "reasons": r.reasons})) + 1 for r in sample) / len(sample) * n
+
+        start = time.perf_counter()
+        audit = read_audit_log(path)
+        open_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        modes = audit.mode_counts()
+        rules = audit.rule_counts()
+        june = audit.between(YEAR_START + 151 * 86400, YEAR_START + 181 * 86400)
+        june_air = audit.mode_counts(june)
+        mean_ground = float(audit["ground_eta_min"][audit.rule_codes == RULE_CODES.index("EMERGENCY_OVERRIDE")].mean())
+        query_s = time.perf_counter() - start
+
+        print(f"\n  Records:                 {n:,}")
+        print(f"  Batch append:            {write_s:.2f} s ({n / write_s:,.0f} records/s)")
+        print(f"  Scalar append():         {scalar_us:.2f} us/record")
+        print(f"  Binary size:             {binary_size / 1e6:,.1f} MB")
+        print(f"  JSON lines (estimated):  {json_bytes / 1e6:,.1f} MB ({json_bytes / binary_size:.1f}x larger)")
+        print(f"  Open (mmap):             {open_ms:.2f} ms")
+        print(f"  Year aggregate queries:  {query_s * 1000:.1f} ms")
+        print(f"    modes={modes}")
+        print(f"    rules={rules}")
+        print(f"    June BOTH={june_air[RESPONSE_MODE_CODES[2]]:,}, "
+              f"mean ground ETA under EMERGENCY_OVERRIDE={mean_ground:.1f} min")
+        del audit
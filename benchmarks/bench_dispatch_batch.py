@@ -0,0 +1,57 @@
+"""
+Benchmark: dispatch_batch() vs a Python loop over dispatch().
+
+Run with: python -m benchmarks.bench_dispatch_batch [rows]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from src.dispatch_engine import dispatch, dispatch_batch
+
+
+def make_columns(n: int, seed: int = 0):
+    """Generate random incident columns in realistic ranges."""
+    rng = np.random.default_rng(seed)
+    weather = rng.uniform(0, 100, n)
+    harm = rng.choice([4.0, 10.0, 15.0, 30.0, 60.0], n)
+    ground = np.round(rng.uniform(1, 60, n), 1)
+    air = np.round(rng.uniform(1, 15, n), 1)
+    return weather, harm, ground, air
+
+
+def bench_loop(columns) -> float:
+    """Rows per second for a Python loop over dispatch()."""
+    rows = list(zip(*(c.tolist() for c in columns)))
+    start = time.perf_counter()
+    for row in rows:
+        dispatch(*row)
+    return len(rows) / (time.perf_counter() - start)
+
+
+def bench_batch(columns, repeats: int = 5) -> float:
+    """Best-of-N rows per second for dispatch_batch()."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        dispatch_batch(*columns)
+        best = min(best, time.perf_counter() - start)
+    return len(columns[0]) / best
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    loop_rows = min(n_rows, 200_000)
+    
+    print("=" * 80)
+    print("DISPATCH BATCH BENCHMARK")
+    print("=" * 80)
+    
+    loop_rate = bench_loop(make_columns(loop_rows))
+    batch_rate = bench_batch(make_columns(n_rows))
+    
+    print(f"  dispatch() loop   ({loop_rows:>9,} rows): {loop_rate:>14,.0f} rows/s")
+    print(f"  dispatch_batch()  ({n_rows:>9,} rows): {batch_rate:>14,.0f} rows/s")
+    print(f"  Speedup: {batch_rate / loop_rate:.1f}x")
@@ -0,0 +1,80 @@
+"""
+Benchmark: incremental re-dispatch vs re-dispatching every active incident.
+
+50k open incidents; each tick jitters the ground ETA and weather of a subset.
+
+Run with: python -m benchmarks.bench_dispatch_tracker
+"""
+
+import time
+
+import numpy as np
+
+from src.dispatch_engine import dispatch, dispatch_batch
+from src.dispatch_tracker import DispatchTracker
+from benchmarks.bench_fleet_allocator import surge_columns
+
+
+N_INCIDENTS = 50_000
+TICKS = 50
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("DISPATCH TRACKER BENCHMARK")
+    print("=" * 80)
+
+    rng = np.random.default_rng(0)
+    weather, harm, ground, air = (np.array(c) for c in surge_columns(N_INCIDENTS))
+    ids = list(range(N_INCIDENTS))
+
+    tracker = DispatchTracker()
+    start = time.perf_counter()
+    tracker.open_incidents(ids, weather, harm, ground, air)
+    print(f"\nOpened {N_INCIDENTS:,} incidents in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for per_tick in (1_000, 5_000, 50_000):
+        ticks = [
+            (rng.choice(N_INCIDENTS, per_tick, replace=False),
+             rng.normal(0, 0.5, per_tick), rng.normal(0, 1.0, per_tick))
+            for _ in range(TICKS)
+        ]
+
+        # Full re-dispatch: apply the tick, re-evaluate every incident and
+        # diff the rule codes against the previous tick.
+        w, g = weather.copy(), ground.copy()
+        previous = dispatch_batch(w, harm, g, air).rule_codes
+        start = time.perf_counter()
+        for rows, dw, dg in ticks:
+            w[rows] += dw
+            g[rows] += dg
+            current = dispatch_batch(w, harm, g, air).rule_codes
+            np.flatnonzero(current != previous)
+            previous = current
+        full_batch = (time.perf_counter() - start) / TICKS
+
+        # Incremental: only the updated rows, re-deciding boundary flips.
+        w, g = weather.copy(), ground.copy()
+        tracker = DispatchTracker()
+        tracker.open_incidents(ids, w, harm, g, air)
+        events = 0
+        start = time.perf_counter()
+        for rows, dw, dg in ticks:
+            w[rows] += dw
+            g[rows] += dg
+            events += len(tracker.update(rows.tolist(), weather_risk_pct=w[rows], ground_eta_min=g[rows]))
+        incremental = (time.perf_counter() - start) / TICKS
+
+        print(f"\n  {per_tick:>6,} updates/tick:")
+        print(f"    dispatch_batch() on all incidents: {full_batch * 1000:8.2f} ms/tick")
+        print(f"    DispatchTracker.update():           {incremental * 1000:8.2f} ms/tick "
+              f"({full_batch / incremental:.1f}x), {events / TICKS:,.0f} change events/tick, "
+              f"{tracker.rows_reevaluated / TICKS:,.0f} rows re-decided/tick")
+
+    sample = list(zip(weather[:5_000], harm[:5_000], ground[:5_000], air[:5_000]))
+    start = time.perf_counter()
+    for row in sample:
+        dispatch(*row)
+    per_call = (time.perf_counter() - start) / len(sample)
+    print(f"\n  Scalar dispatch() on all {N_INCIDENTS:,} incidents (extrapolated): "
+          f"{per_call * N_INCIDENTS * 1000:8.2f} ms/tick")
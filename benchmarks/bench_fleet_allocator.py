@@ -0,0 +1,38 @@
+"""
+Benchmark: fleet allocation for surge batches.
+
+Run with: python -m benchmarks.bench_fleet_allocator
+"""
+
+import time
+
+import numpy as np
+
+from src.fleet_allocator import allocate_fleet_columns
+
+
+def surge_columns(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(0, 60, n),
+        rng.choice([4.0, 6.0, 10.0, 15.0, 30.0], n),
+        np.round(rng.uniform(5, 45, n), 1),
+        np.round(rng.uniform(2, 10, n), 1),
+    )
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("FLEET ALLOCATOR BENCHMARK")
+    print("=" * 80)
+    
+    for n in (1_000, 10_000, 100_000, 1_000_000):
+        columns = surge_columns(n)
+        drones = max(3, n // 100)
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            allocation = allocate_fleet_columns(*columns, drones_available=drones)
+            best = min(best, time.perf_counter() - start)
+        print(f"  {n:>9,} incidents, {drones:>6,} drones: {best * 1000:8.2f} ms "
+              f"({allocation.fallback_count:,} fallbacks)")
@@ -0,0 +1,134 @@
+"""
+Benchmark suite: find_best_match() latency and memory across roster sizes.
+
+For every scenario and roster size (1e2 ... 1e6) a deterministic roster is
+generated with src.roster_generator, and then:
+  - peak memory (tracemalloc) of generating the roster, building its
+    indexes and serving one match;
+  - p50 / p95 / p99 of the payload's match_time_seconds over a fixed set of
+    patient locations (tracemalloc off).
+
+Results go to a JSON file so runs can be compared across commits.
+
+Run with: python -m benchmarks.bench_matcher_suite [--max-roster N] [--queries Q] [-o results.json]
+"""
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import replace
+
+import numpy as np
+
+from benchmarks.bench_medic_matcher import patients
+from src.medic_matcher import MedicMatcher
+from src.roster_generator import RosterSpec, generate_roster
+
+
+SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+SCENARIOS = {
+    # City-wide, even mixes, uniform workload.
+    "uniform": RosterSpec(n=0, seed=7),
+    # Medics gathered at stations and hospitals, busier roster, mostly lightly loaded.
+    "clustered": RosterSpec(
+        n=0,
+        seed=7,
+        clusters=12,
+        cluster_fraction=0.8,
+        cluster_spread_deg=0.008,
+        specialty_mix={"general": 4, "trauma": 2, "cardiac": 2, "respiratory": 1, "neuro": 1, "pediatric": 1},
+        status_mix={"available": 5, "on_mission": 4, "off_duty": 1},
+        load_alpha=2.0,
+        load_beta=5.0,
+    ),
+}
+
+DECISION = {"response_mode": "aerial_only"}
+CATEGORIES = ("cardiac", "trauma", "respiratory", "neuro", "pediatric", "general")
+
+
+def build_matcher(spec: RosterSpec) -> MedicMatcher:
+    matcher = MedicMatcher(traffic_hour=12)
+    matcher.db.medics = generate_roster(spec)
+    matcher.db.grid
+    matcher.db.roster
+    return matcher
+
+
+def run_case(spec: RosterSpec, queries: int) -> dict:
+    locations = patients(queries)
+    triages = [{"severity_level": 1 + i % 5, "category": CATEGORIES[i % len(CATEGORIES)]} for i in range(queries)]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    matcher = build_matcher(spec)
+    build_s = time.perf_counter() - start  # includes tracemalloc overhead
+    matcher.find_best_match(DECISION, triages[0], patient_location=locations[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times = np.array([
+        matcher.find_best_match(DECISION, t, patient_location=p)["match_time_seconds"]
+        for p, t in zip(locations, triages)
+    ])
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    return {
+        "roster_size": spec.n,
+        "queries": queries,
+        "build_s": round(build_s, 3),
+        "peak_memory_mb": round(peak / 1e6, 1),
+        "match_time_p50_ms": round(p50 * 1000, 3),
+        "match_time_p95_ms": round(p95 * 1000, 3),
+        "match_time_p99_ms": round(p99 * 1000, 3),
+        "match_time_max_ms": round(float(times.max()) * 1000, 3),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_matcher_suite",
+        description="Medic matcher latency percentiles and peak memory by roster size.",
+    )
+    parser.add_argument("--max-roster", type=int, default=SIZES[-1])
+    parser.add_argument("--queries", type=int, default=200, help="matches timed per roster")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="scenario to run (repeatable; default: all)")
+    parser.add_argument("-o", "--output", default="matcher_suite.json")
+    args = parser.parse_args(argv)
+
+    report = {
+        "benchmark": "matcher_suite",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": {},
+    }
+
+    print("=" * 80)
+    print("MEDIC MATCHER BENCHMARK SUITE: find_best_match latency and peak memory")
+    print("=" * 80)
+    for name in args.scenario or sorted(SCENARIOS):
+        print(f"\n{name}")
+        print(f"  {'medics':>9} | {'build':>8} | {'peak mem':>9} | {'p50':>9} | {'p95':>9} | {'p99':>9}")
+        rows = report["results"][name] = []
+        for n in SIZES:
+            if n > args.max_roster:
+                break
+            row = run_case(replace(SCENARIOS[name], n=n), args.queries)
+            rows.append(row)
+            print(f"  {n:>9,} | {row['build_s']:>7.2f}s | {row['peak_memory_mb']:>6.1f} MB | "
+                  f"{row['match_time_p50_ms']:>6.3f} ms | {row['match_time_p95_ms']:>6.3f} ms | "
+                  f"{row['match_time_p99_ms']:>6.3f} ms")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
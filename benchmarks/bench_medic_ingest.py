@@ -0,0 +1,100 @@
+"""
+Benchmark: medic GPS/status ingestion throughput and its effect on matching.
+
+Units drift a little on every report and occasionally change status. The
+benchmark measures sustained apply throughput with coalescing, then match
+latency with and without a background ingest stream.
+
+Run with: python -m benchmarks.bench_medic_ingest [roster_size]
+"""
+
+import random
+import sys
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.bench_medic_matcher import patients
+from src.medic_ingest import MedicUpdate, MedicUpdateIngestor
+from src.medic_matcher import MedicMatcher
+from src.roster_generator import RosterSpec, generate_roster
+
+
+DECISION = {"response_mode": "aerial_only"}
+TRIAGE = {"severity_level": 3, "category": "cardiac"}
+
+
+def report_stream(medics, n: int, active_units: int, seed: int = 0):
+    """n reports from the first active_units medics, ~5% with a status change."""
+    rng = random.Random(seed)
+    units = medics[:active_units]
+    for _ in range(n):
+        m = units[rng.randrange(len(units))]
+        lat, lon = m.gps_location
+        yield MedicUpdate(
+            m.id,
+            gps_location=(round(lat + rng.uniform(-5e-4, 5e-4), 6), round(lon + rng.uniform(-5e-4, 5e-4), 6)),
+            status=rng.choice(["available", "on_mission"]) if rng.random() < 0.05 else None,
+        )
+
+
+def match_latencies(matcher, queries):
+    out = []
+    for p in queries:
+        start = time.perf_counter()
+        matcher.find_best_match(DECISION, TRIAGE, patient_location=p)
+        out.append(time.perf_counter() - start)
+    return np.array(out) * 1000
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print("=" * 80)
+    print(f"MEDIC INGEST BENCHMARK: {n:,} medics")
+    print("=" * 80)
+
+    matcher = MedicMatcher(traffic_hour=12)
+    matcher.db.medics = generate_roster(RosterSpec(n=n))
+    matcher.db.grid
+    matcher.db.roster
+    medics = list(matcher.db.medics)
+
+    for window_reports, active in ((10_000, 2_000), (10_000, 10_000), (50_000, 50_000)):
+        ingest = MedicUpdateIngestor(matcher.db, window_s=3600)
+        stream = list(report_stream(medics, window_reports, active))
+        start = time.perf_counter()
+        ingest.submit_batch(stream)
+        applied = ingest.flush()
+        elapsed = time.perf_counter() - start
+        print(f"  {window_reports:>6,} reports from {active:>6,} units: {window_reports / elapsed:>9,.0f} reports/s  "
+              f"({applied:,} changes applied after coalescing)")
+
+    queries = patients(300)
+    idle = match_latencies(matcher, queries)
+
+    for rate in (2_000, 10_000):
+        ingest = MedicUpdateIngestor(matcher.db, window_s=0.1)
+        ingest.start()
+        stop = threading.Event()
+
+        def feed():
+            seed = 1
+            while not stop.is_set():
+                tick = time.perf_counter()
+                ingest.submit_batch(report_stream(medics, rate // 10, 20_000, seed))
+                seed += 1
+                time.sleep(max(0.0, 0.1 - (time.perf_counter() - tick)))
+
+        feeder = threading.Thread(target=feed)
+        feeder.start()
+        busy = match_latencies(matcher, queries)
+        stop.set()
+        feeder.join()
+        ingest.stop()
+
+        print(f"\n  match latency with {rate:,} reports/s ingesting (applied {ingest.applied:,}):")
+        for label, lat in (("idle", idle), ("ingesting", busy)):
+            print(f"    {label:9}  p50 {np.percentile(lat, 50):6.2f} ms  p95 {np.percentile(lat, 95):6.2f} ms  "
+                  f"p99 {np.percentile(lat, 99):6.2f} ms")
@@ -0,0 +1,57 @@
+"""
+Benchmark: medic candidate ranking, spatial grid and vectorized scan vs the
+per-medic Python scan.
+
+Run with: python -m benchmarks.bench_medic_matcher [max_roster]
+"""
+
+import random
+import sys
+import time
+
+from src.medic_matcher import MedicDatabase, MedicMatcher
+from src.roster_generator import RosterSpec, generate_roster
+
+
+def patients(n: int, seed: int = 1):
+    rng = random.Random(seed)
+    lat0, lon0 = MedicDatabase.RIYADH_CENTER
+    return [(lat0 + rng.uniform(-0.15, 0.15), lon0 + rng.uniform(-0.15, 0.15)) for _ in range(n)]
+
+
+def time_queries(rank, queries):
+    start = time.perf_counter()
+    results = [rank("cardiac", p, 3, "aerial")[:MedicMatcher.TOP_K] for p in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+if __name__ == "__main__":
+    max_roster = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print("=" * 80)
+    print("MEDIC MATCHER BENCHMARK: candidate ranking")
+    print("=" * 80)
+
+    matcher = MedicMatcher(traffic_hour=12)
+    for n in (15, 1_000, 10_000, 100_000, 1_000_000):
+        if n > max_roster:
+            break
+        matcher.db.medics = generate_roster(RosterSpec(n=n))
+
+        start = time.perf_counter()
+        matcher.db.grid
+        matcher.db.roster
+        build_ms = (time.perf_counter() - start) * 1000
+
+        queries = patients(200 if n <= 10_000 else 20 if n <= 100_000 else 3)
+        indexed_s, indexed = time_queries(matcher._rank_indexed, queries)
+        vector_s, vectorized = time_queries(matcher._rank_vectorized, queries)
+        scan_s, scanned = time_queries(matcher._rank_exhaustive, queries)
+        same = all(
+            [s["medic"].id for s in a] == [s["medic"].id for s in b] == [s["medic"].id for s in c]
+            for a, b, c in zip(indexed, vectorized, scanned)
+        )
+
+        print(f"  {n:>9,} medics: grid {indexed_s * 1000:7.2f} ms  vectorized {vector_s * 1000:7.2f} ms  "
+              f"python {scan_s * 1000:9.2f} ms  (grid {scan_s / indexed_s:6.1f}x)  "
+              f"build {build_ms:7.1f} ms  identical={same}")
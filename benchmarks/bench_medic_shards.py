@@ -0,0 +1,54 @@
+"""
+Benchmark: region-sharded matching throughput by worker count.
+
+Queries are submitted in batches through rank_many(), so every worker has
+work queued while the parent gathers. Throughput can only grow with workers
+up to the number of CPU cores available.
+
+Run with: python -m benchmarks.bench_medic_shards [roster_size] [max_workers]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.bench_medic_matcher import patients
+from src.medic_matcher import MedicMatcher
+from src.medic_shards import ShardedMedicMatcher
+from src.roster_generator import RosterSpec, generate_roster
+
+
+QUERIES = 2_000
+BATCH = 200
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    spec = RosterSpec(n=n, seed=3, clusters=12, cluster_fraction=0.6)
+    queries = [("cardiac", p, 3, "aerial") for p in patients(QUERIES)]
+
+    print("=" * 80)
+    print(f"SHARDED MATCHER BENCHMARK: {n:,} medics, {QUERIES:,} queries, {os.cpu_count()} CPU(s)")
+    print("=" * 80)
+
+    single = MedicMatcher(traffic_hour=12)
+    single.db.medics = generate_roster(spec)
+    single.db.grid
+    start = time.perf_counter()
+    expected = [[r["medic"].id for r in single._rank(*q)] for q in queries]
+    single_qps = QUERIES / (time.perf_counter() - start)
+    print(f"  single process       {single_qps:8,.0f} queries/s")
+
+    workers = 1
+    while workers <= max_workers:
+        with ShardedMedicMatcher(workers=workers, traffic_hour=12, medics=generate_roster(spec)) as sharded:
+            sharded.rank_many(queries[:BATCH])  # wait for the workers to finish loading
+            start = time.perf_counter()
+            got = []
+            for i in range(0, QUERIES, BATCH):
+                got += [[r["medic"].id for r in ranked] for ranked in sharded.rank_many(queries[i:i + BATCH])]
+            qps = QUERIES / (time.perf_counter() - start)
+        print(f"  {workers} worker(s)          {qps:8,.0f} queries/s  "
+              f"({qps / single_qps:.2f}x single)  identical: {got == expected}")
+        workers *= 2
@@ -0,0 +1,71 @@
+"""
+Benchmark: SQLite roster (WAL + R*Tree) vs the in-memory roster.
+
+Reports bulk load and open time for the file, then match latency through
+MedicMatcher on both backends for the same roster and patients.
+
+Run with: python -m benchmarks.bench_medic_store [roster_size]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_medic_matcher import patients
+from src.medic_matcher import MedicMatcher
+from src.medic_store import SQLiteMedicDatabase, bulk_load
+from src.roster_generator import RosterSpec, generate_roster
+
+
+DECISION = {"response_mode": "aerial_only"}
+TRIAGE = {"severity_level": 3, "category": "cardiac"}
+
+
+def time_matches(matcher, queries):
+    matcher.find_best_match(DECISION, TRIAGE, patient_location=queries[0])
+    start = time.perf_counter()
+    results = [matcher.find_best_match(DECISION, TRIAGE, patient_location=p) for p in queries]
+    return (time.perf_counter() - start) / len(queries), [r["assigned_medic"]["id"] for r in results]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print("=" * 80)
+    print(f"MEDIC STORE BENCHMARK: {n:,} medics")
+    print("=" * 80)
+
+    medics = generate_roster(RosterSpec(n=n))
+    queries = patients(200)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "roster.db")
+
+        start = time.perf_counter()
+        bulk_load(path, medics)
+        load_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        db = SQLiteMedicDatabase(path)
+        open_s = time.perf_counter() - start
+        size_mb = sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp)) / 1e6
+
+        stored_s, stored = time_matches(MedicMatcher(traffic_hour=12, db=db), queries)
+        memory = MedicMatcher(traffic_hour=12)
+        memory.db.medics = medics
+        memory_s, in_memory = time_matches(memory, queries)
+
+        start = time.perf_counter()
+        for m in medics[:1_000]:
+            db.update_status(m.id, m.status)
+        write_ms = (time.perf_counter() - start)
+
+        db.close()
+
+    print(f"  bulk load      {load_s:8.2f} s   ({n / load_s:,.0f} rows/s, {size_mb:.0f} MB on disk)")
+    print(f"  open + index   {open_s:8.2f} s")
+    print(f"  match (SQLite) {stored_s * 1000:8.2f} ms")
+    print(f"  match (memory) {memory_s * 1000:8.2f} ms")
+    print(f"  status write   {write_ms:8.2f} ms  (committed, per update)")
+    print(f"  identical assignments: {stored == in_memory}")
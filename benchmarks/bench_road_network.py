@@ -0,0 +1,50 @@
+"""
+Benchmark: road-graph ground ETAs on a synthetic city grid.
+
+Measures tree precomputation from hubs and the per-candidate cost of
+many-to-one queries, from hub trees and from the cached reverse tree.
+
+Run with: python -m benchmarks.bench_road_network [grid_side]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.bench_medic_matcher import patients
+from src.road_network import grid_network
+
+
+if __name__ == "__main__":
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    hour = 17
+
+    print("=" * 80)
+    print("ROAD NETWORK BENCHMARK: many-to-one ground ETA")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    net = grid_network(side, side, (24.55, 46.50), 0.36 / side)
+    print(f"  Graph: {len(net):,} nodes, {net.edge_count:,} edges, built in {time.perf_counter() - start:.2f}s")
+
+    rng = np.random.default_rng(0)
+    hubs = [(24.55 + rng.uniform(0, 0.36), 46.50 + rng.uniform(0, 0.36)) for _ in range(20)]
+    start = time.perf_counter()
+    net.precompute(hubs, hours=[hour])
+    print(f"  Precompute {len(hubs)} hub trees:   {time.perf_counter() - start:.2f}s")
+
+    medics = [(24.55 + rng.uniform(0, 0.36), 46.50 + rng.uniform(0, 0.36)) for _ in range(2_000)]
+    for name, origins in (("hub medics", hubs * 100), ("roaming medics", medics)):
+        queries = patients(10)
+        first = second = 0.0
+        for p in queries:
+            start = time.perf_counter()
+            net.travel_minutes(origins, p, hour)
+            first += time.perf_counter() - start
+            start = time.perf_counter()
+            net.travel_minutes(origins, p, hour)
+            second += time.perf_counter() - start
+        per = len(queries) * len(origins)
+        print(f"  {name:<16} first query {first / per * 1e6:7.2f} us/candidate, "
+              f"repeat {second / per * 1e6:5.2f} us/candidate")
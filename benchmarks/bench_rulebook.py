@@ -0,0 +1,100 @@
+"""
+Benchmark: compiled rulebook evaluator vs the hand-written if/elif chain.
+
+Run with: python -m benchmarks.bench_rulebook [calls]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+from src.dispatch_engine import (
+    EFFICIENCY_TIME_DELTA,
+    WEATHER_RISK_THRESHOLD,
+    DispatchResult,
+    builtin_rulebook,
+    dispatch,
+    dispatch_batch,
+)
+from benchmarks.bench_dispatch_batch import make_columns
+
+
+def handwritten_dispatch(weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min):
+    """The if/elif chain dispatch() used before rulebooks were compiled."""
+    time_delta = ground_eta_min - air_eta_min
+    exceeds_weather = weather_risk_pct > WEATHER_RISK_THRESHOLD
+    exceeds_harm = ground_eta_min > harm_threshold_min
+    exceeds_efficiency = time_delta > EFFICIENCY_TIME_DELTA
+    if exceeds_weather:
+        mode, rule, confidence = "AMBULANCE", "SAFETY_FILTER", 1.0
+    elif exceeds_harm:
+        mode, rule, confidence = "BOTH", "EMERGENCY_OVERRIDE", 0.98
+    elif exceeds_efficiency:
+        mode, rule, confidence = "BOTH", "EFFICIENCY_OPTIMIZATION", 0.90
+    else:
+        mode, rule, confidence = "AMBULANCE", "DEFAULT", 0.9
+    return DispatchResult(
+        mode, rule, weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min,
+        time_delta, exceeds_weather, exceeds_harm, exceeds_efficiency, confidence, 1,
+    )
+
+
+ROWS = [
+    (88.0, 4, 29.8, 3.6),
+    (14.0, 4, 29.8, 3.6),
+    (6.0, 30, 29.8, 3.6),
+    (2.0, 15, 10.1, 3.6),
+]
+
+
+def time_per_call(fns, calls: int, repeats: int = 15):
+    """
+    Best-of-N microseconds per decision for each function.
+    
+    Repeats are interleaved across functions so machine noise hits all of
+    them alike.
+    """
+    loops = max(1, calls // len(ROWS))
+    best = [float("inf")] * len(fns)
+    for _ in range(repeats):
+        for i, fn in enumerate(fns):
+            def run():
+                for row in ROWS:
+                    fn(*row)
+            best[i] = min(best[i], timeit.timeit(run, number=loops))
+    return [b / (loops * len(ROWS)) * 1e6 for b in best]
+
+
+def handwritten_batch(weather, harm, ground, air):
+    """Vectorized hand-written chain for the batch comparison."""
+    time_delta = ground - air
+    exceeds_weather = weather > WEATHER_RISK_THRESHOLD
+    exceeds_harm = ground > harm
+    exceeds_efficiency = time_delta > EFFICIENCY_TIME_DELTA
+    rule_codes = np.full(weather.shape, 3, dtype=np.uint8)
+    rule_codes[exceeds_efficiency] = 2
+    rule_codes[exceeds_harm] = 1
+    rule_codes[exceeds_weather] = 0
+    modes = np.array([1, 2, 2, 1], dtype=np.uint8)[rule_codes]
+    confidence = np.array([1.0, 0.98, 0.90, 0.9])[rule_codes]
+    return modes, rule_codes, confidence
+
+
+if __name__ == "__main__":
+    n_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    compiled = builtin_rulebook().evaluate
+    
+    print("=" * 80)
+    print("RULEBOOK EVALUATOR BENCHMARK")
+    print("=" * 80)
+    
+    labels = ("hand-written chain", "compiled evaluator", "dispatch() (active)")
+    timings = time_per_call((handwritten_dispatch, compiled, dispatch), n_calls)
+    for label, us in zip(labels, timings):
+        print(f"  {label:22} {us:6.3f} us/decision")
+    
+    columns = make_columns(1_000_000)
+    for label, fn in (("hand-written batch", handwritten_batch), ("dispatch_batch()", dispatch_batch)):
+        best = min(timeit.repeat(lambda: fn(*columns), number=1, repeat=5))
+        print(f"  {label:22} {best * 1000:6.1f} ms / 1M rows")
@@ -0,0 +1,60 @@
+"""
+Benchmark: landing zone queries, KD-tree index vs the linear haversine scans.
+
+Run with: python -m benchmarks.bench_zone_index [max_zones]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from src.landing_zone import find_nearest_zone, get_all_zones_sorted, get_zones_within_radius
+from src.zone_index import LandingZoneIndex
+
+
+def synthetic_zones(n: int, seed: int = 0):
+    """City-wide catalogue of n zones around Riyadh."""
+    rng = np.random.default_rng(seed)
+    return [
+        {"name": f"Zone {i}", "latitude": float(lat), "longitude": float(lon), "area": "20 x 20 m"}
+        for i, (lat, lon) in enumerate(zip(rng.uniform(24.45, 25.0, n), rng.uniform(46.4, 47.0, n)))
+    ]
+
+
+def per_query_us(fn, queries):
+    start = time.perf_counter()
+    results = [fn(lat, lon) for lat, lon in queries]
+    return (time.perf_counter() - start) / len(queries) * 1e6, results
+
+
+if __name__ == "__main__":
+    max_zones = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rng = np.random.default_rng(1)
+    queries = list(zip(rng.uniform(24.5, 24.95, 200).tolist(), rng.uniform(46.45, 46.95, 200).tolist()))
+
+    print("=" * 80)
+    print("LANDING ZONE INDEX BENCHMARK: per-query time (us)")
+    print("=" * 80)
+    print(f"  {'zones':>7} | {'build':>8} | {'nearest scan/index':>20} | {'k=5 scan/index':>20} | {'1 km scan/index':>20}")
+
+    for n in (8, 1_000, 10_000, 50_000):
+        if n > max_zones:
+            break
+        zones = synthetic_zones(n)
+        start = time.perf_counter()
+        index = LandingZoneIndex(zones)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        few = queries if n <= 1_000 else queries[:20]
+        rows = []
+        for scan, indexed in (
+            (lambda a, b: find_nearest_zone(zones, a, b), index.nearest),
+            (lambda a, b: get_all_zones_sorted(zones, a, b)[:5], lambda a, b: index.k_nearest(5, a, b)),
+            (lambda a, b: get_zones_within_radius(zones, 1.0, a, b), lambda a, b: index.within_radius(1.0, a, b)),
+        ):
+            scan_us, expected = per_query_us(scan, few)
+            index_us, got = per_query_us(indexed, few)
+            assert got == expected
+            rows.append(f"{scan_us:9,.0f} / {index_us:8,.0f}")
+        print(f"  {n:>7,} | {build_ms:>6.1f}ms | " + " | ".join(f"{r:>20}" for r in rows))
@@ -0,0 +1,58 @@
+"""
+Benchmark: patients x zones matrices, NumPy chunks vs the per-pair functions.
+
+The scalar baseline is timed on a sample of pairs and extrapolated.
+
+Run with: python -m benchmarks.bench_zone_matrix [patients] [zones]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.landing_zone import calculate_bearing, estimate_flight_time, haversine_distance
+from src.zone_matrix import nearest_zones, zone_matrices
+
+
+if __name__ == "__main__":
+    n_patients = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_zones = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    rng = np.random.default_rng(0)
+    p_lat, p_lon = rng.uniform(24.45, 25.0, n_patients), rng.uniform(46.4, 47.0, n_patients)
+    z_lat, z_lon = rng.uniform(24.45, 25.0, n_zones), rng.uniform(46.4, 47.0, n_zones)
+    pairs = n_patients * n_zones
+
+    print("=" * 80)
+    print(f"ZONE MATRIX BENCHMARK: {n_patients:,} patients x {n_zones:,} zones ({pairs:,} pairs)")
+    print("=" * 80)
+
+    sample = 20_000
+    start = time.perf_counter()
+    for i in range(sample):
+        a, b = i % n_patients, i % n_zones
+        d = haversine_distance(p_lat[a], p_lon[a], z_lat[b], z_lon[b])
+        calculate_bearing(p_lat[a], p_lon[a], z_lat[b], z_lon[b])
+        estimate_flight_time(d)
+    scalar_s = (time.perf_counter() - start) / sample * pairs
+    print(f"  Per-pair functions (extrapolated): {scalar_s:10.1f}s")
+
+    if pairs * 3 * 4 <= 4e9:
+        tracemalloc.start()
+        start = time.perf_counter()
+        zone_matrices(p_lat, p_lon, z_lat, z_lon, dtype=np.float32)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  zone_matrices (float32 output):     {elapsed:10.2f}s  peak {peak / 1e6:,.0f} MB "
+              f"(outputs {pairs * 3 * 4 / 1e6:,.0f} MB)")
+
+    for k in (1, 5):
+        tracemalloc.start()
+        start = time.perf_counter()
+        nearest_zones(p_lat, p_lon, z_lat, z_lon, k=k)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  nearest_zones k={k}:                  {elapsed:10.2f}s  peak {peak / 1e6:,.0f} MB")
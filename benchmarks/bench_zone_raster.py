@@ -0,0 +1,60 @@
+"""
+Benchmark: nearest-zone lookups, precomputed raster vs KD-tree index vs scan.
+
+Run with: python -m benchmarks.bench_zone_raster [max_zones]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.bench_zone_index import per_query_us, synthetic_zones
+from src.landing_zone import find_nearest_zone
+from src.zone_index import LandingZoneIndex
+from src.zone_raster import NearestZoneRaster
+
+
+CITY_BOUNDS = {"lat_min": 24.45, "lat_max": 25.0, "lon_min": 46.4, "lon_max": 47.0}
+QUERIES = 100_000
+
+
+if __name__ == "__main__":
+    max_zones = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rng = np.random.default_rng(1)
+    lat, lon = rng.uniform(24.45, 25.0, QUERIES), rng.uniform(46.4, 47.0, QUERIES)
+    queries = list(zip(lat.tolist(), lon.tolist()))
+
+    print("=" * 80)
+    print("NEAREST-ZONE RASTER BENCHMARK: per-query time (us)")
+    print("=" * 80)
+    print(f"  {'zones':>7} | {'build':>7} | {'load':>7} | {'ambiguous':>9} | {'scan':>8} | "
+          f"{'index':>8} | {'raster':>8} | {'batch':>6}")
+
+    for n in (8, 1_000, 20_000):
+        if n > max_zones:
+            break
+        zones = synthetic_zones(n)
+        index = LandingZoneIndex(zones)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "raster.npz")
+            start = time.perf_counter()
+            raster = NearestZoneRaster.load_or_build(path, index, CITY_BOUNDS)
+            build_s = time.perf_counter() - start
+            start = time.perf_counter()
+            raster = NearestZoneRaster.load_or_build(path, index, CITY_BOUNDS)
+            load_s = time.perf_counter() - start
+
+        few = queries[:200 if n <= 1_000 else 20]
+        scan_us, expected = per_query_us(lambda a, b: find_nearest_zone(zones, a, b), few)
+        index_us, _ = per_query_us(index.nearest, queries[:2_000])
+        raster_us, got = per_query_us(raster.nearest_index, queries)
+        assert [zones[i]["name"] for i in got[:len(few)]] == [z.name for z in expected]
+        start = time.perf_counter()
+        assert raster.nearest_indexes(lat, lon).tolist() == got
+        batch_us = (time.perf_counter() - start) / QUERIES * 1e6
+
+        print(f"  {n:>7,} | {build_s:>6.1f}s | {load_s:>6.2f}s | {raster.ambiguous_fraction:>9.1%} | "
+              f"{scan_us:>8,.0f} | {index_us:>8,.1f} | {raster_us:>8,.2f} | {batch_us:>6.2f}")
@@ -0,0 +1,322 @@
+"""
+Audit Log Module
+Compact, append-only binary log of dispatch decisions.
+
+Each decision is one fixed-width 52-byte little-endian record:
+
+    timestamp           float64  seconds since the epoch
+    weather_risk_pct    float64
+    harm_threshold_min  float64
+    ground_eta_min      float64
+    air_eta_min         float64
+    mode_code           uint8    index into RESPONSE_MODE_CODES
+    rule_code           uint8    index into RULE_CODES
+    flags               uint8    exceeds_weather | exceeds_harm << 1 | exceeds_efficiency << 2
+    reserved            uint8
+    confidence          float32
+    rulebook_version    uint32
+
+after a 16-byte file header (magic, format version, record size). Because
+records are fixed-width, AuditLog memory-maps the file as a NumPy structured
+array: a year of decisions is scanned column-wise without parsing anything.
+"""
+
+import logging
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from .dispatch_engine import (
+    RESPONSE_MODE_CODES,
+    RULE_CODES,
+    DispatchBatchResult,
+    DispatchResult,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+MAGIC = b"SAHMAUDT"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<8sHH4x")
+RECORD = struct.Struct("<5d4BfI")
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("weather_risk_pct", "<f8"),
+    ("harm_threshold_min", "<f8"),
+    ("ground_eta_min", "<f8"),
+    ("air_eta_min", "<f8"),
+    ("mode_code", "u1"),
+    ("rule_code", "u1"),
+    ("flags", "u1"),
+    ("reserved", "u1"),
+    ("confidence", "<f4"),
+    ("rulebook_version", "<u4"),
+])
+assert RECORD_DTYPE.itemsize == RECORD.size
+
+FLAG_WEATHER = 1
+FLAG_HARM = 2
+FLAG_EFFICIENCY = 4
+
+_MODE_INDEX = {mode: i for i, mode in enumerate(RESPONSE_MODE_CODES)}
+_RULE_INDEX = {rule: i for i, rule in enumerate(RULE_CODES)}
+
+PathLike = Union[str, os.PathLike]
+
+
+def _check_header(data: bytes, path: PathLike) -> None:
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is too short for an audit log header ({len(data)} bytes)")
+    magic, version, record_size = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a dispatch audit log")
+    if version != FORMAT_VERSION or record_size != RECORD.size:
+        raise ValueError(
+            f"{path} has audit log format v{version} with {record_size}-byte records; "
+            f"expected v{FORMAT_VERSION} with {RECORD.size}-byte records"
+        )
+
+
+class AuditLogWriter:
+    """
+    Appends dispatch decisions to an audit log file.
+
+    Opening an existing log validates its header and drops a trailing
+    partial record left by a crash, so appends stay record-aligned. Appends
+    are serialized with a lock and may be called from several threads.
+
+    Examples:
+        >>> with AuditLogWriter("decisions.audit") as log:  # doctest: +SKIP
+        ...     log.append(dispatch(14.0, 4, 29.8, 3.6))
+    """
+
+    def __init__(self, path: PathLike, flush_every: int = 0):
+        """
+        Args:
+            path: Log file (created with a header if missing or empty)
+            flush_every: Flush to the OS after this many records (0 = only
+                on flush()/close() and when the write buffer fills)
+        """
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if size:
+            with open(self.path, "rb") as f:
+                _check_header(f.read(HEADER.size), self.path)
+            torn = (size - HEADER.size) % RECORD.size
+            if torn:
+                logger.warning(f"Dropping {torn} bytes of a partial record at the end of {self.path}")
+                os.truncate(self.path, size - torn)
+
+        self._file = open(self.path, "ab")
+        if not size:
+            self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size))
+
+    def __enter__(self) -> "AuditLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append(self, result: DispatchResult, timestamp: Optional[float] = None) -> None:
+        """
+        Append one decision.
+
+        Args:
+            result: DispatchResult from dispatch()
+            timestamp: Decision time (default: time.time())
+        """
+        record = RECORD.pack(
+            time.time() if timestamp is None else timestamp,
+            result.weather_risk_pct,
+            result.harm_threshold_min,
+            result.ground_eta_min,
+            result.air_eta_min,
+            _MODE_INDEX[result.response_mode],
+            _RULE_INDEX[result.rule_triggered],
+            result.exceeds_weather | result.exceeds_harm << 1 | result.exceeds_efficiency << 2,
+            0,
+            result.confidence,
+            result.rulebook_version,
+        )
+        with self._lock:
+            self._file.write(record)
+            self._after_write(1)
+
+    def append_batch(
+        self,
+        batch: DispatchBatchResult,
+        weather_risk_pct,
+        harm_threshold_min,
+        ground_eta_min,
+        air_eta_min,
+        timestamps=None,
+    ) -> None:
+        """
+        Append every row of a dispatch_batch() result.
+
+        Args:
+            batch: Result of dispatch_batch() on the given columns
+            weather_risk_pct: Input column (array-like or scalar)
+            harm_threshold_min: Input column
+            ground_eta_min: Input column
+            air_eta_min: Input column
+            timestamps: Per-row or single timestamp (default: time.time())
+        """
+        n = len(batch)
+        records = np.empty(n, dtype=RECORD_DTYPE)
+        records["timestamp"] = time.time() if timestamps is None else timestamps
+        records["weather_risk_pct"] = weather_risk_pct
+        records["harm_threshold_min"] = harm_threshold_min
+        records["ground_eta_min"] = ground_eta_min
+        records["air_eta_min"] = air_eta_min
+        records["mode_code"] = batch.mode_codes
+        records["rule_code"] = batch.rule_codes
+        records["flags"] = (
+            batch.exceeds_weather * FLAG_WEATHER
+            | batch.exceeds_harm * FLAG_HARM
+            | batch.exceeds_efficiency * FLAG_EFFICIENCY
+        )
+        records["reserved"] = 0
+        records["confidence"] = batch.confidence
+        records["rulebook_version"] = batch.rulebook_version
+        with self._lock:
+            self._file.write(records.tobytes())
+            self._after_write(n)
+
+    def _after_write(self, n: int) -> None:
+        self._pending += n
+        if self.flush_every and self._pending >= self.flush_every:
+            self._file.flush()
+            self._pending = 0
+
+    def flush(self, fsync: bool = False) -> None:
+        """Flush buffered records; with fsync=True also force them to disk."""
+        with self._lock:
+            self._file.flush()
+            self._pending = 0
+            if fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class AuditLog:
+    """
+    Read-only, memory-mapped view of an audit log.
+
+    Columns are NumPy views into the mapped file, so opening is O(1) and
+    queries touch only the pages of the columns they read. Records appended
+    after opening are not visible; open the log again to see them. A
+    trailing partial record (crash during a write) is ignored.
+
+    Attributes:
+        path: Log file
+        records: Structured array with RECORD_DTYPE fields
+    """
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        size = self.path.stat().st_size
+        with open(self.path, "rb") as f:
+            _check_header(f.read(HEADER.size), self.path)
+
+        n = (size - HEADER.size) // RECORD.size
+        if n:
+            self.records = np.memmap(self.path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(n,))
+        else:
+            self.records = np.empty(0, dtype=RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Column by field name, e.g. log["ground_eta_min"]."""
+        return self.records[name]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.records["timestamp"]
+
+    @property
+    def mode_codes(self) -> np.ndarray:
+        return self.records["mode_code"]
+
+    @property
+    def rule_codes(self) -> np.ndarray:
+        return self.records["rule_code"]
+
+    @property
+    def exceeds_weather(self) -> np.ndarray:
+        return (self.records["flags"] & FLAG_WEATHER).astype(bool)
+
+    @property
+    def exceeds_harm(self) -> np.ndarray:
+        return (self.records["flags"] & FLAG_HARM).astype(bool)
+
+    @property
+    def exceeds_efficiency(self) -> np.ndarray:
+        return (self.records["flags"] & FLAG_EFFICIENCY).astype(bool)
+
+    def between(self, start: Optional[float] = None, end: Optional[float] = None) -> np.ndarray:
+        """Boolean mask of records with start <= timestamp < end."""
+        ts = self.timestamps
+        mask = np.ones(len(ts), dtype=bool)
+        if start is not None:
+            mask &= ts >= start
+        if end is not None:
+            mask &= ts < end
+        return mask
+
+    def mode_counts(self, mask: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """Decisions per response mode (optionally within a mask)."""
+        codes = self.mode_codes if mask is None else self.mode_codes[mask]
+        counts = np.bincount(codes, minlength=len(RESPONSE_MODE_CODES))
+        return {mode: int(counts[i]) for i, mode in enumerate(RESPONSE_MODE_CODES)}
+
+    def rule_counts(self, mask: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """Decisions per triggered rule (optionally within a mask)."""
+        codes = self.rule_codes if mask is None else self.rule_codes[mask]
+        counts = np.bincount(codes, minlength=len(RULE_CODES))
+        return {rule: int(counts[i]) for i, rule in enumerate(RULE_CODES)}
+
+    def decision(self, index: int) -> DispatchResult:
+        """Rebuild the DispatchResult stored at a record index."""
+        r = self.records[index]
+        ground, air = float(r["ground_eta_min"]), float(r["air_eta_min"])
+        flags = int(r["flags"])
+        return DispatchResult(
+            response_mode=RESPONSE_MODE_CODES[r["mode_code"]],
+            rule_triggered=RULE_CODES[r["rule_code"]],
+            weather_risk_pct=float(r["weather_risk_pct"]),
+            harm_threshold_min=float(r["harm_threshold_min"]),
+            ground_eta_min=ground,
+            air_eta_min=air,
+            time_delta_min=ground - air,
+            exceeds_weather=bool(flags & FLAG_WEATHER),
+            exceeds_harm=bool(flags & FLAG_HARM),
+            exceeds_efficiency=bool(flags & FLAG_EFFICIENCY),
+            # Stored as float32; rule confidences have at most a few decimals.
+            confidence=round(float(r["confidence"]), 6),
+            rulebook_version=int(r["rulebook_version"]),
+        )
+
+
+def read_audit_log(path: PathLike) -> AuditLog:
+    """Open an audit log for column-wise queries."""
+    return AuditLog(path)
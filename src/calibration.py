@@ -0,0 +1,296 @@
+"""
+Threshold Calibration Module
+Grid search of dispatch thresholds against labelled datasets.
+
+validator.py checks the active thresholds; this module answers "what if the
+weather cut-off were 30% instead of 35%?" for thousands of (weather threshold,
+efficiency delta) pairs at once. Every pair is evaluated with NumPy
+broadcasting over a (thresholds x deltas x rows) cube, walking the active
+rulebook's rule order, so a full grid over scenarios.json and
+cases_send_decision.json takes milliseconds.
+
+Labels follow the validator: any aerial mode counts as DOCTOR_DRONE.
+
+Run with: python -m src.calibration
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .data_loader import load_cases, load_scenarios
+from .dispatch_engine import Rulebook, get_rulebook, is_air_response_mode
+
+
+DEFAULT_WEATHER_THRESHOLDS = np.arange(0.0, 100.0 + 1e-9, 0.5)
+DEFAULT_EFFICIENCY_DELTAS = np.arange(0.0, 30.0 + 1e-9, 0.25)
+
+# Upper bound on booleans materialized per chunk of rows.
+MAX_CUBE_CELLS = 16_000_000
+
+
+@dataclass
+class CalibrationPoint:
+    """
+    Agreement of one threshold setting with the labels.
+
+    Positive class is DOCTOR_DRONE (aerial response).
+
+    Attributes:
+        weather_threshold: SAFETY_FILTER threshold (%)
+        efficiency_delta: EFFICIENCY_OPTIMIZATION threshold (minutes)
+        agreement: Fraction of rows whose decision matches the label
+        true_positive: Drone expected and dispatched
+        false_negative: Drone expected, ambulance dispatched
+        false_positive: Ambulance expected, drone dispatched
+        true_negative: Ambulance expected and dispatched
+    """
+    weather_threshold: float
+    efficiency_delta: float
+    agreement: float
+    true_positive: int
+    false_negative: int
+    false_positive: int
+    true_negative: int
+
+    @property
+    def confusion_matrix(self) -> List[List[int]]:
+        """[[TP, FN], [FP, TN]] with rows = expected, columns = predicted."""
+        return [
+            [self.true_positive, self.false_negative],
+            [self.false_positive, self.true_negative],
+        ]
+
+
+@dataclass
+class CalibrationReport:
+    """
+    Result of a threshold grid search.
+
+    Attributes:
+        weather_thresholds: Grid axis 0
+        efficiency_deltas: Grid axis 1
+        confusion: Counts per setting, shape (T, D, 4) as TP, FN, FP, TN
+        n_rows: Number of labelled rows
+        baseline: Metrics for the rulebook's own thresholds
+        rulebook_version: Rulebook whose rule order was used
+    """
+    weather_thresholds: np.ndarray
+    efficiency_deltas: np.ndarray
+    confusion: np.ndarray
+    n_rows: int
+    baseline: CalibrationPoint
+    rulebook_version: int = 0
+
+    @property
+    def agreement(self) -> np.ndarray:
+        """Agreement per setting, shape (T, D)."""
+        correct = self.confusion[..., 0] + self.confusion[..., 3]
+        return correct / self.n_rows if self.n_rows else np.zeros(correct.shape)
+
+    def point(self, i: int, j: int) -> CalibrationPoint:
+        """Metrics for grid cell (i, j)."""
+        tp, fn, fp, tn = (int(v) for v in self.confusion[i, j])
+        return CalibrationPoint(
+            weather_threshold=float(self.weather_thresholds[i]),
+            efficiency_delta=float(self.efficiency_deltas[j]),
+            agreement=float(self.agreement[i, j]),
+            true_positive=tp,
+            false_negative=fn,
+            false_positive=fp,
+            true_negative=tn,
+        )
+
+    def _closest_to_baseline(self, cells: np.ndarray) -> CalibrationPoint:
+        """Among (i, j) cells, pick the one nearest the baseline thresholds."""
+        w_span = max(np.ptp(self.weather_thresholds), 1e-9)
+        d_span = max(np.ptp(self.efficiency_deltas), 1e-9)
+        dist = (
+            ((self.weather_thresholds[cells[:, 0]] - self.baseline.weather_threshold) / w_span) ** 2 +
+            ((self.efficiency_deltas[cells[:, 1]] - self.baseline.efficiency_delta) / d_span) ** 2
+        )
+        i, j = cells[int(np.argmin(dist))]
+        return self.point(int(i), int(j))
+
+    def best(self) -> CalibrationPoint:
+        """Highest-agreement setting, ties broken by distance to the baseline."""
+        agreement = self.agreement
+        return self._closest_to_baseline(np.argwhere(agreement == agreement.max()))
+
+    def pareto_front(self) -> List[CalibrationPoint]:
+        """
+        Non-dominated settings when minimizing false negatives and false positives.
+
+        One representative (closest to the baseline) is returned per distinct
+        (FN, FP) pair, ordered by increasing false negatives.
+        """
+        fn = self.confusion[..., 1].ravel()
+        fp = self.confusion[..., 2].ravel()
+        order = np.lexsort((fp, fn))
+
+        front = []
+        best_fp = np.inf
+        for flat in order:
+            if fp[flat] < best_fp:
+                best_fp = fp[flat]
+                front.append((fn[flat], fp[flat]))
+
+        points = []
+        for f_n, f_p in front:
+            cells = np.argwhere((self.confusion[..., 1] == f_n) & (self.confusion[..., 2] == f_p))
+            points.append(self._closest_to_baseline(cells))
+        return points
+
+
+def load_labelled_rows() -> List[Dict[str, Any]]:
+    """Normalized rows from scenarios.json and cases_send_decision.json."""
+    return load_scenarios() + load_cases()
+
+
+def calibrate_thresholds(
+    rows: Optional[Sequence[Dict[str, Any]]] = None,
+    weather_thresholds: Optional[Sequence[float]] = None,
+    efficiency_deltas: Optional[Sequence[float]] = None,
+    rulebook: Optional[Rulebook] = None,
+) -> CalibrationReport:
+    """
+    Evaluate a grid of (weather threshold, efficiency delta) settings.
+
+    Rule order, modes and any rules the rulebook omits come from the
+    rulebook; only the two thresholds vary. Rows are processed in chunks so
+    the boolean cube stays under MAX_CUBE_CELLS.
+
+    Args:
+        rows: Dicts with weather_risk_pct, harm_threshold_min, ground_eta_min,
+            air_eta_min and expected_decision (default: all labelled datasets)
+        weather_thresholds: Weather thresholds to try (%)
+        efficiency_deltas: Efficiency deltas to try (minutes)
+        rulebook: Rulebook providing rule order (default: the active rulebook)
+
+    Returns:
+        CalibrationReport
+
+    Examples:
+        >>> report = calibrate_thresholds(weather_thresholds=[30, 35], efficiency_deltas=[10])
+        >>> report.confusion.shape
+        (2, 1, 4)
+    """
+    rulebook = rulebook if rulebook is not None else get_rulebook()
+    rows = list(rows) if rows is not None else load_labelled_rows()
+    thresholds = np.asarray(
+        DEFAULT_WEATHER_THRESHOLDS if weather_thresholds is None else weather_thresholds, dtype=np.float64
+    )
+    deltas = np.asarray(
+        DEFAULT_EFFICIENCY_DELTAS if efficiency_deltas is None else efficiency_deltas, dtype=np.float64
+    )
+
+    weather = np.array([r["weather_risk_pct"] for r in rows], dtype=np.float64)
+    harm = np.array([r["harm_threshold_min"] for r in rows], dtype=np.float64)
+    ground = np.array([r["ground_eta_min"] for r in rows], dtype=np.float64)
+    air = np.array([r["air_eta_min"] for r in rows], dtype=np.float64)
+    expected_air = np.array([is_air_response_mode(r["expected_decision"]) for r in rows], dtype=bool)
+
+    confusion = np.zeros((len(thresholds), len(deltas), 4), dtype=np.int64)
+    chunk = max(1, MAX_CUBE_CELLS // max(1, len(thresholds) * len(deltas)))
+
+    for start in range(0, len(rows), chunk):
+        sl = slice(start, start + chunk)
+        predicted_air = _predict_air(
+            rulebook, thresholds, deltas, weather[sl], harm[sl], ground[sl], air[sl]
+        )
+        confusion += _confusion_counts(predicted_air, expected_air[sl])
+
+    baseline_confusion = _confusion_counts(
+        _predict_air(
+            rulebook,
+            np.array([rulebook.weather_threshold]),
+            np.array([rulebook.efficiency_threshold]),
+            weather, harm, ground, air,
+        )[0, 0],
+        expected_air,
+    )
+    n_rows = len(rows)
+    baseline = CalibrationPoint(
+        weather_threshold=rulebook.weather_threshold,
+        efficiency_delta=rulebook.efficiency_threshold,
+        agreement=float(baseline_confusion[0] + baseline_confusion[3]) / n_rows if n_rows else 0.0,
+        true_positive=int(baseline_confusion[0]),
+        false_negative=int(baseline_confusion[1]),
+        false_positive=int(baseline_confusion[2]),
+        true_negative=int(baseline_confusion[3]),
+    )
+
+    return CalibrationReport(
+        weather_thresholds=thresholds,
+        efficiency_deltas=deltas,
+        confusion=confusion,
+        n_rows=n_rows,
+        baseline=baseline,
+        rulebook_version=rulebook.version,
+    )
+
+
+def _predict_air(
+    rulebook: Rulebook,
+    thresholds: np.ndarray,
+    deltas: np.ndarray,
+    weather: np.ndarray,
+    harm: np.ndarray,
+    ground: np.ndarray,
+    air: np.ndarray,
+) -> np.ndarray:
+    """Aerial-dispatch predictions with shape (T, D, N) for every setting."""
+    shape = (len(thresholds), len(deltas), len(weather))
+    conditions = {
+        "SAFETY_FILTER": weather[None, None, :] > thresholds[:, None, None],
+        "EMERGENCY_OVERRIDE": (ground > harm)[None, None, :],
+        "EFFICIENCY_OPTIMIZATION": (ground - air)[None, None, :] > deltas[None, :, None],
+    }
+
+    decided = np.zeros(shape, dtype=bool)
+    predicted_air = np.zeros(shape, dtype=bool)
+    for spec in rulebook.rules:
+        if spec.rule == "DEFAULT":
+            if is_air_response_mode(spec.response_mode):
+                predicted_air |= ~decided
+            break
+        fires = conditions[spec.rule] & ~decided
+        if is_air_response_mode(spec.response_mode):
+            predicted_air |= fires
+        decided |= fires
+    return predicted_air
+
+
+def _confusion_counts(predicted_air: np.ndarray, expected_air: np.ndarray) -> np.ndarray:
+    """TP, FN, FP, TN counts over the last axis, stacked on a new last axis."""
+    return np.stack([
+        np.count_nonzero(predicted_air & expected_air, axis=-1),
+        np.count_nonzero(~predicted_air & expected_air, axis=-1),
+        np.count_nonzero(predicted_air & ~expected_air, axis=-1),
+        np.count_nonzero(~predicted_air & ~expected_air, axis=-1),
+    ], axis=-1)
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("SAHM DISPATCH THRESHOLD CALIBRATION")
+    print("=" * 80)
+
+    report = calibrate_thresholds()
+    cells = report.confusion.shape[0] * report.confusion.shape[1]
+    print(f"\nEvaluated {cells:,} settings against {report.n_rows} labelled rows "
+          f"(rulebook v{report.rulebook_version})")
+
+    def show(label: str, p: CalibrationPoint) -> None:
+        print(f"  {label:10} weather>{p.weather_threshold:5.1f}%  delta>{p.efficiency_delta:5.2f} min  "
+              f"agreement {p.agreement:6.1%}  TP={p.true_positive} FN={p.false_negative} "
+              f"FP={p.false_positive} TN={p.true_negative}")
+
+    print()
+    show("Baseline", report.baseline)
+    show("Best", report.best())
+
+    print("\nPareto front (min false negatives vs false positives):")
+    for point in report.pareto_front():
+        show("", point)
@@ -0,0 +1,326 @@
+"""
+Decision Surface Module
+Analytic what-if maps of the dispatch rules in (ground ETA, air ETA) space.
+
+For a fixed weather risk and harm threshold every D1.md rule is either a
+constant (the weather safety filter) or a half-plane in the ETA plane:
+
+- EMERGENCY_OVERRIDE:      ground > harm_threshold
+- EFFICIENCY_OPTIMIZATION: ground - air > efficiency threshold
+
+Each rule's region is its own condition intersected with the negation of
+every higher-priority condition (in rulebook order), so regions are convex
+polygons that can be built exactly from the rulebook thresholds instead of
+by sampling.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .dispatch_engine import Rulebook, dispatch_batch, get_rulebook
+
+
+DEFAULT_GROUND_RANGE = (0.0, 60.0)
+DEFAULT_AIR_RANGE = (0.0, 30.0)
+
+
+Point = Tuple[float, float]
+
+
+@dataclass(frozen=True)
+class HalfPlane:
+    """
+    Linear constraint on (ground_eta, air_eta).
+
+    Represents ground_coef * ground + air_coef * air > bound (strict) or
+    ground_coef * ground + air_coef * air <= bound (non-strict).
+
+    Attributes:
+        ground_coef: Coefficient of ground ETA
+        air_coef: Coefficient of air ETA
+        bound: Right-hand side
+        strict: True for '>', False for '<=' (the negation of a rule)
+    """
+    ground_coef: float
+    air_coef: float
+    bound: float
+    strict: bool = True
+
+    def negate(self) -> "HalfPlane":
+        """Return the complementary half-plane."""
+        return HalfPlane(self.ground_coef, self.air_coef, self.bound, not self.strict)
+
+    def value(self, ground, air):
+        """Evaluate the linear form (scalar or array)."""
+        return self.ground_coef * ground + self.air_coef * air
+
+    def contains(self, ground, air):
+        """Vectorized membership test matching the engine's comparisons."""
+        lhs = self.value(ground, air)
+        return lhs > self.bound if self.strict else lhs <= self.bound
+
+    def describe(self) -> str:
+        """Readable inequality, e.g. 'ground - air > 10.0'."""
+        terms = []
+        for coef, name in ((self.ground_coef, "ground"), (self.air_coef, "air")):
+            if coef == 0:
+                continue
+            if not terms:
+                terms.append(name if coef == 1 else f"-{name}" if coef == -1 else f"{coef:g}*{name}")
+            else:
+                sign = "+" if coef > 0 else "-"
+                mag = abs(coef)
+                terms.append(f"{sign} {name}" if mag == 1 else f"{sign} {mag:g}*{name}")
+        op = ">" if self.strict else "<="
+        return f"{' '.join(terms)} {op} {self.bound}"
+
+
+@dataclass
+class DecisionRegion:
+    """
+    Region of the ETA plane where one rule fires.
+
+    Attributes:
+        rule: Rule that fires inside the region
+        response_mode: Mode produced by that rule
+        constraints: Half-planes whose intersection is the region
+        polygon: Region vertices clipped to the surface bounds (counter-clockwise)
+        empty: True when the rule can never fire for these inputs
+    """
+    rule: str
+    response_mode: str
+    constraints: List[HalfPlane] = field(default_factory=list)
+    polygon: List[Point] = field(default_factory=list)
+    empty: bool = False
+
+    @property
+    def area(self) -> float:
+        """Area of the clipped polygon (min^2)."""
+        return _polygon_area(self.polygon)
+
+    def contains(self, ground, air):
+        """Vectorized membership test for ETA points."""
+        ground = np.asarray(ground, dtype=np.float64)
+        air = np.asarray(air, dtype=np.float64)
+        inside = np.full(np.broadcast(ground, air).shape, not self.empty)
+        for constraint in self.constraints:
+            inside &= constraint.contains(ground, air)
+        return inside
+
+
+@dataclass
+class DecisionSurface:
+    """
+    Exact decision regions for fixed weather risk and harm threshold.
+
+    Attributes:
+        weather_risk_pct: Fixed weather risk input
+        harm_threshold_min: Fixed harm threshold input
+        ground_range: (min, max) ground ETA covered by the polygons
+        air_range: (min, max) air ETA covered by the polygons
+        regions: Rule name -> DecisionRegion, in rule priority order
+        rulebook_version: Version of the rulebook the regions describe
+    """
+    weather_risk_pct: float
+    harm_threshold_min: float
+    ground_range: Tuple[float, float]
+    air_range: Tuple[float, float]
+    regions: Dict[str, DecisionRegion]
+    rulebook_version: int = 0
+
+    def boundaries(self) -> List[HalfPlane]:
+        """Distinct lines separating non-empty regions."""
+        lines = []
+        for region in self.regions.values():
+            if region.empty:
+                continue
+            for c in region.constraints:
+                line = HalfPlane(c.ground_coef, c.air_coef, c.bound)
+                if line not in lines:
+                    lines.append(line)
+        return lines
+
+    def rule_at(self, ground_eta_min: float, air_eta_min: float) -> str:
+        """Look up the rule for a single ETA point from the analytic regions."""
+        for rule, region in self.regions.items():
+            if not region.empty and bool(region.contains(ground_eta_min, air_eta_min)):
+                return rule
+        return "DEFAULT"
+
+
+def _rule_conditions(
+    weather_risk_pct: float,
+    harm_threshold_min: float,
+    rulebook: Rulebook,
+) -> List[Tuple[str, Union[bool, HalfPlane]]]:
+    """
+    Rule conditions in rulebook order for fixed weather/harm inputs.
+
+    Constant conditions are returned as bools, ETA-dependent ones as
+    half-planes; DEFAULT is always True.
+    """
+    conditions: List[Tuple[str, Union[bool, HalfPlane]]] = []
+    for spec in rulebook.rules:
+        if spec.rule == "SAFETY_FILTER":
+            conditions.append((spec.rule, bool(weather_risk_pct > spec.threshold)))
+        elif spec.rule == "EMERGENCY_OVERRIDE":
+            conditions.append((spec.rule, HalfPlane(1.0, 0.0, float(harm_threshold_min))))
+        elif spec.rule == "EFFICIENCY_OPTIMIZATION":
+            conditions.append((spec.rule, HalfPlane(1.0, -1.0, float(spec.threshold))))
+        else:
+            conditions.append((spec.rule, True))
+    return conditions
+
+
+def _clip_polygon(polygon: List[Point], plane: HalfPlane) -> List[Point]:
+    """Sutherland-Hodgman clip of a convex polygon against a closed half-plane."""
+    if not polygon:
+        return []
+
+    sign = 1.0 if plane.strict else -1.0
+
+    def side(p: Point) -> float:
+        return sign * (plane.value(p[0], p[1]) - plane.bound)
+
+    clipped: List[Point] = []
+    for i, current in enumerate(polygon):
+        previous = polygon[i - 1]
+        s_cur, s_prev = side(current), side(previous)
+        if s_cur >= 0:
+            if s_prev < 0:
+                clipped.append(_intersect(previous, current, s_prev, s_cur))
+            clipped.append(current)
+        elif s_prev >= 0:
+            clipped.append(_intersect(previous, current, s_prev, s_cur))
+
+    # Drop consecutive duplicates produced by vertices lying on the line.
+    deduped = [p for i, p in enumerate(clipped) if p != clipped[i - 1]] if len(clipped) > 1 else clipped
+    return deduped if _polygon_area(deduped) > 0 else []
+
+
+def _intersect(p: Point, q: Point, s_p: float, s_q: float) -> Point:
+    t = s_p / (s_p - s_q)
+    return (p[0] + t * (q[0] - p[0]), p[1] + t * (q[1] - p[1]))
+
+
+def _polygon_area(polygon: Sequence[Point]) -> float:
+    if len(polygon) < 3:
+        return 0.0
+    total = 0.0
+    for i, (x1, y1) in enumerate(polygon):
+        x2, y2 = polygon[(i + 1) % len(polygon)]
+        total += x1 * y2 - x2 * y1
+    return abs(total) / 2.0
+
+
+def decision_surface(
+    weather_risk_pct: float,
+    harm_threshold_min: float,
+    ground_range: Tuple[float, float] = DEFAULT_GROUND_RANGE,
+    air_range: Tuple[float, float] = DEFAULT_AIR_RANGE,
+    rulebook: Optional[Rulebook] = None,
+) -> DecisionSurface:
+    """
+    Build the exact decision regions for fixed weather and harm inputs.
+
+    Args:
+        weather_risk_pct: Weather risk percentage (0-100)
+        harm_threshold_min: Time to irreversible harm (minutes)
+        ground_range: (min, max) ground ETA for the clipped polygons
+        air_range: (min, max) air ETA for the clipped polygons
+        rulebook: Rulebook to analyse (default: the active rulebook)
+
+    Returns:
+        DecisionSurface with one DecisionRegion per rulebook rule
+
+    Examples:
+        >>> surface = decision_surface(10.0, 15)
+        >>> surface.regions["EMERGENCY_OVERRIDE"].constraints[0].describe()
+        'ground > 15.0'
+        >>> surface.rule_at(12.0, 1.0)
+        'EFFICIENCY_OPTIMIZATION'
+    """
+    rulebook = rulebook if rulebook is not None else get_rulebook()
+    g0, g1 = ground_range
+    a0, a1 = air_range
+    box: List[Point] = [(g0, a0), (g1, a0), (g1, a1), (g0, a1)]
+
+    regions: Dict[str, DecisionRegion] = {}
+    negated: List[HalfPlane] = []
+    blocked = False
+
+    for rule, condition in _rule_conditions(weather_risk_pct, harm_threshold_min, rulebook):
+        region = DecisionRegion(rule=rule, response_mode=rulebook.get_rule(rule).response_mode)
+
+        if blocked or condition is False:
+            region.empty = True
+        else:
+            constraints = list(negated)
+            if isinstance(condition, HalfPlane):
+                constraints.append(condition)
+            polygon = box
+            for plane in constraints:
+                polygon = _clip_polygon(polygon, plane)
+            region.constraints = constraints
+            region.polygon = polygon
+
+        if isinstance(condition, HalfPlane):
+            negated.append(condition.negate())
+        elif condition is True:
+            blocked = True
+
+        regions[rule] = region
+
+    return DecisionSurface(
+        weather_risk_pct=weather_risk_pct,
+        harm_threshold_min=harm_threshold_min,
+        ground_range=(g0, g1),
+        air_range=(a0, a1),
+        regions=regions,
+        rulebook_version=rulebook.version,
+    )
+
+
+def rasterize_surface(
+    weather_risk_pct: float,
+    harm_threshold_min: float,
+    ground_values: Optional[Sequence[float]] = None,
+    air_values: Optional[Sequence[float]] = None,
+    resolution: int = 200,
+    rulebook: Optional[Rulebook] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rasterize the decision surface onto a dense (air x ground) grid.
+
+    The whole grid goes through dispatch_batch() in one vectorized pass, so
+    every cell matches what dispatch() would return for that point.
+
+    Args:
+        weather_risk_pct: Weather risk percentage (0-100)
+        harm_threshold_min: Time to irreversible harm (minutes)
+        ground_values: Ground ETA axis (default: resolution points over DEFAULT_GROUND_RANGE)
+        air_values: Air ETA axis (default: resolution points over DEFAULT_AIR_RANGE)
+        resolution: Points per axis when an axis is not given
+        rulebook: Rulebook to evaluate (default: the active rulebook)
+
+    Returns:
+        Tuple of (ground_axis, air_axis, rule_codes) where rule_codes has
+        shape (len(air_axis), len(ground_axis)) and indexes RULE_CODES
+    """
+    ground_axis = (
+        np.linspace(*DEFAULT_GROUND_RANGE, resolution)
+        if ground_values is None else np.asarray(ground_values, dtype=np.float64)
+    )
+    air_axis = (
+        np.linspace(*DEFAULT_AIR_RANGE, resolution)
+        if air_values is None else np.asarray(air_values, dtype=np.float64)
+    )
+
+    ground_grid, air_grid = np.meshgrid(ground_axis, air_axis)
+    batch = dispatch_batch(
+        weather_risk_pct, harm_threshold_min, ground_grid.ravel(), air_grid.ravel(), rulebook=rulebook
+    )
+    return ground_axis, air_axis, batch.rule_codes.reshape(ground_grid.shape)
+
@@ -9,10 +9,25 @@ Implements the exact 3-step logic from D1.md:
 4. Default: Ground ambulance
 
 Returns: DOCTOR_DRONE, AMBULANCE, or BOTH
+
+Thresholds, rule order, modes and confidences live in a versioned rulebook
+(data/dispatch_rules.json, or the file named by DISPATCH_RULES_FILE). The
+active rulebook is compiled once into a flat evaluator and can be swapped at
+runtime with reload_rulebook()/set_rulebook() without restarting workers.
 """
 
-from dataclasses import dataclass
-from typing import List, Literal
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
 
 
 ResponseMode = Literal["DOCTOR_DRONE", "AMBULANCE", "BOTH"]
@@ -26,15 +41,17 @@ RuleType = Literal[
 ]
 
 
-@dataclass
-class DispatchResult:
+class DispatchResult(NamedTuple):
     """
     Result of dispatch decision.
     
+    Immutable, tuple-backed record (no per-instance __dict__). Reasons are not
+    stored; they are rendered on demand from the inputs and rule by the
+    ``reasons`` property, so machine callers never pay for string formatting.
+    
     Attributes:
         response_mode: DOCTOR_DRONE, AMBULANCE, or BOTH
         rule_triggered: Which rule made the decision
-        reasons: List of human-readable reasoning
         weather_risk_pct: Input weather risk
         harm_threshold_min: Input harm threshold
         ground_eta_min: Input ground ETA
@@ -44,10 +61,10 @@ class DispatchResult:
         exceeds_harm: Whether ground ETA exceeded harm threshold
         exceeds_efficiency: Whether time delta exceeded efficiency threshold
         confidence: Decision confidence (0-1)
+        rulebook_version: Version of the rulebook that made the decision
     """
     response_mode: ResponseMode
     rule_triggered: RuleType
-    reasons: List[str]
     
     
     weather_risk_pct: float
@@ -63,12 +80,20 @@ class DispatchResult:
     
     
     confidence: float = 1.0
+    rulebook_version: int = 0
+    
+    @property
+    def reasons(self) -> List[str]:
+        """Human-readable reasoning for the decision, rendered on each access."""
+        return render_reasons(self)
 
 
 
 
 
 
+# D1.md defaults. The built-in rulebook is assembled from these values and is
+# used whenever no rulebook file is configured.
 WEATHER_RISK_THRESHOLD = 35.0
 HARM_THRESHOLD_CRITICAL = True
 EFFICIENCY_TIME_DELTA = 10.0
@@ -77,6 +102,40 @@ EFFICIENCY_TIME_DELTA = 10.0
 # engine can distinguish combined dispatch as BOTH.
 AIR_RESPONSE_MODES = {"DOCTOR_DRONE", "BOTH"}
 
+# Integer codes used by the columnar batch API (index into these tuples).
+RESPONSE_MODE_CODES: Tuple[str, ...] = ("DOCTOR_DRONE", "AMBULANCE", "BOTH")
+RULE_CODES: Tuple[str, ...] = (
+    "SAFETY_FILTER",
+    "EMERGENCY_OVERRIDE",
+    "EFFICIENCY_OPTIMIZATION",
+    "DEFAULT",
+)
+RULE_CONFIDENCE = {
+    "SAFETY_FILTER": 1.0,
+    "EMERGENCY_OVERRIDE": 0.98,
+    "EFFICIENCY_OPTIMIZATION": 0.90,
+    "DEFAULT": 0.9,
+}
+RULE_MODES = {
+    "SAFETY_FILTER": "AMBULANCE",
+    "EMERGENCY_OVERRIDE": "BOTH",
+    "EFFICIENCY_OPTIMIZATION": "BOTH",
+    "DEFAULT": "AMBULANCE",
+}
+
+# Each rule name is bound to one condition; thresholded rules read theirs
+# from the rulebook.
+RULE_CONDITIONS = {
+    "SAFETY_FILTER": "exceeds_weather",
+    "EMERGENCY_OVERRIDE": "exceeds_harm",
+    "EFFICIENCY_OPTIMIZATION": "exceeds_efficiency",
+    "DEFAULT": "True",
+}
+THRESHOLD_RULES = {"SAFETY_FILTER", "EFFICIENCY_OPTIMIZATION"}
+
+
+RULEBOOK_FILE = Path(__file__).parent.parent / "data" / "dispatch_rules.json"
+
 
 def is_air_response_mode(mode: str) -> bool:
     """
@@ -92,6 +151,365 @@ def normalize_mode_for_expected_label(mode: str) -> str:
     return "DOCTOR_DRONE" if is_air_response_mode(mode) else "AMBULANCE"
 
 
+
+
+
+
+@dataclass(frozen=True)
+class RuleSpec:
+    """
+    One entry of a dispatch rulebook.
+    
+    Attributes:
+        rule: Rule name (one of RULE_CODES, which fixes its condition)
+        response_mode: Mode dispatched when the rule fires
+        confidence: Decision confidence (0-1)
+        threshold: Weather % for SAFETY_FILTER, minutes saved for
+            EFFICIENCY_OPTIMIZATION, unused otherwise
+    """
+    rule: RuleType
+    response_mode: ResponseMode
+    confidence: float
+    threshold: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class Rulebook:
+    """
+    Versioned, compiled dispatch rule set.
+    
+    Rules are evaluated in order and the first whose condition holds decides;
+    the last rule must be DEFAULT. On construction the rulebook is validated
+    and compiled into a flat scalar evaluator (generated Python with the
+    thresholds inlined as constants) plus lookup tables for the batch path.
+    Instances are immutable, so a reference obtained once stays consistent
+    for a whole request even if another thread swaps the active rulebook.
+    
+    Attributes:
+        version: Integer version stamped on every DispatchResult
+        rules: Ordered rule specs
+        description: Free-text note (e.g. shift name)
+        source: Where the rulebook was loaded from
+        evaluate: Compiled scalar evaluator with dispatch()'s signature
+    
+    Raises:
+        ValueError: If the rule set is invalid or the version is already
+            registered for a different rule set
+    """
+    version: int
+    rules: Tuple[RuleSpec, ...]
+    description: str = ""
+    source: str = "builtin"
+    evaluate: Callable[..., DispatchResult] = field(init=False, repr=False, compare=False)
+    _mode_table: np.ndarray = field(init=False, repr=False, compare=False)
+    _confidence_table: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "rules", tuple(self.rules))
+        _validate_rules(self.rules)
+        
+        mode_table = np.zeros(len(RULE_CODES), dtype=np.uint8)
+        confidence_table = np.zeros(len(RULE_CODES))
+        for spec in self.rules:
+            mode_table[RULE_CODES.index(spec.rule)] = RESPONSE_MODE_CODES.index(spec.response_mode)
+            confidence_table[RULE_CODES.index(spec.rule)] = spec.confidence
+        
+        object.__setattr__(self, "evaluate", _compile_evaluator(self))
+        object.__setattr__(self, "_mode_table", mode_table)
+        object.__setattr__(self, "_confidence_table", confidence_table)
+        _register_rulebook(self)
+    
+    def get_rule(self, rule: str) -> Optional[RuleSpec]:
+        """Return the spec for a rule name, or None if the rulebook omits it."""
+        for spec in self.rules:
+            if spec.rule == rule:
+                return spec
+        return None
+    
+    @property
+    def weather_threshold(self) -> float:
+        """SAFETY_FILTER threshold (inf when the rule is absent)."""
+        spec = self.get_rule("SAFETY_FILTER")
+        return spec.threshold if spec else float("inf")
+    
+    @property
+    def efficiency_threshold(self) -> float:
+        """EFFICIENCY_OPTIMIZATION threshold (inf when the rule is absent)."""
+        spec = self.get_rule("EFFICIENCY_OPTIMIZATION")
+        return spec.threshold if spec else float("inf")
+    
+    def evaluate_batch(
+        self,
+        weather_risk_pct,
+        harm_threshold_min,
+        ground_eta_min,
+        air_eta_min,
+    ) -> "DispatchBatchResult":
+        """Vectorized evaluation; see dispatch_batch()."""
+        weather, harm, ground, air = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(weather_risk_pct, dtype=np.float64)),
+            np.atleast_1d(np.asarray(harm_threshold_min, dtype=np.float64)),
+            np.atleast_1d(np.asarray(ground_eta_min, dtype=np.float64)),
+            np.atleast_1d(np.asarray(air_eta_min, dtype=np.float64)),
+        )
+        
+        time_delta = ground - air
+        
+        flags = {
+            "exceeds_weather": weather > self.weather_threshold,
+            "exceeds_harm": ground > harm,
+            "exceeds_efficiency": time_delta > self.efficiency_threshold,
+        }
+        
+        # Later assignments win, so apply rules from lowest to highest priority.
+        rule_codes = np.empty(weather.shape, dtype=np.uint8)
+        for spec in reversed(self.rules):
+            code = RULE_CODES.index(spec.rule)
+            condition = RULE_CONDITIONS[spec.rule]
+            if condition == "True":
+                rule_codes.fill(code)
+            else:
+                rule_codes[flags[condition]] = code
+        
+        return DispatchBatchResult(
+            mode_codes=self._mode_table[rule_codes],
+            rule_codes=rule_codes,
+            time_delta_min=time_delta,
+            exceeds_weather=flags["exceeds_weather"],
+            exceeds_harm=flags["exceeds_harm"],
+            exceeds_efficiency=flags["exceeds_efficiency"],
+            confidence=self._confidence_table[rule_codes],
+            rulebook_version=self.version,
+        )
+
+
+def _validate_rules(rules: Tuple[RuleSpec, ...]) -> None:
+    if not rules or rules[-1].rule != "DEFAULT":
+        raise ValueError("Rulebook must end with a DEFAULT rule")
+    
+    seen = set()
+    for spec in rules:
+        if spec.rule not in RULE_CODES:
+            raise ValueError(f"Unknown rule '{spec.rule}' (expected one of {RULE_CODES})")
+        if spec.rule in seen:
+            raise ValueError(f"Rule '{spec.rule}' listed more than once")
+        seen.add(spec.rule)
+        
+        if spec.response_mode not in RESPONSE_MODE_CODES:
+            raise ValueError(f"Unknown response mode '{spec.response_mode}' for {spec.rule}")
+        if not (0.0 <= spec.confidence <= 1.0):
+            raise ValueError(f"Confidence {spec.confidence} for {spec.rule} outside 0-1")
+        if spec.rule in THRESHOLD_RULES:
+            if not isinstance(spec.threshold, (int, float)) or spec.threshold != spec.threshold:
+                raise ValueError(f"Rule {spec.rule} requires a numeric threshold")
+
+
+def _literal(value: float) -> str:
+    """Source literal for a float constant (inf has no literal form)."""
+    return repr(float(value)) if np.isfinite(value) else "_INF"
+
+
+def _compile_evaluator(rulebook: Rulebook) -> Callable[..., DispatchResult]:
+    """
+    Generate the flat scalar evaluator for a rulebook.
+    
+    The generated function is the hand-written if/elif chain with thresholds,
+    modes and confidences inlined as constants, and it builds the result with
+    tuple.__new__ directly. Only validated rule names, modes and floats are
+    interpolated into the source.
+    """
+    lines = [
+        "def evaluate(weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min):",
+        "    time_delta = ground_eta_min - air_eta_min",
+        f"    exceeds_weather = weather_risk_pct > {_literal(rulebook.weather_threshold)}",
+        "    exceeds_harm = ground_eta_min > harm_threshold_min",
+        f"    exceeds_efficiency = time_delta > {_literal(rulebook.efficiency_threshold)}",
+    ]
+    
+    for spec in rulebook.rules:
+        result = (
+            f"_new(_Result, ({spec.response_mode!r}, {spec.rule!r}, "
+            "weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min, "
+            "time_delta, exceeds_weather, exceeds_harm, exceeds_efficiency, "
+            f"{float(spec.confidence)!r}, {int(rulebook.version)!r}))"
+        )
+        condition = RULE_CONDITIONS[spec.rule]
+        if condition == "True":
+            lines.append(f"    return {result}")
+            break
+        lines.append(f"    if {condition}:")
+        lines.append(f"        return {result}")
+    
+    namespace = {"_new": tuple.__new__, "_Result": DispatchResult, "_INF": float("inf")}
+    exec(compile("\n".join(lines), f"<rulebook v{rulebook.version}>", "exec"), namespace)
+    return namespace["evaluate"]
+
+
+# One rulebook per version for the life of the process, so a version stamp
+# always names the rules that made the decision (render_reasons() relies on
+# it). The registry grows only with distinct versions, not with reloads.
+_registry_lock = threading.Lock()
+_rulebooks_by_version: Dict[int, Rulebook] = {}
+
+
+def _register_rulebook(rulebook: Rulebook) -> None:
+    with _registry_lock:
+        existing = _rulebooks_by_version.get(rulebook.version)
+        if existing is not None and existing.rules != rulebook.rules:
+            raise ValueError(
+                f"Rulebook version {rulebook.version} is already registered with different rules"
+            )
+        if existing is None:
+            _rulebooks_by_version[rulebook.version] = rulebook
+
+
+def get_rulebook_version(version: int) -> Optional[Rulebook]:
+    """Return the registered rulebook for a version, if any."""
+    return _rulebooks_by_version.get(version)
+
+
+def rulebook_from_dict(data: Dict[str, Any], source: str = "dict") -> Rulebook:
+    """
+    Build a Rulebook from its JSON representation.
+    
+    Expected Structure:
+        {"version": 2, "description": "...",
+         "rules": [{"rule": "SAFETY_FILTER", "response_mode": "AMBULANCE",
+                    "confidence": 1.0, "threshold": 35.0}, ...]}
+    
+    Args:
+        data: Parsed rulebook document
+        source: Label recorded on the rulebook
+    
+    Returns:
+        Compiled Rulebook
+    
+    Raises:
+        ValueError: If required fields are missing or invalid
+    """
+    try:
+        version = int(data["version"])
+        rules = tuple(
+            RuleSpec(
+                rule=r["rule"],
+                response_mode=r["response_mode"],
+                confidence=float(r["confidence"]),
+                threshold=float(r["threshold"]) if r.get("threshold") is not None else None,
+            )
+            for r in data["rules"]
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid rulebook structure in {source}: {e}") from e
+    
+    return Rulebook(
+        version=version,
+        rules=rules,
+        description=str(data.get("description", "")),
+        source=source,
+    )
+
+
+def builtin_rulebook() -> Rulebook:
+    """Rulebook assembled from the D1.md module constants."""
+    thresholds = {
+        "SAFETY_FILTER": WEATHER_RISK_THRESHOLD,
+        "EFFICIENCY_OPTIMIZATION": EFFICIENCY_TIME_DELTA,
+    }
+    return Rulebook(
+        version=1,
+        rules=tuple(
+            RuleSpec(rule, RULE_MODES[rule], RULE_CONFIDENCE[rule], thresholds.get(rule))
+            for rule in RULE_CODES
+        ),
+        description="D1.md baseline",
+    )
+
+
+def load_rulebook(path: Optional[os.PathLike] = None) -> Rulebook:
+    """
+    Load and compile a rulebook file (does not activate it).
+    
+    Args:
+        path: JSON file; defaults to DISPATCH_RULES_FILE or data/dispatch_rules.json
+    
+    Returns:
+        Compiled Rulebook
+    
+    Raises:
+        FileNotFoundError: If the rulebook file does not exist
+        ValueError: If the file is not a valid rulebook
+    """
+    if path is None:
+        configured = os.getenv("DISPATCH_RULES_FILE", "").strip()
+        if configured:
+            candidate = Path(configured)
+            path = candidate if candidate.is_absolute() else (RULEBOOK_FILE.parent / candidate)
+        else:
+            path = RULEBOOK_FILE
+    path = Path(path)
+    
+    if not path.exists():
+        raise FileNotFoundError(f"Rulebook file not found: {path}")
+    
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Rulebook {path} is not valid JSON: {e}") from e
+    
+    return rulebook_from_dict(data, source=str(path))
+
+
+_swap_lock = threading.Lock()
+
+
+def get_rulebook() -> Rulebook:
+    """Return the active rulebook."""
+    return _active_rulebook
+
+
+def set_rulebook(rulebook: Rulebook) -> Rulebook:
+    """
+    Atomically make rulebook the active one.
+    
+    In-flight dispatch() calls keep the rulebook they already read; calls
+    starting after the swap use the new one.
+    
+    Returns:
+        The previously active rulebook
+    """
+    global _active_rulebook
+    with _swap_lock:
+        previous = _active_rulebook
+        _active_rulebook = rulebook
+    logger.info(f"Dispatch rulebook v{previous.version} -> v{rulebook.version} ({rulebook.source})")
+    return previous
+
+
+def reload_rulebook(path: Optional[os.PathLike] = None) -> Rulebook:
+    """
+    Load, compile and activate a rulebook file.
+    
+    The active rulebook is left untouched if loading fails.
+    
+    Returns:
+        The newly active rulebook
+    """
+    rulebook = load_rulebook(path)
+    set_rulebook(rulebook)
+    return rulebook
+
+
+def _initial_rulebook() -> Rulebook:
+    try:
+        return load_rulebook()
+    except FileNotFoundError:
+        return builtin_rulebook()
+    except ValueError as e:
+        logger.error(f"Failed to load dispatch rulebook: {e}; using built-in D1.md rules")
+        return builtin_rulebook()
+
+
 def dispatch(
     weather_risk_pct: float,
     harm_threshold_min: float,
@@ -125,6 +543,9 @@ def dispatch(
         ground_eta_min: Estimated ground ambulance arrival (minutes)
         air_eta_min: Estimated drone arrival (minutes)
     
+    Rules, thresholds and confidences come from the active rulebook (see
+    get_rulebook()); the list above is the D1.md default.
+    
     Returns:
         DispatchResult with decision, reasoning, and metadata
     
@@ -150,70 +571,143 @@ def dispatch(
         >>> result.rule_triggered
         'EFFICIENCY_OPTIMIZATION'
     """
+    return _active_rulebook.evaluate(
+        weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min
+    )
+
+
+def render_reasons(result: DispatchResult) -> List[str]:
+    """
+    Render the human-readable reasoning for a dispatch decision.
     
-    time_delta = ground_eta_min - air_eta_min
-    
-    
-    exceeds_weather = weather_risk_pct > WEATHER_RISK_THRESHOLD
-    exceeds_harm = ground_eta_min > harm_threshold_min
-    exceeds_efficiency = time_delta > EFFICIENCY_TIME_DELTA
-    
+    Args:
+        result: DispatchResult to explain
     
-    mode: ResponseMode
-    rule: RuleType
-    reasons: List[str] = []
-    confidence: float
+    Thresholds come from the rulebook that made the decision; if that
+    version was never loaded in this process (e.g. a decision read back
+    from an audit log), the version is named instead of a threshold.
     
+    Returns:
+        List of reason strings for the triggered rule
+    """
+    rulebook = get_rulebook_version(result.rulebook_version)
+    if rulebook is not None:
+        weather_threshold = f"{rulebook.weather_threshold}%"
+        efficiency_threshold = f"{rulebook.efficiency_threshold} min"
+    else:
+        weather_threshold = efficiency_threshold = f"rulebook v{result.rulebook_version}"
+    
+    rule = result.rule_triggered
+    weather_risk_pct = result.weather_risk_pct
+    harm_threshold_min = result.harm_threshold_min
+    ground_eta_min = result.ground_eta_min
+    air_eta_min = result.air_eta_min
+    time_delta = result.time_delta_min
+    
+    if rule == "SAFETY_FILTER":
+        return [
+            f"Weather risk {weather_risk_pct:.1f}% exceeds safety threshold ({weather_threshold})",
+            "Drone operations unsafe - defaulting to ground ambulance",
+        ]
+    
+    if rule == "EMERGENCY_OVERRIDE":
+        return [
+            f"Ground ETA ({ground_eta_min:.1f} min) exceeds harm threshold ({harm_threshold_min} min)",
+            "CRITICAL: Simultaneous Drone (Speed) + Ambulance (Transport) dispatched",
+            f"Drone arrival: {air_eta_min:.1f} min (saves {time_delta:.1f} min)",
+        ]
+    
+    if rule == "EFFICIENCY_OPTIMIZATION":
+        return [
+            f"Drone saves {time_delta:.1f} min (threshold: {efficiency_threshold})",
+            f"Ground ETA: {ground_eta_min:.1f} min vs Drone ETA: {air_eta_min:.1f} min",
+            "Dispatching Drone for immediate aid + Ambulance for transport",
+        ]
+    
+    return [
+        "Ground ambulance is safe and sufficient",
+        f"Weather risk acceptable ({weather_risk_pct:.1f}%)",
+        f"Ground ETA ({ground_eta_min:.1f} min) within harm threshold ({harm_threshold_min} min)",
+        f"Time savings ({time_delta:.1f} min) below efficiency threshold ({efficiency_threshold})",
+    ]
+
+
+@dataclass
+class DispatchBatchResult:
+    """
+    Columnar result of a batch dispatch run.
     
-    if exceeds_weather:
-        mode = "AMBULANCE"
-        rule = "SAFETY_FILTER"
-        reasons.append(f"Weather risk {weather_risk_pct:.1f}% exceeds safety threshold ({WEATHER_RISK_THRESHOLD}%)")
-        reasons.append("Drone operations unsafe - defaulting to ground ambulance")
-        confidence = 1.0
+    Every attribute is a NumPy array with one entry per input row. Mode and
+    rule codes index into RESPONSE_MODE_CODES and RULE_CODES.
     
+    Attributes:
+        mode_codes: Response mode code per row (uint8)
+        rule_codes: Triggered rule code per row (uint8)
+        time_delta_min: Time saved by drone (ground - air)
+        exceeds_weather: Whether weather risk exceeded threshold
+        exceeds_harm: Whether ground ETA exceeded harm threshold
+        exceeds_efficiency: Whether time delta exceeded efficiency threshold
+        confidence: Decision confidence per row
+        rulebook_version: Version of the rulebook that made the decisions
+    """
+    mode_codes: np.ndarray
+    rule_codes: np.ndarray
+    time_delta_min: np.ndarray
+    exceeds_weather: np.ndarray
+    exceeds_harm: np.ndarray
+    exceeds_efficiency: np.ndarray
+    confidence: np.ndarray
+    rulebook_version: int = 0
+    
+    def __len__(self) -> int:
+        return len(self.mode_codes)
+    
+    def response_modes(self) -> List[str]:
+        """Decode mode codes to ResponseMode strings."""
+        return [RESPONSE_MODE_CODES[code] for code in self.mode_codes.tolist()]
+    
+    def rules_triggered(self) -> List[str]:
+        """Decode rule codes to RuleType strings."""
+        return [RULE_CODES[code] for code in self.rule_codes.tolist()]
+
+
+def dispatch_batch(
+    weather_risk_pct,
+    harm_threshold_min,
+    ground_eta_min,
+    air_eta_min,
+    rulebook: Optional[Rulebook] = None,
+) -> DispatchBatchResult:
+    """
+    Vectorized dispatch over columns of incidents.
     
-    elif exceeds_harm:
-        mode = "BOTH"
-        rule = "EMERGENCY_OVERRIDE"
-        reasons.append(f"Ground ETA ({ground_eta_min:.1f} min) exceeds harm threshold ({harm_threshold_min} min)")
-        reasons.append("CRITICAL: Simultaneous Drone (Speed) + Ambulance (Transport) dispatched")
-        reasons.append(f"Drone arrival: {air_eta_min:.1f} min (saves {time_delta:.1f} min)")
-        confidence = 0.98
+    Applies the same rule chain as dispatch() using NumPy comparisons, so the
+    mode and rule for each row agree exactly with the scalar path. Reasons are
+    not rendered; use dispatch() on individual rows when text is needed.
     
+    Args:
+        weather_risk_pct: Array-like of weather risk percentages (0-100)
+        harm_threshold_min: Array-like of harm thresholds (minutes)
+        ground_eta_min: Array-like of ground ambulance ETAs (minutes)
+        air_eta_min: Array-like of drone ETAs (minutes)
+        rulebook: Rulebook to evaluate (default: the active rulebook)
     
-    elif exceeds_efficiency:
-        mode = "BOTH"
-        rule = "EFFICIENCY_OPTIMIZATION"
-        reasons.append(f"Drone saves {time_delta:.1f} min (threshold: {EFFICIENCY_TIME_DELTA} min)")
-        reasons.append(f"Ground ETA: {ground_eta_min:.1f} min vs Drone ETA: {air_eta_min:.1f} min")
-        reasons.append("Dispatching Drone for immediate aid + Ambulance for transport")
-        confidence = 0.90
+    Returns:
+        DispatchBatchResult with one entry per row
     
+    Raises:
+        ValueError: If the input columns cannot be broadcast together
     
-    else:
-        mode = "AMBULANCE"
-        rule = "DEFAULT"
-        reasons.append("Ground ambulance is safe and sufficient")
-        reasons.append(f"Weather risk acceptable ({weather_risk_pct:.1f}%)")
-        reasons.append(f"Ground ETA ({ground_eta_min:.1f} min) within harm threshold ({harm_threshold_min} min)")
-        reasons.append(f"Time savings ({time_delta:.1f} min) below efficiency threshold ({EFFICIENCY_TIME_DELTA} min)")
-        confidence = 0.9
-    
-    return DispatchResult(
-        response_mode=mode,
-        rule_triggered=rule,
-        reasons=reasons,
-        weather_risk_pct=weather_risk_pct,
-        harm_threshold_min=harm_threshold_min,
-        ground_eta_min=ground_eta_min,
-        air_eta_min=air_eta_min,
-        time_delta_min=time_delta,
-        exceeds_weather=exceeds_weather,
-        exceeds_harm=exceeds_harm,
-        exceeds_efficiency=exceeds_efficiency,
-        confidence=confidence,
-    )
+    Examples:
+        >>> batch = dispatch_batch([88.0, 14.0], [4, 4], [29.8, 29.8], [3.6, 3.6])
+        >>> batch.rules_triggered()
+        ['SAFETY_FILTER', 'EMERGENCY_OVERRIDE']
+    """
+    active = rulebook if rulebook is not None else _active_rulebook
+    return active.evaluate_batch(weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min)
+
+
+_active_rulebook: Rulebook = _initial_rulebook()
 
 
 def validate_inputs(
@@ -348,6 +842,11 @@ def test_dispatch_logic():
 
 
 if __name__ == "__main__":
+    import sys
+    
+    if "--stream" in sys.argv[1:]:
+        from .dispatch_stream import main
+        sys.exit(main(sys.argv[1:]))
     
     all_passed = test_dispatch_logic()
     
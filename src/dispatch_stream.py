@@ -0,0 +1,285 @@
+"""
+Streaming Dispatch Module
+Constant-memory JSONL dispatch for call intake records.
+
+Reads one JSON record per line from a file or stdin, normalizes it with the
+data_loader helpers, dispatches it and writes one JSON decision per line.
+Lines are processed in fixed-size chunks through dispatch_batch(), so memory
+stays flat regardless of input size. Progress counters go to stderr.
+
+Run with:
+    python -m src.dispatch_engine --stream calls.jsonl > decisions.jsonl
+    cat calls.jsonl | python -m src.dispatch_engine --stream -o decisions.jsonl
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from .data_loader import normalize_weather_risk, parse_harm_time
+from .dispatch_engine import (
+    RESPONSE_MODE_CODES,
+    RULE_CODES,
+    dispatch_batch,
+    get_rulebook,
+    reload_rulebook,
+)
+
+
+DEFAULT_CHUNK_SIZE = 4096
+DEFAULT_PROGRESS_SECONDS = 5.0
+DEFAULT_HARM_THRESHOLD_MIN = 30
+
+
+# Field aliases in lookup order, covering the raw scenario/case schemas and
+# the normalized data_loader schema.
+ID_FIELDS = ("incident_id", "id", "scenario_id", "Scenario ID", "case_id")
+WEATHER_FIELDS = ("weather_risk_pct", "weather_risk_score", "Weather Risk")
+HARM_FIELDS = (
+    "harm_threshold_min",
+    "Harm Threshold (min)",
+    "Harm Limit (Min)",
+    "time_to_irreversible_harm",
+)
+GROUND_FIELDS = ("ground_eta_min", "ground_time_min", "Ground Time (min)", "Ground ETA")
+AIR_FIELDS = ("air_eta_min", "air_time_min", "Air Time (min)", "Air ETA")
+
+
+def _first(record: Dict[str, Any], fields: Tuple[str, ...]) -> Any:
+    for name in fields:
+        if record.get(name) is not None:
+            return record[name]
+    return None
+
+
+def _non_negative(label: str, value: Any) -> float:
+    """A finite, non-negative number, or ValueError."""
+    try:
+        number = float(value.replace("%", "") if isinstance(value, str) else value)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid {label}: {value!r}")
+    if not math.isfinite(number) or number < 0:
+        raise ValueError(f"invalid {label}: {value!r}")
+    return number
+
+
+def normalize_record(record: Dict[str, Any]) -> Tuple[float, float, float, float]:
+    """
+    Extract dispatch inputs from one intake record.
+
+    Weather is required and goes through normalize_weather_risk() (which
+    would read a missing value as 0%); string harm thresholds go
+    through parse_harm_time() and use the lower bound, as load_scenarios()
+    and load_cases() do.
+
+    Args:
+        record: Parsed JSON object
+
+    Returns:
+        Tuple of (weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min)
+
+    Raises:
+        ValueError: If the weather risk or an ETA is missing, or one of
+            them or the harm threshold is not a finite, non-negative number
+    """
+    weather_raw = _first(record, WEATHER_FIELDS)
+    if weather_raw is None:
+        raise ValueError("missing weather risk")
+    _non_negative("weather risk", weather_raw)
+    weather = normalize_weather_risk(weather_raw)
+
+    harm_raw = _first(record, HARM_FIELDS)
+    if harm_raw is None:
+        harm = float(DEFAULT_HARM_THRESHOLD_MIN)
+    elif isinstance(harm_raw, str):
+        try:
+            harm = float(parse_harm_time(harm_raw)[0])
+        except OverflowError:
+            raise ValueError(f"invalid harm threshold: {harm_raw!r}")
+    else:
+        harm = _non_negative("harm threshold", harm_raw)
+
+    etas = []
+    for label, fields in (("ground ETA", GROUND_FIELDS), ("air ETA", AIR_FIELDS)):
+        value = _first(record, fields)
+        if value is None:
+            raise ValueError(f"missing {label}")
+        etas.append(_non_negative(label, value))
+
+    return weather, harm, etas[0], etas[1]
+
+
+class StreamStats:
+    """Throughput counters for a streaming run."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.records = 0
+        self.errors = 0
+        self.bytes_in = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def summary(self) -> str:
+        rate = self.records / self.elapsed if self.elapsed > 0 else 0.0
+        return (
+            f"records={self.records} errors={self.errors} "
+            f"read={self.bytes_in / 1e6:.1f}MB elapsed={self.elapsed:.1f}s rate={rate:,.0f}/s"
+        )
+
+
+def _dispatch_chunk(lines: List[Tuple[int, str]], out: TextIO, stats: StreamStats) -> None:
+    """Parse, dispatch and write one chunk, preserving input order."""
+    decoded: List[Tuple[int, Any, Optional[Tuple[float, float, float, float]], Optional[str]]] = []
+    for line_no, line in lines:
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("record is not a JSON object")
+            decoded.append((line_no, _first(record, ID_FIELDS), normalize_record(record), None))
+        except (TypeError, ValueError) as e:
+            decoded.append((line_no, None, None, str(e)))
+
+    valid = [inputs for _, _, inputs, _ in decoded if inputs is not None]
+    batch = dispatch_batch(*zip(*valid)) if valid else None
+
+    if batch is not None:
+        # Plain Python lists are far cheaper to index per row than NumPy scalars.
+        modes = [RESPONSE_MODE_CODES[c] for c in batch.mode_codes.tolist()]
+        rules = [RULE_CODES[c] for c in batch.rule_codes.tolist()]
+        columns = list(zip(
+            modes,
+            rules,
+            batch.confidence.tolist(),
+            batch.time_delta_min.tolist(),
+            batch.exceeds_weather.tolist(),
+            batch.exceeds_harm.tolist(),
+            batch.exceeds_efficiency.tolist(),
+        ))
+        version = batch.rulebook_version
+
+    row = 0
+    write = out.write
+    for line_no, record_id, inputs, error in decoded:
+        if inputs is None:
+            stats.errors += 1
+            write(json.dumps({"line": line_no, "error": error}) + "\n")
+            continue
+
+        weather, harm, ground, air = inputs
+        mode, rule, confidence, time_delta, ex_weather, ex_harm, ex_efficiency = columns[row]
+        write(json.dumps({
+            "line": line_no,
+            "id": record_id,
+            "response_mode": mode,
+            "rule_triggered": rule,
+            "confidence": confidence,
+            "weather_risk_pct": weather,
+            "harm_threshold_min": harm,
+            "ground_eta_min": ground,
+            "air_eta_min": air,
+            "time_delta_min": time_delta,
+            "exceeds_weather": ex_weather,
+            "exceeds_harm": ex_harm,
+            "exceeds_efficiency": ex_efficiency,
+            "rulebook_version": version,
+        }) + "\n")
+        row += 1
+
+    stats.records += len(lines)
+
+
+def stream_dispatch(
+    source: Iterable[str],
+    out: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[TextIO] = None,
+    progress_seconds: float = DEFAULT_PROGRESS_SECONDS,
+) -> StreamStats:
+    """
+    Dispatch every JSONL record from source and write decisions to out.
+
+    Only chunk_size lines are held in memory at a time. Blank lines are
+    skipped; malformed lines produce an {"line": n, "error": ...} record.
+
+    Args:
+        source: Iterable of lines (an open file or sys.stdin)
+        out: Text stream for JSONL decisions
+        chunk_size: Lines per dispatch_batch() call
+        progress: Stream for throughput counters (e.g. sys.stderr), or None
+        progress_seconds: Minimum seconds between progress lines
+
+    Returns:
+        StreamStats for the run
+    """
+    stats = StreamStats()
+    next_report = stats.start + progress_seconds
+    chunk: List[Tuple[int, str]] = []
+
+    for line_no, line in enumerate(source, 1):
+        stats.bytes_in += len(line)
+        if not line.strip():
+            continue
+        chunk.append((line_no, line))
+        if len(chunk) >= chunk_size:
+            _dispatch_chunk(chunk, out, stats)
+            chunk = []
+            if progress is not None and time.perf_counter() >= next_report:
+                progress.write(f"[dispatch-stream] {stats.summary()}\n")
+                progress.flush()
+                next_report = time.perf_counter() + progress_seconds
+
+    if chunk:
+        _dispatch_chunk(chunk, out, stats)
+
+    out.flush()
+    if progress is not None:
+        progress.write(f"[dispatch-stream] done {stats.summary()}\n")
+        progress.flush()
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point for --stream mode.
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.dispatch_engine --stream",
+        description="Dispatch JSONL call records with constant memory.",
+    )
+    parser.add_argument("--stream", action="store_true", help="streaming JSONL mode")
+    parser.add_argument("input", nargs="?", default="-", help="JSONL file, or - for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="output file, or - for stdout (default)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--progress-seconds", type=float, default=DEFAULT_PROGRESS_SECONDS)
+    parser.add_argument("--rules", help="rulebook JSON to activate before streaming")
+    args = parser.parse_args(argv)
+
+    if args.rules:
+        reload_rulebook(args.rules)
+    print(f"[dispatch-stream] rulebook v{get_rulebook().version}", file=sys.stderr)
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        stream_dispatch(
+            source,
+            out,
+            chunk_size=args.chunk_size,
+            progress=sys.stderr,
+            progress_seconds=args.progress_seconds,
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
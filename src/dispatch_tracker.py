@@ -0,0 +1,391 @@
+"""
+Dispatch Tracker Module
+Incremental re-dispatch for live incidents.
+
+Open incidents receive a stream of ETA and weather updates. Re-running
+dispatch() for every incident on every tick repeats work: a decision can only
+change when an input crosses one of the three rule boundaries
+
+- weather margin:    weather_risk_pct - weather threshold
+- harm margin:       ground_eta_min - harm_threshold_min
+- efficiency margin: (ground_eta_min - air_eta_min) - efficiency threshold
+
+and each condition holds exactly when its margin is positive. The tracker
+stores these margins column-wise per incident, recomputes them only for the
+rows named in an update, and maps the 3-bit boundary state of rows whose
+state flipped to a rule through an 8-entry table built from the rulebook.
+DecisionChange events are emitted only when the resulting rule changes.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .dispatch_engine import (
+    RESPONSE_MODE_CODES,
+    RULE_CODES,
+    RULE_CONDITIONS,
+    DispatchResult,
+    Rulebook,
+    get_rulebook,
+)
+
+
+DEFAULT_CAPACITY = 1024
+
+# Bit per rule condition in the packed boundary state.
+STATE_BITS = {"exceeds_weather": 1, "exceeds_harm": 2, "exceeds_efficiency": 4}
+
+_WEATHER_BIT = np.uint8(STATE_BITS["exceeds_weather"])
+_HARM_BIT = np.uint8(STATE_BITS["exceeds_harm"])
+_EFFICIENCY_BIT = np.uint8(STATE_BITS["exceeds_efficiency"])
+
+
+class DecisionChange(NamedTuple):
+    """
+    A tracked incident's decision changed.
+
+    Attributes:
+        incident_id: Incident whose decision changed
+        previous_mode: Response mode before the update
+        response_mode: Response mode after the update
+        previous_rule: Rule that decided before the update
+        rule_triggered: Rule that decides now
+        rulebook_version: Rulebook that made the new decision
+    """
+    incident_id: Any
+    previous_mode: str
+    response_mode: str
+    previous_rule: str
+    rule_triggered: str
+    rulebook_version: int
+
+
+def _state_tables(rulebook: Rulebook):
+    """Rule and mode code for each of the 8 boundary states."""
+    rule_table = np.empty(8, dtype=np.uint8)
+    for state in range(8):
+        for spec in rulebook.rules:
+            condition = RULE_CONDITIONS[spec.rule]
+            if condition == "True" or state & STATE_BITS[condition]:
+                rule_table[state] = RULE_CODES.index(spec.rule)
+                break
+
+    mode_by_rule = np.zeros(len(RULE_CODES), dtype=np.uint8)
+    for spec in rulebook.rules:
+        mode_by_rule[RULE_CODES.index(spec.rule)] = RESPONSE_MODE_CODES.index(spec.response_mode)
+    return rule_table, mode_by_rule[rule_table]
+
+
+class DispatchTracker:
+    """
+    Holds the latest inputs, boundary margins and decision of every open incident.
+
+    Rows are stored in growable NumPy columns; closing an incident moves the
+    last row into its slot, so storage stays dense. Not thread-safe: feed it
+    from one consumer.
+
+    Attributes:
+        rulebook: Rulebook the current decisions were made with
+        updates_applied: Row updates processed so far
+        rows_reevaluated: Rows whose boundary state flipped and were re-decided
+    """
+
+    _COLUMNS = (
+        "weather", "harm", "ground", "air",
+        "weather_margin", "harm_margin", "efficiency_margin",
+    )
+
+    def __init__(self, rulebook: Optional[Rulebook] = None, capacity: int = DEFAULT_CAPACITY):
+        self.rulebook = rulebook if rulebook is not None else get_rulebook()
+        self._rule_table, self._mode_table = _state_tables(self.rulebook)
+        self._index: Dict[Any, int] = {}
+        self._ids: List[Any] = []
+        self._size = 0
+
+        capacity = max(1, capacity)
+        for name in self._COLUMNS:
+            setattr(self, f"_{name}", np.empty(capacity))
+        self._state = np.empty(capacity, dtype=np.uint8)
+        self._scratch = np.empty(capacity, dtype=np.intp)
+
+        self.updates_applied = 0
+        self.rows_reevaluated = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, incident_id: Any) -> bool:
+        return incident_id in self._index
+
+    @property
+    def incident_ids(self) -> List[Any]:
+        """Open incident ids in storage order."""
+        return list(self._ids)
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self._state)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in self._COLUMNS:
+            column = np.empty(capacity)
+            column[:self._size] = getattr(self, f"_{name}")[:self._size]
+            setattr(self, f"_{name}", column)
+        state = np.empty(capacity, dtype=np.uint8)
+        state[:self._size] = self._state[:self._size]
+        self._state = state
+        self._scratch = np.empty(capacity, dtype=np.intp)
+
+    def _refresh(self, rows) -> np.ndarray:
+        """Recompute all margins for rows and return their boundary state."""
+        state = self._weather_state(rows, self._weather[rows])
+        return state | self._eta_state(rows, self._harm[rows], self._ground[rows], self._air[rows])
+
+    def _weather_state(self, rows, weather: np.ndarray) -> np.ndarray:
+        margin = weather - self.rulebook.weather_threshold
+        self._weather_margin[rows] = margin
+        return (margin > 0).astype(np.uint8) * _WEATHER_BIT
+
+    def _eta_state(self, rows, harm: np.ndarray, ground: np.ndarray, air: np.ndarray) -> np.ndarray:
+        harm_margin = ground - harm
+        efficiency_margin = (ground - air) - self.rulebook.efficiency_threshold
+        self._harm_margin[rows] = harm_margin
+        self._efficiency_margin[rows] = efficiency_margin
+        return (
+            (harm_margin > 0).astype(np.uint8) * _HARM_BIT
+            | (efficiency_margin > 0).astype(np.uint8) * _EFFICIENCY_BIT
+        )
+
+    def open_incidents(
+        self,
+        incident_ids: Sequence[Any],
+        weather_risk_pct,
+        harm_threshold_min,
+        ground_eta_min,
+        air_eta_min,
+    ) -> None:
+        """
+        Start tracking incidents given as columns.
+
+        Raises:
+            ValueError: If an id is already open or repeated
+        """
+        ids = list(incident_ids)
+        if len(set(ids)) != len(ids) or any(i in self._index for i in ids):
+            raise ValueError("incident ids must be unique and not already open")
+
+        n = len(ids)
+        start = self._size
+        self._grow(start + n)
+        rows = slice(start, start + n)
+        for name, values in zip(
+            ("weather", "harm", "ground", "air"),
+            (weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min),
+        ):
+            getattr(self, f"_{name}")[rows] = np.broadcast_to(np.asarray(values, dtype=np.float64), (n,))
+
+        self._size = start + n
+        self._state[rows] = self._refresh(rows)
+        for offset, incident_id in enumerate(ids):
+            self._index[incident_id] = start + offset
+        self._ids.extend(ids)
+
+    def open_incident(
+        self,
+        incident_id: Any,
+        weather_risk_pct: float,
+        harm_threshold_min: float,
+        ground_eta_min: float,
+        air_eta_min: float,
+    ) -> DispatchResult:
+        """Start tracking one incident and return its initial decision."""
+        self.open_incidents([incident_id], weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min)
+        return self.decision(incident_id)
+
+    def close_incident(self, incident_id: Any) -> None:
+        """
+        Stop tracking an incident.
+
+        Raises:
+            KeyError: If the incident is not open
+        """
+        row = self._index.pop(incident_id)
+        last = self._size - 1
+        if row != last:
+            for name in self._COLUMNS:
+                column = getattr(self, f"_{name}")
+                column[row] = column[last]
+            self._state[row] = self._state[last]
+            moved = self._ids[last]
+            self._ids[row] = moved
+            self._index[moved] = row
+        self._ids.pop()
+        self._size = last
+
+    def update(
+        self,
+        incident_ids: Sequence[Any],
+        weather_risk_pct=None,
+        harm_threshold_min=None,
+        ground_eta_min=None,
+        air_eta_min=None,
+    ) -> List[DecisionChange]:
+        """
+        Apply new inputs to open incidents.
+
+        Columns left as None keep their stored values. If an id appears more
+        than once, its last values win.
+
+        Args:
+            incident_ids: Incidents being updated
+            weather_risk_pct: New weather risk per id (array-like or scalar)
+            harm_threshold_min: New harm threshold per id
+            ground_eta_min: New ground ETA per id
+            air_eta_min: New air ETA per id
+
+        Returns:
+            DecisionChange for every incident whose rule or mode changed
+
+        Raises:
+            KeyError: If an id is not open
+        """
+        rows = np.array(list(map(self._index.__getitem__, incident_ids)), dtype=np.intp)
+        n = len(rows)
+        if n == 0:
+            return []
+
+        columns = {}
+        for name, values in zip(
+            ("weather", "harm", "ground", "air"),
+            (weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min),
+        ):
+            if values is not None:
+                values = np.broadcast_to(np.asarray(values, dtype=np.float64), (n,))
+                getattr(self, f"_{name}")[rows] = values
+                columns[name] = values
+        if not columns:
+            return []
+        # Scatter positions and read them back: a mismatch means an id was
+        # repeated, so re-read the stored (last-written) values for it.
+        positions = np.arange(n)
+        self._scratch[rows] = positions
+        if (self._scratch[rows] != positions).any():
+            columns = {name: getattr(self, f"_{name}")[rows] for name in columns}
+
+        self.updates_applied += n
+        old_state = self._state[rows]
+        new_state = old_state
+
+        # Only the margins that depend on the updated columns are recomputed.
+        if "weather" in columns:
+            new_state = (new_state & ~_WEATHER_BIT) | self._weather_state(rows, columns["weather"])
+        if len(columns) > 1 or "weather" not in columns:
+            def column(name):
+                return columns[name] if name in columns else getattr(self, f"_{name}")[rows]
+            new_state = (new_state & _WEATHER_BIT) | self._eta_state(
+                rows, column("harm"), column("ground"), column("air")
+            )
+
+        flipped = new_state != old_state
+        if not flipped.any():
+            return []
+
+        # Repeated ids carry identical state; keep one copy of each flipped row.
+        rows, first = np.unique(rows[flipped], return_index=True)
+        new_state = new_state[flipped][first]
+        old_state = old_state[flipped][first]
+        self._state[rows] = new_state
+        self.rows_reevaluated += len(rows)
+        return self._changes(rows, old_state, new_state, self._rule_table, self._mode_table)
+
+    def update_incident(self, incident_id: Any, **inputs: float) -> Optional[DecisionChange]:
+        """
+        Update one incident by keyword (e.g. ground_eta_min=12.5).
+
+        Returns:
+            DecisionChange if the rule changed, else None
+        """
+        changes = self.update([incident_id], **inputs)
+        return changes[0] if changes else None
+
+    def _changes(self, rows, old_state, new_state, old_rules, old_modes) -> List[DecisionChange]:
+        old_rule = old_rules[old_state]
+        new_rule = self._rule_table[new_state]
+        # A rulebook swap can change the mode of a rule that still fires.
+        changed = (old_rule != new_rule) | (old_modes[old_state] != self._mode_table[new_state])
+        version = self.rulebook.version
+        return [
+            DecisionChange(
+                self._ids[row],
+                RESPONSE_MODE_CODES[old_mode],
+                RESPONSE_MODE_CODES[new_mode],
+                RULE_CODES[before],
+                RULE_CODES[after],
+                version,
+            )
+            for row, before, after, old_mode, new_mode in zip(
+                rows[changed].tolist(),
+                old_rule[changed].tolist(),
+                new_rule[changed].tolist(),
+                old_modes[old_state[changed]].tolist(),
+                self._mode_table[new_state[changed]].tolist(),
+            )
+        ]
+
+    def set_rulebook(self, rulebook: Optional[Rulebook] = None) -> List[DecisionChange]:
+        """
+        Re-decide every open incident under a new rulebook.
+
+        Args:
+            rulebook: Rulebook to switch to (default: the active rulebook)
+
+        Returns:
+            DecisionChange for every incident whose rule or mode changed
+        """
+        old_rules, old_modes = self._rule_table, self._mode_table
+        self.rulebook = rulebook if rulebook is not None else get_rulebook()
+        self._rule_table, self._mode_table = _state_tables(self.rulebook)
+
+        rows = np.arange(self._size)
+        old_state = self._state[rows].copy()
+        new_state = self._refresh(rows)
+        self._state[rows] = new_state
+        self.rows_reevaluated += self._size
+        return self._changes(rows, old_state, new_state, old_rules, old_modes)
+
+    def decision(self, incident_id: Any) -> DispatchResult:
+        """Full DispatchResult for an open incident from its stored inputs."""
+        row = self._index[incident_id]
+        return self.rulebook.evaluate(
+            float(self._weather[row]), float(self._harm[row]),
+            float(self._ground[row]), float(self._air[row]),
+        )
+
+    def rule_of(self, incident_id: Any) -> str:
+        """Current rule for an open incident, from the stored boundary state."""
+        return RULE_CODES[self._rule_table[self._state[self._index[incident_id]]]]
+
+    def margins(self, incident_id: Any) -> Dict[str, float]:
+        """
+        Signed distance of an incident's inputs from each rule boundary.
+
+        Positive means the condition holds; the absolute value is how far the
+        input must move (percentage points or minutes) to cross.
+        """
+        row = self._index[incident_id]
+        return {
+            "weather": float(self._weather_margin[row]),
+            "harm": float(self._harm_margin[row]),
+            "efficiency": float(self._efficiency_margin[row]),
+        }
+
+    def boundary_distance(self) -> np.ndarray:
+        """Smallest absolute margin per open incident (storage order)."""
+        n = self._size
+        return np.minimum.reduce([
+            np.abs(self._weather_margin[:n]),
+            np.abs(self._harm_margin[:n]),
+            np.abs(self._efficiency_margin[:n]),
+        ])
@@ -0,0 +1,293 @@
+"""
+Uncertainty-Aware Dispatch Module
+Monte Carlo version of dispatch() for inputs known only as estimates.
+
+Each input (weather risk, harm threshold, ground ETA, air ETA) may be a point
+value, a (mean, spread) pair or an explicit InputDistribution. Samples are
+drawn with a seeded NumPy generator and pushed through dispatch_batch(), so
+every sample follows exactly the same rules as the scalar engine. Work is
+done in vectorized chunks under a wall-clock budget so a call stays inside
+the per-decision latency envelope (<100ms per more_info.md).
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .dispatch_engine import (
+    RESPONSE_MODE_CODES,
+    RULE_CODES,
+    Rulebook,
+    dispatch_batch,
+    get_rulebook,
+    is_air_response_mode,
+)
+
+
+DistributionKind = Literal["point", "normal", "uniform", "triangular", "lognormal", "empirical"]
+
+
+DEFAULT_SAMPLES = 10_000
+DEFAULT_TIME_BUDGET_MS = 50.0
+DEFAULT_CHUNK_SIZE = 131_072
+# First chunk of a budgeted run; chunks then double up to chunk_size.
+INITIAL_CHUNK_SIZE = 8_192
+
+
+# Physical bounds applied after sampling: (low, high) per input.
+WEATHER_BOUNDS = (0.0, 100.0)
+MINUTES_BOUNDS = (0.0, np.inf)
+
+
+def lognormal_parameters(mean: float, std: float) -> Tuple[float, float]:
+    """
+    (mu, sigma) of the underlying normal for a lognormal with the given
+    mean and standard deviation, so the point estimate stays the mean
+    (mu is below log(mean) by sigma^2 / 2).
+
+    Raises:
+        ValueError: If mean is not positive or std is negative
+
+    Examples:
+        >>> mu, sigma = lognormal_parameters(20.0, 5.0)
+        >>> round(float(np.exp(mu + sigma ** 2 / 2)), 9)
+        20.0
+    """
+    if not mean > 0 or not std >= 0:
+        raise ValueError(f"Lognormal needs mean > 0 and std >= 0, got ({mean}, {std})")
+    sigma2 = np.log1p((std / mean) ** 2)
+    return float(np.log(mean) - sigma2 / 2), float(np.sqrt(sigma2))
+
+
+@dataclass(frozen=True)
+class InputDistribution:
+    """
+    Distribution of one dispatch input.
+
+    Attributes:
+        kind: point, normal, uniform, triangular, lognormal or empirical
+        params: Parameters for the kind:
+            point: (value,)
+            normal: (mean, std)
+            uniform: (low, high)
+            triangular: (low, mode, high)
+            lognormal: (mean, std) of the value itself, not of its log
+            empirical: observed values, resampled with replacement
+    """
+    kind: DistributionKind
+    params: Tuple[float, ...]
+
+    @classmethod
+    def point(cls, value: float) -> "InputDistribution":
+        return cls("point", (float(value),))
+
+    @classmethod
+    def normal(cls, mean: float, std: float) -> "InputDistribution":
+        return cls("normal", (float(mean), float(std)))
+
+    @classmethod
+    def uniform(cls, low: float, high: float) -> "InputDistribution":
+        return cls("uniform", (float(low), float(high)))
+
+    @classmethod
+    def triangular(cls, low: float, mode: float, high: float) -> "InputDistribution":
+        return cls("triangular", (float(low), float(mode), float(high)))
+
+    @classmethod
+    def lognormal(cls, mean: float, std: float) -> "InputDistribution":
+        lognormal_parameters(mean, std)
+        return cls("lognormal", (float(mean), float(std)))
+
+    @classmethod
+    def empirical(cls, values: Sequence[float]) -> "InputDistribution":
+        return cls("empirical", tuple(float(v) for v in values))
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Draw n samples as a float64 array."""
+        p = self.params
+        if self.kind == "point":
+            return np.full(n, p[0])
+        if self.kind == "normal":
+            return rng.normal(p[0], p[1], n)
+        if self.kind == "uniform":
+            return rng.uniform(p[0], p[1], n)
+        if self.kind == "triangular":
+            return rng.triangular(p[0], p[1], p[2], n)
+        if self.kind == "lognormal":
+            return rng.lognormal(*lognormal_parameters(*p), n)
+        if self.kind == "empirical":
+            return rng.choice(np.asarray(p), n)
+        raise ValueError(f"Unknown distribution kind: {self.kind}")
+
+
+InputSpec = Union[float, int, Tuple[float, float], InputDistribution]
+
+
+def as_distribution(spec: InputSpec) -> InputDistribution:
+    """
+    Coerce an input spec to an InputDistribution.
+
+    Args:
+        spec: Point value, (mean, spread) tuple read as a normal
+            distribution, or an InputDistribution
+
+    Returns:
+        InputDistribution
+
+    Raises:
+        ValueError: If the spec cannot be interpreted
+    """
+    if isinstance(spec, InputDistribution):
+        return spec
+    if isinstance(spec, (int, float, np.number)):
+        return InputDistribution.point(spec)
+    if isinstance(spec, tuple) and len(spec) == 2:
+        mean, spread = spec
+        if spread <= 0:
+            return InputDistribution.point(mean)
+        return InputDistribution.normal(mean, spread)
+    raise ValueError(f"Unsupported input spec: {spec!r}")
+
+
+@dataclass
+class ProbabilisticDispatchResult:
+    """
+    Outcome probabilities of a Monte Carlo dispatch run.
+
+    Attributes:
+        mode_probabilities: Response mode -> probability
+        rule_probabilities: Rule -> probability
+        most_likely_mode: Mode with the highest probability
+        most_likely_rule: Rule with the highest probability
+        air_response_probability: Probability of any aerial deployment
+        n_samples: Samples actually evaluated
+        n_requested: Samples requested
+        truncated: True when the time budget stopped sampling early
+        elapsed_ms: Wall-clock time of the run
+        seed: Seed used for the generator
+        rulebook_version: Version of the rulebook used for every sample
+    """
+    mode_probabilities: Dict[str, float]
+    rule_probabilities: Dict[str, float]
+    most_likely_mode: str
+    most_likely_rule: str
+    air_response_probability: float
+    n_samples: int
+    n_requested: int
+    truncated: bool
+    elapsed_ms: float
+    seed: Optional[int] = None
+    rulebook_version: int = 0
+
+    @property
+    def standard_error(self) -> float:
+        """Worst-case binomial standard error of the reported probabilities."""
+        return 0.5 / np.sqrt(self.n_samples) if self.n_samples else 1.0
+
+
+def dispatch_probabilistic(
+    weather_risk_pct: InputSpec,
+    harm_threshold_min: InputSpec,
+    ground_eta_min: InputSpec,
+    air_eta_min: InputSpec,
+    n_samples: int = DEFAULT_SAMPLES,
+    seed: Optional[int] = None,
+    time_budget_ms: Optional[float] = DEFAULT_TIME_BUDGET_MS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rulebook: Optional[Rulebook] = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> ProbabilisticDispatchResult:
+    """
+    Estimate dispatch outcome probabilities under input uncertainty.
+
+    Samples are drawn and evaluated in vectorized chunks of chunk_size (one
+    pass when n_samples <= chunk_size). With a time budget the first chunk
+    is at most INITIAL_CHUNK_SIZE and each next chunk doubles up to
+    chunk_size; before each further chunk the time it would take, at the
+    per-sample rate measured so far, is checked against the remaining
+    budget. At least one chunk is always evaluated. With a fixed seed the
+    result is reproducible unless the budget truncates the run.
+
+    Args:
+        weather_risk_pct: Weather risk spec (clipped to 0-100)
+        harm_threshold_min: Harm threshold spec (clipped to >= 0)
+        ground_eta_min: Ground ETA spec (clipped to >= 0)
+        air_eta_min: Air ETA spec (clipped to >= 0)
+        n_samples: Number of Monte Carlo samples
+        seed: Seed for numpy.random.default_rng
+        time_budget_ms: Wall-clock budget, or None for no limit
+        chunk_size: Samples per vectorized pass
+        rulebook: Rulebook to evaluate (default: the active rulebook, read
+            once so a concurrent swap cannot mix rule sets within a run)
+        clock: Time source in seconds for the budget and elapsed_ms
+
+    Returns:
+        ProbabilisticDispatchResult with mode and rule probabilities
+
+    Raises:
+        ValueError: If n_samples or chunk_size is not positive
+
+    Examples:
+        >>> r = dispatch_probabilistic((30.0, 5.0), 15, (22.0, 4.0), 3.6, seed=1)
+        >>> round(sum(r.mode_probabilities.values()), 6)
+        1.0
+    """
+    if n_samples <= 0 or chunk_size <= 0:
+        raise ValueError("n_samples and chunk_size must be positive")
+
+    start = clock()
+    deadline = start + time_budget_ms / 1000.0 if time_budget_ms is not None else None
+
+    rulebook = rulebook if rulebook is not None else get_rulebook()
+    rng = np.random.default_rng(seed)
+    inputs = [
+        (as_distribution(weather_risk_pct), WEATHER_BOUNDS),
+        (as_distribution(harm_threshold_min), MINUTES_BOUNDS),
+        (as_distribution(ground_eta_min), MINUTES_BOUNDS),
+        (as_distribution(air_eta_min), MINUTES_BOUNDS),
+    ]
+
+    rule_counts = np.zeros(len(RULE_CODES), dtype=np.int64)
+    mode_counts = np.zeros(len(RESPONSE_MODE_CODES), dtype=np.int64)
+    done = 0
+    truncated = False
+
+    size = chunk_size if deadline is None else min(chunk_size, INITIAL_CHUNK_SIZE)
+    while done < n_samples:
+        size = min(size, n_samples - done)
+        chunk_start = clock()
+
+        columns = [np.clip(dist.sample(rng, size), *bounds) for dist, bounds in inputs]
+        batch = dispatch_batch(*columns, rulebook=rulebook)
+        rule_counts += np.bincount(batch.rule_codes, minlength=len(RULE_CODES))
+        mode_counts += np.bincount(batch.mode_codes, minlength=len(RESPONSE_MODE_CODES))
+        done += size
+
+        if deadline is not None and done < n_samples:
+            now = clock()
+            per_sample = (now - chunk_start) / size
+            size = min(2 * size, chunk_size)
+            if now + per_sample * min(size, n_samples - done) > deadline:
+                truncated = True
+                break
+
+    rule_probabilities = {rule: rule_counts[i] / done for i, rule in enumerate(RULE_CODES)}
+    mode_probabilities = {mode: mode_counts[i] / done for i, mode in enumerate(RESPONSE_MODE_CODES)}
+
+    return ProbabilisticDispatchResult(
+        mode_probabilities={m: float(p) for m, p in mode_probabilities.items()},
+        rule_probabilities={r: float(p) for r, p in rule_probabilities.items()},
+        most_likely_mode=max(mode_probabilities, key=mode_probabilities.get),
+        most_likely_rule=max(rule_probabilities, key=rule_probabilities.get),
+        air_response_probability=float(sum(
+            p for m, p in mode_probabilities.items() if is_air_response_mode(m)
+        )),
+        n_samples=done,
+        n_requested=n_samples,
+        truncated=truncated,
+        elapsed_ms=(clock() - start) * 1000.0,
+        seed=seed,
+        rulebook_version=rulebook.version,
+    )
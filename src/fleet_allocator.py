@@ -0,0 +1,218 @@
+"""
+Fleet Allocator Module
+Assigns a limited number of airborne-ready drones across simultaneous incidents.
+
+dispatch() is stateless and returns BOTH for every incident that qualifies for
+aerial response. When more incidents qualify than drones are available, the
+allocator ranks the qualifying incidents and gives drones to the most urgent:
+
+1. Smallest harm slack first (harm_threshold_min - ground_eta_min); a
+   negative slack means the ambulance alone arrives after irreversible harm.
+2. Ties broken by largest expected time saved (ground_eta_min - air_eta_min).
+3. Remaining ties keep input order.
+
+Incidents that miss out fall back to AMBULANCE and record why. Ranking is a
+single lexsort over the qualifying rows, so a surge batch is O(n log n).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .dispatch_engine import (
+    RESPONSE_MODE_CODES,
+    RULE_CODES,
+    Rulebook,
+    dispatch_batch,
+)
+
+
+FLEET_FALLBACK_REASON = "Drone fleet exhausted - ground ambulance dispatched instead"
+
+
+_AMBULANCE_CODE = RESPONSE_MODE_CODES.index("AMBULANCE")
+_AIR_MODE_CODES = np.array(
+    [RESPONSE_MODE_CODES.index("DOCTOR_DRONE"), RESPONSE_MODE_CODES.index("BOTH")],
+    dtype=np.uint8,
+)
+
+
+@dataclass
+class FleetAllocation:
+    """
+    Columnar result of a fleet-constrained allocation.
+
+    Attributes:
+        incident_ids: Identifier per incident (input order)
+        requested_mode_codes: Mode the rules asked for (RESPONSE_MODE_CODES)
+        mode_codes: Mode after fleet constraints (RESPONSE_MODE_CODES)
+        rule_codes: Rule that fired (RULE_CODES)
+        harm_slack_min: harm_threshold_min - ground_eta_min
+        time_saved_min: ground_eta_min - air_eta_min
+        priority: Rank among incidents requesting a drone (0 = most urgent),
+            -1 for incidents that did not request one
+        drone_assigned: Whether a drone was allocated
+        fleet_fallback: Whether a requested drone was withheld
+        drones_available: Fleet size given to the allocator
+        rulebook_version: Version of the rulebook that made the decisions
+    """
+    incident_ids: List[Any]
+    requested_mode_codes: np.ndarray
+    mode_codes: np.ndarray
+    rule_codes: np.ndarray
+    harm_slack_min: np.ndarray
+    time_saved_min: np.ndarray
+    priority: np.ndarray
+    drone_assigned: np.ndarray
+    fleet_fallback: np.ndarray
+    drones_available: int
+    rulebook_version: int = 0
+
+    def __len__(self) -> int:
+        return len(self.mode_codes)
+
+    @property
+    def drones_assigned(self) -> int:
+        return int(self.drone_assigned.sum())
+
+    @property
+    def fallback_count(self) -> int:
+        return int(self.fleet_fallback.sum())
+
+    def decision(self, index: int) -> Dict[str, Any]:
+        """
+        Build the decision dict for one incident.
+
+        Args:
+            index: Row index in input order
+
+        Returns:
+            Dict with mode, rule, priority and fallback reason (if any)
+        """
+        fallback = bool(self.fleet_fallback[index])
+        return {
+            "incident_id": self.incident_ids[index],
+            "response_mode": RESPONSE_MODE_CODES[self.mode_codes[index]],
+            "requested_mode": RESPONSE_MODE_CODES[self.requested_mode_codes[index]],
+            "rule_triggered": RULE_CODES[self.rule_codes[index]],
+            "drone_assigned": bool(self.drone_assigned[index]),
+            "priority": int(self.priority[index]),
+            "harm_slack_min": float(self.harm_slack_min[index]),
+            "time_saved_min": float(self.time_saved_min[index]),
+            "fleet_fallback": fallback,
+            "fallback_reason": FLEET_FALLBACK_REASON if fallback else None,
+        }
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Decision dicts for every incident, in input order."""
+        return [self.decision(i) for i in range(len(self))]
+
+
+def allocate_fleet_columns(
+    weather_risk_pct,
+    harm_threshold_min,
+    ground_eta_min,
+    air_eta_min,
+    drones_available: int,
+    incident_ids: Optional[Sequence[Any]] = None,
+    rulebook: Optional[Rulebook] = None,
+) -> FleetAllocation:
+    """
+    Allocate drones across incidents given as columns.
+
+    Args:
+        weather_risk_pct: Array-like weather risk per incident
+        harm_threshold_min: Array-like harm threshold per incident
+        ground_eta_min: Array-like ground ETA per incident
+        air_eta_min: Array-like air ETA per incident
+        drones_available: Number of airborne-ready drones
+        incident_ids: Optional identifiers (default: row index)
+        rulebook: Rulebook to evaluate (default: the active rulebook)
+
+    Returns:
+        FleetAllocation in input order
+
+    Raises:
+        ValueError: If drones_available is negative
+    """
+    if drones_available < 0:
+        raise ValueError(f"drones_available must be >= 0, got {drones_available}")
+
+    batch = dispatch_batch(
+        weather_risk_pct, harm_threshold_min, ground_eta_min, air_eta_min, rulebook=rulebook
+    )
+    n = len(batch)
+
+    harm = np.broadcast_to(np.asarray(harm_threshold_min, dtype=np.float64), (n,))
+    ground = np.broadcast_to(np.asarray(ground_eta_min, dtype=np.float64), (n,))
+    harm_slack = harm - ground
+    time_saved = batch.time_delta_min
+
+    requested = np.isin(batch.mode_codes, _AIR_MODE_CODES)
+    candidates = np.flatnonzero(requested)
+
+    # lexsort sorts by the last key first and is stable, so input order
+    # breaks remaining ties.
+    order = candidates[np.lexsort((-time_saved[candidates], harm_slack[candidates]))]
+
+    priority = np.full(n, -1, dtype=np.int64)
+    priority[order] = np.arange(len(order))
+
+    drone_assigned = np.zeros(n, dtype=bool)
+    drone_assigned[order[:drones_available]] = True
+    fleet_fallback = requested & ~drone_assigned
+
+    mode_codes = batch.mode_codes.copy()
+    mode_codes[fleet_fallback] = _AMBULANCE_CODE
+
+    return FleetAllocation(
+        incident_ids=list(incident_ids) if incident_ids is not None else list(range(n)),
+        requested_mode_codes=batch.mode_codes,
+        mode_codes=mode_codes,
+        rule_codes=batch.rule_codes,
+        harm_slack_min=harm_slack,
+        time_saved_min=time_saved,
+        priority=priority,
+        drone_assigned=drone_assigned,
+        fleet_fallback=fleet_fallback,
+        drones_available=drones_available,
+        rulebook_version=batch.rulebook_version,
+    )
+
+
+def allocate_fleet(
+    incidents: Sequence[Dict[str, Any]],
+    drones_available: int,
+) -> FleetAllocation:
+    """
+    Allocate drones across simultaneous incidents.
+
+    Args:
+        incidents: Dicts with weather_risk_pct, harm_threshold_min,
+            ground_eta_min and air_eta_min (as produced by data_loader),
+            plus an optional incident_id
+        drones_available: Number of airborne-ready drones
+
+    Returns:
+        FleetAllocation in input order
+
+    Examples:
+        >>> incidents = [
+        ...     {"incident_id": "A", "weather_risk_pct": 10, "harm_threshold_min": 4,
+        ...      "ground_eta_min": 20, "air_eta_min": 3.6},
+        ...     {"incident_id": "B", "weather_risk_pct": 10, "harm_threshold_min": 4,
+        ...      "ground_eta_min": 28, "air_eta_min": 3.6},
+        ... ]
+        >>> allocation = allocate_fleet(incidents, drones_available=1)
+        >>> [d["response_mode"] for d in allocation.to_records()]
+        ['AMBULANCE', 'BOTH']
+    """
+    return allocate_fleet_columns(
+        [i["weather_risk_pct"] for i in incidents],
+        [i["harm_threshold_min"] for i in incidents],
+        [i["ground_eta_min"] for i in incidents],
+        [i["air_eta_min"] for i in incidents],
+        drones_available=drones_available,
+        incident_ids=[i.get("incident_id", idx) for idx, i in enumerate(incidents)],
+    )
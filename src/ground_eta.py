@@ -0,0 +1,268 @@
+"""
+Ground ETA Module
+Traffic-aware ambulance ETA estimates for dispatch() inputs.
+
+Travel time is dispatch overhead plus road distance over the effective speed,
+where the effective speed is the road class's free-flow speed scaled by a
+traffic flow factor (1.0 = free flow) and floored at a crawl speed:
+
+    eta_min = DISPATCH_OVERHEAD_MIN + road_km / max(free_flow_kmh * flow, MIN_SPEED_KMH) * 60
+
+The flow factor is either observed (traffic_level_pct in scenarios.json,
+traffic_flow in cases_send_decision.json) or taken from hourly profiles per
+road class. Profiles are folded into a (24 x road class) minutes-per-km
+table once at import, so an estimate is one table lookup and a multiply,
+and whole batches are a single NumPy gather.
+
+Constants are calibrated on the reference data: a 4.8 km arterial route from
+the Al Ghadir station reproduces the scenario ground times (10.1 / 17.5 /
+28.4 min at flow 0.9 / 0.5 / 0.3) and the 29.8 min congestion cap in the
+cases.
+"""
+
+import math
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+
+ROAD_CLASSES = ("highway", "arterial", "local")
+
+FREE_FLOW_SPEED_KMH = {
+    "highway": 80.0,
+    "arterial": 35.0,
+    "local": 25.0,
+}
+
+# Traffic flow factor per hour of day (0 = midnight), 1.0 = free flow.
+HOURLY_FLOW = {
+    "highway": (
+        0.95, 0.95, 0.95, 0.95, 0.95, 0.9, 0.75, 0.5, 0.45, 0.6, 0.7, 0.65,
+        0.65, 0.65, 0.7, 0.55, 0.4, 0.35, 0.35, 0.5, 0.65, 0.75, 0.85, 0.9,
+    ),
+    "arterial": (
+        0.9, 0.9, 0.9, 0.9, 0.9, 0.85, 0.7, 0.45, 0.4, 0.5, 0.55, 0.5,
+        0.5, 0.5, 0.55, 0.45, 0.35, 0.3, 0.3, 0.4, 0.5, 0.6, 0.75, 0.85,
+    ),
+    "local": (
+        0.95, 0.95, 0.95, 0.95, 0.95, 0.9, 0.8, 0.6, 0.55, 0.65, 0.7, 0.65,
+        0.6, 0.6, 0.65, 0.6, 0.5, 0.45, 0.45, 0.55, 0.65, 0.75, 0.85, 0.9,
+    ),
+}
+
+MIN_SPEED_KMH = 10.0
+DISPATCH_OVERHEAD_MIN = 1.0
+
+# Road distance from the Al Ghadir station to the reference incident area.
+DEFAULT_ROUTE_KM = 4.8
+
+# Road distance over straight-line distance for the Riyadh street grid.
+ROAD_DETOUR_FACTOR = 1.3
+
+DEFAULT_ROAD_CLASS = "arterial"
+
+
+def _minutes_per_km(flow, free_flow_kmh):
+    return 60.0 / np.maximum(free_flow_kmh * flow, MIN_SPEED_KMH)
+
+
+# Precomputed lookup: MINUTES_PER_KM[hour, ROAD_CLASSES.index(road_class)]
+MINUTES_PER_KM = np.column_stack([
+    _minutes_per_km(np.asarray(HOURLY_FLOW[rc]), FREE_FLOW_SPEED_KMH[rc]) for rc in ROAD_CLASSES
+])
+MINUTES_PER_KM.setflags(write=False)
+
+_FREE_FLOW = np.array([FREE_FLOW_SPEED_KMH[rc] for rc in ROAD_CLASSES])
+
+_TIME_PATTERN = re.compile(r"(\d{1,2})(?::(\d{2}))?\s*([AaPp][Mm])?")
+
+
+def parse_hour(time_of_day: Union[str, int, datetime, None]) -> Optional[int]:
+    """
+    Hour of day (0-23) from a time_of_day field.
+
+    Args:
+        time_of_day: e.g. "5:00 PM (Rush)", "17:30", 17 or a datetime
+
+    Returns:
+        Hour, or None when the value cannot be parsed
+
+    Examples:
+        >>> parse_hour("5:00 PM (Rush)")
+        17
+        >>> parse_hour("12:00 AM")
+        0
+    """
+    if time_of_day is None:
+        return None
+    if isinstance(time_of_day, datetime):
+        return time_of_day.hour
+    if isinstance(time_of_day, (int, np.integer)):
+        return int(time_of_day) % 24
+
+    match = _TIME_PATTERN.search(str(time_of_day))
+    if not match:
+        return None
+    hour = int(match.group(1))
+    meridiem = (match.group(3) or "").lower()
+    if meridiem == "pm" and hour < 12:
+        hour += 12
+    elif meridiem == "am" and hour == 12:
+        hour = 0
+    return hour if 0 <= hour < 24 else None
+
+
+def _road_class_code(road_class: str) -> int:
+    try:
+        return ROAD_CLASSES.index(road_class)
+    except ValueError:
+        raise ValueError(f"Unknown road class: {road_class!r} (expected one of {ROAD_CLASSES})")
+
+
+def estimate_ground_eta(
+    distance_km: float = DEFAULT_ROUTE_KM,
+    hour: Optional[int] = None,
+    road_class: str = DEFAULT_ROAD_CLASS,
+    traffic_flow: Optional[float] = None,
+) -> float:
+    """
+    Estimate the ground ambulance ETA for one incident.
+
+    Args:
+        distance_km: Road distance to the patient
+        hour: Hour of day for the profile lookup (default: current hour)
+        road_class: One of ROAD_CLASSES
+        traffic_flow: Observed flow factor (0-1); overrides the hourly profile
+            unless None or NaN
+
+    Returns:
+        ETA in minutes, rounded to 0.1
+
+    Raises:
+        ValueError: If road_class is unknown or distance is negative
+
+    Examples:
+        >>> estimate_ground_eta(4.8, traffic_flow=0.5)
+        17.5
+        >>> estimate_ground_eta(4.8, hour=2)
+        10.1
+    """
+    if distance_km < 0:
+        raise ValueError(f"distance_km must be >= 0, got {distance_km}")
+    code = _road_class_code(road_class)
+
+    if traffic_flow is not None and not math.isnan(traffic_flow):
+        minutes_per_km = 60.0 / max(FREE_FLOW_SPEED_KMH[road_class] * traffic_flow, MIN_SPEED_KMH)
+    else:
+        if hour is None:
+            hour = datetime.now().hour
+        minutes_per_km = MINUTES_PER_KM[hour % 24, code]
+
+    return round(DISPATCH_OVERHEAD_MIN + distance_km * float(minutes_per_km), 1)
+
+
+def estimate_ground_eta_batch(
+    distance_km,
+    hours=None,
+    road_classes: Union[str, Sequence[str], np.ndarray] = DEFAULT_ROAD_CLASS,
+    traffic_flow=None,
+) -> np.ndarray:
+    """
+    Vectorized estimate_ground_eta() over columns of incidents.
+
+    Arguments broadcast against each other. Road classes may be names or
+    integer codes into ROAD_CLASSES. NaN entries in traffic_flow fall back
+    to the hourly profile.
+
+    Args:
+        distance_km: Array-like road distances
+        hours: Array-like hours of day (default: current hour)
+        road_classes: Road class name(s) or code(s)
+        traffic_flow: Array-like observed flow factors, or None
+
+    Returns:
+        Array of ETAs in minutes, rounded to 0.1
+
+    Examples:
+        >>> estimate_ground_eta_batch(4.8, traffic_flow=[0.9, 0.5, 0.3]).tolist()
+        [10.1, 17.5, 28.4]
+    """
+    distance = np.asarray(distance_km, dtype=np.float64)
+    if hours is None:
+        hours = datetime.now().hour
+    hours = np.asarray(hours, dtype=np.intp) % 24
+
+    codes = np.asarray(road_classes)
+    if codes.dtype.kind in "US":
+        lookup = {rc: i for i, rc in enumerate(ROAD_CLASSES)}
+        try:
+            codes = np.vectorize(lookup.__getitem__, otypes=[np.intp])(codes)
+        except KeyError as e:
+            raise ValueError(f"Unknown road class: {e.args[0]!r} (expected one of {ROAD_CLASSES})")
+    codes = codes.astype(np.intp)
+
+    minutes_per_km = MINUTES_PER_KM[hours, codes]
+    if traffic_flow is not None:
+        flow = np.asarray(traffic_flow, dtype=np.float64)
+        observed = _minutes_per_km(flow, _FREE_FLOW[codes])
+        minutes_per_km = np.where(np.isnan(flow), minutes_per_km, observed)
+
+    return np.round(DISPATCH_OVERHEAD_MIN + distance * minutes_per_km, 1)
+
+
+def ground_eta_for_record(
+    record: Dict[str, Any],
+    distance_km: float = DEFAULT_ROUTE_KM,
+    road_class: str = DEFAULT_ROAD_CLASS,
+) -> float:
+    """
+    Derive ground_eta_min for a normalized scenario or case.
+
+    Uses the observed flow (traffic_level_pct or traffic_flow) when present,
+    otherwise the profile for the record's time_of_day.
+
+    Args:
+        record: Dict from load_scenarios() or load_cases()
+        distance_km: Road distance to the patient
+        road_class: One of ROAD_CLASSES
+
+    Returns:
+        ETA in minutes, rounded to 0.1
+    """
+    flow = record.get("traffic_level_pct", record.get("traffic_flow"))
+    hour = parse_hour(record.get("time_of_day"))
+    return estimate_ground_eta(
+        distance_km,
+        hour=hour,
+        road_class=road_class,
+        traffic_flow=float(flow) if flow is not None else None,
+    )
+
+
+def road_distance_km(straight_line_km) -> Union[float, np.ndarray]:
+    """Approximate road distance from a straight-line (haversine) distance."""
+    if isinstance(straight_line_km, (int, float)):
+        return straight_line_km * ROAD_DETOUR_FACTOR
+    return np.asarray(straight_line_km, dtype=np.float64) * ROAD_DETOUR_FACTOR
+
+
+if __name__ == "__main__":
+    from .data_loader import load_cases, load_scenarios
+
+    print("=" * 80)
+    print("GROUND ETA ESTIMATES VS REFERENCE DATA")
+    print("=" * 80)
+
+    for s in load_scenarios():
+        print(f"  Scenario {s['scenario_id']} ({s['time_of_day']}, flow {s['traffic_level_pct']}): "
+              f"reference {s['ground_eta_min']:5.1f}  estimated {ground_eta_for_record(s):5.1f}")
+    for c in load_cases():
+        print(f"  Case {c['case_id']:2} (flow {c['traffic_flow']}): "
+              f"reference {c['ground_eta_min']:5.1f}  estimated {ground_eta_for_record(c):5.1f}")
+
+    print("\nHourly arterial ETA for 4.8 km:")
+    etas = estimate_ground_eta_batch(DEFAULT_ROUTE_KM, np.arange(24))
+    for hour, eta in enumerate(etas):
+        print(f"  {hour:02d}:00  {eta:5.1f} min")
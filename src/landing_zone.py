@@ -5,6 +5,9 @@ Finds the nearest drone landing zones to patient location in Al Ghadir, Riyadh.
 Uses the Haversine formula for accurate great-circle distance calculation
 on Earth's surface, accounting for the spherical shape of the planet.
 
+The functions here scan every zone; for large catalogues
+zone_index.LandingZoneIndex answers the same queries from a prebuilt index.
+
 Default patient location: 7319 Al Humaid St, Al Ghadir
 Coordinates: 24.7745°N, 46.6575°E (from D1.md specification)
 """
@@ -202,6 +205,34 @@ def bearing_to_cardinal(bearing: float) -> str:
 
 
 
+def zone_result(
+    zone: Dict,
+    distance_km: float,
+    patient_lat: float,
+    patient_lon: float,
+) -> LandingZoneResult:
+    """
+    Build the LandingZoneResult for one zone at a known distance.
+    
+    Bearing and flight time are computed here, so callers only pay for
+    them on the zones they return.
+    """
+    zone_lat = zone.get("latitude", 0)
+    zone_lon = zone.get("longitude", 0)
+    bearing = calculate_bearing(patient_lat, patient_lon, zone_lat, zone_lon)
+    flight_time = estimate_flight_time(distance_km)
+    
+    return LandingZoneResult(
+        name=zone.get("name", "Unknown Zone"),
+        latitude=zone_lat,
+        longitude=zone_lon,
+        area=zone.get("area", "Unknown"),
+        distance_km=round(distance_km, 2),
+        bearing=round(bearing, 1),
+        estimated_flight_time=round(flight_time, 1),
+    )
+
+
 def find_nearest_zone(
     zones: List[Dict],
     patient_lat: float = DEFAULT_PATIENT_LAT,
@@ -234,7 +265,7 @@ def find_nearest_zone(
     if not _validate_coordinates(patient_lat, patient_lon):
         logger.warning(f"Invalid patient coordinates: {patient_lat}, {patient_lon}")
     
-    nearest = None
+    best_zone = None
     min_distance = float('inf')
     
     for zone in zones:
@@ -251,20 +282,12 @@ def find_nearest_zone(
         
         if distance < min_distance:
             min_distance = distance
-            
-            
-            bearing = calculate_bearing(patient_lat, patient_lon, zone_lat, zone_lon)
-            flight_time = estimate_flight_time(distance)
-            
-            nearest = LandingZoneResult(
-                name=zone.get("name", "Unknown Zone"),
-                latitude=zone_lat,
-                longitude=zone_lon,
-                area=zone.get("area", "Unknown"),
-                distance_km=round(distance, 2),
-                bearing=round(bearing, 1),
-                estimated_flight_time=round(flight_time, 1),
-            )
+            best_zone = zone
+    
+    
+    nearest = None
+    if best_zone is not None:
+        nearest = zone_result(best_zone, min_distance, patient_lat, patient_lon)
     
     if nearest:
         logger.info(f"Nearest zone: {nearest.name} at {nearest.distance_km} km")
@@ -301,18 +324,7 @@ def get_all_zones_sorted(
             continue
         
         distance = haversine_distance(patient_lat, patient_lon, zone_lat, zone_lon)
-        bearing = calculate_bearing(patient_lat, patient_lon, zone_lat, zone_lon)
-        flight_time = estimate_flight_time(distance)
-        
-        results.append(LandingZoneResult(
-            name=zone.get("name", "Unknown Zone"),
-            latitude=zone_lat,
-            longitude=zone_lon,
-            area=zone.get("area", "Unknown"),
-            distance_km=round(distance, 2),
-            bearing=round(bearing, 1),
-            estimated_flight_time=round(flight_time, 1),
-        ))
+        results.append(zone_result(zone, distance, patient_lat, patient_lon))
     
     return sorted(results, key=lambda z: z.distance_km)
 
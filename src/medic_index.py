@@ -0,0 +1,162 @@
+"""
+Medic Spatial Index
+Uniform latitude/longitude grid over roster positions for MedicMatcher.
+
+MedicMatcher measures distance as planar degrees x 111 km, so square cells in
+degrees bound that distance exactly: after visiting every cell within
+Chebyshev radius r of the patient's cell, every unvisited medic is at least
+as far as the nearest part of the occupied bounds outside that (2r + 1)^2
+block. The matcher expands rings until that bound proves no unvisited medic
+can enter its top-k.
+"""
+
+import math
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+KM_PER_DEGREE = 111
+
+# Cell size is chosen so the average occupied cell holds about this many medics.
+TARGET_MEDICS_PER_CELL = 16
+MIN_CELL_DEG = 1e-4
+
+# Slack for floating-point error at cell edges (degrees).
+_EDGE_EPSILON_DEG = 1e-9
+
+
+Cell = Tuple[int, int]
+
+
+def cell_deg_for(n: int, lat_span: float, lon_span: float) -> float:
+    """Cell edge giving about TARGET_MEDICS_PER_CELL medics per cell over a bounding box."""
+    if n <= TARGET_MEDICS_PER_CELL:
+        return 1.0
+    area = max(lat_span, MIN_CELL_DEG) * max(lon_span, MIN_CELL_DEG)
+    return max(math.sqrt(area * TARGET_MEDICS_PER_CELL / n), MIN_CELL_DEG)
+
+
+class MedicGridIndex:
+    """
+    Grid of roster positions (indexes into MedicDatabase.medics) by cell.
+
+    Attributes:
+        cell_deg: Cell edge length in degrees
+        cells: (row, col) -> roster positions, in roster order when built
+    """
+
+    def __init__(self, locations: Sequence[Tuple[float, float]], cell_deg: Optional[float] = None):
+        """
+        Args:
+            locations: (lat, lon) per roster position
+            cell_deg: Cell edge in degrees (default: sized from roster density)
+        """
+        self.cell_deg = cell_deg if cell_deg is not None else self._auto_cell_deg(locations)
+        self.cells: Dict[Cell, List[int]] = {}
+        self._bounds: Optional[List[int]] = None
+        for position, location in enumerate(locations):
+            self.insert(position, location)
+
+    @staticmethod
+    def _auto_cell_deg(locations: Sequence[Tuple[float, float]]) -> float:
+        if len(locations) <= TARGET_MEDICS_PER_CELL:
+            return 1.0
+        lats = [loc[0] for loc in locations]
+        lons = [loc[1] for loc in locations]
+        return cell_deg_for(len(locations), max(lats) - min(lats), max(lons) - min(lons))
+
+    def cell_of(self, location: Tuple[float, float]) -> Cell:
+        return (math.floor(location[0] / self.cell_deg), math.floor(location[1] / self.cell_deg))
+
+    def insert(self, position: int, location: Tuple[float, float]) -> None:
+        """Add a roster position at a location."""
+        cell = self.cell_of(location)
+        self.cells.setdefault(cell, []).append(position)
+        if self._bounds is None:
+            self._bounds = [cell[0], cell[0], cell[1], cell[1]]
+        else:
+            b = self._bounds
+            b[0], b[1] = min(b[0], cell[0]), max(b[1], cell[0])
+            b[2], b[3] = min(b[2], cell[1]), max(b[3], cell[1])
+
+    def remove(self, position: int, location: Tuple[float, float]) -> None:
+        """Remove a roster position previously inserted at location."""
+        cell = self.cell_of(location)
+        bucket = self.cells[cell]
+        bucket.remove(position)
+        if not bucket:
+            del self.cells[cell]
+
+    def move(self, position: int, old: Tuple[float, float], new: Tuple[float, float]) -> None:
+        """Re-bucket a roster position after its location changed."""
+        if self.cell_of(old) != self.cell_of(new):
+            self.remove(position, old)
+            self.insert(position, new)
+
+    def _ring_positions(self, row: int, col: int, r: int) -> List[int]:
+        """Positions in the cells at Chebyshev distance exactly r from (row, col)."""
+        positions: List[int] = []
+        if r == 0:
+            positions.extend(self.cells.get((row, col), ()))
+            return positions
+        # Only the part of the ring inside the occupied bounds can hold medics.
+        min_row, max_row, min_col, max_col = self._bounds
+        cols = range(max(col - r, min_col), min(col + r, max_col) + 1)
+        for ring_row in (row - r, row + r):
+            if min_row <= ring_row <= max_row:
+                for c in cols:
+                    positions.extend(self.cells.get((ring_row, c), ()))
+        rows = range(max(row - r + 1, min_row), min(row + r - 1, max_row) + 1)
+        for ring_col in (col - r, col + r):
+            if min_col <= ring_col <= max_col:
+                for dr in rows:
+                    positions.extend(self.cells.get((dr, ring_col), ()))
+        return positions
+
+    def rings(self, location: Tuple[float, float]) -> Iterator[Tuple[List[int], float]]:
+        """
+        Visit cells in rings of growing Chebyshev radius around location.
+
+        Rings that do not reach the occupied bounds are skipped, so a
+        location far outside the roster starts at the first ring that can
+        hold medics.
+
+        Yields:
+            (positions in the ring, lower bound in km on the distance of every
+            position not yet yielded); the bound is inf after the last ring
+        """
+        if self._bounds is None:
+            return
+
+        lat, lon = location
+        row, col = self.cell_of(location)
+        c = self.cell_deg
+        min_row, max_row, min_col, max_col = self._bounds
+        first = max(min_row - row, row - max_row, min_col - col, col - max_col, 0)
+        last = max(row - min_row, max_row - row, col - min_col, max_col - col, 0)
+
+        for r in range(first, last + 1):
+            positions = self._ring_positions(row, col, r)
+
+            if r == last:
+                yield positions, math.inf
+                return
+
+            # Unvisited cells inside the bounds: the strips below, above, left
+            # and right of the visited block. Nearest corner, not nearest
+            # edge, when the location is off to the side of the roster.
+            inner_rows = (max(row - r, min_row), min(row + r, max_row))
+            strips = (
+                ((min_row, row - r - 1), (min_col, max_col)),
+                ((row + r + 1, max_row), (min_col, max_col)),
+                (inner_rows, (min_col, col - r - 1)),
+                (inner_rows, (col + r + 1, max_col)),
+            )
+            gap_deg = min(
+                math.hypot(
+                    max(r0 * c - lat, lat - (r1 + 1) * c, 0.0),
+                    max(c0 * c - lon, lon - (c1 + 1) * c, 0.0),
+                )
+                for (r0, r1), (c0, c1) in strips
+                if r0 <= r1 and c0 <= c1
+            )
+            yield positions, max(gap_deg - _EDGE_EPSILON_DEG, 0.0) * KM_PER_DEGREE
@@ -0,0 +1,168 @@
+"""
+Medic Update Ingestion
+Applies the live stream of field-unit GPS and status reports to a roster.
+
+Units report every few seconds, mostly repeating their own previous report,
+so updates are buffered and coalesced per medic: within a window only the
+newest location and the newest status of each medic survive, and reports
+older than what was already applied are dropped. Each flush hands the
+survivors to MedicDatabase.apply_updates(), which holds the database lock
+once for the whole batch and keeps the status buckets, roster arrays,
+spatial index (and, for the SQLite roster, the file) in step. Status
+reports for a medic under a lease are dropped; the lease decides whether
+it goes on a mission or back to available.
+
+Matching stays safe meanwhile: rankers read without the lock and
+match_and_reserve() re-matches when a location change lands during its
+ranking (availability_version), so a moved medic is never reserved on a
+stale position.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_WINDOW_S = 1.0
+
+
+@dataclass
+class MedicUpdate:
+    """One field report; either field may be None."""
+    medic_id: str
+    gps_location: Optional[Tuple[float, float]] = None
+    status: Optional[str] = None
+    timestamp: Optional[float] = None  # report time (default: arrival time)
+
+
+class MedicUpdateIngestor:
+    """
+    Coalescing buffer in front of a MedicDatabase.
+
+    submit() may be called from any number of threads. Buffered updates are
+    applied by flush(), automatically once window_s has passed since the
+    last flush, or every window_s by a background thread (start()/stop()).
+
+    Attributes:
+        submitted: Reports received
+        applied: Changes written to the roster
+        coalesced: Reports superseded by a newer one in the same window
+        stale: Reports older than one already applied, dropped
+    """
+
+    def __init__(self, db, window_s: float = DEFAULT_WINDOW_S, clock=time.monotonic):
+        """
+        Args:
+            db: MedicDatabase to update
+            window_s: Coalescing window in seconds
+            clock: Time source for windows and default report timestamps
+        """
+        self.db = db
+        self.window_s = window_s
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # medic_id -> (timestamp, value) for the newest report in the window
+        self._locations: Dict[str, Tuple[float, Tuple[float, float]]] = {}
+        self._statuses: Dict[str, Tuple[float, str]] = {}
+        # medic_id -> timestamp of the newest applied report, per field
+        self._applied_location_ts: Dict[str, float] = {}
+        self._applied_status_ts: Dict[str, float] = {}
+        self._last_flush = clock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.submitted = 0
+        self.applied = 0
+        self.coalesced = 0
+        self.stale = 0
+
+    def submit(
+        self,
+        medic_id: str,
+        gps_location: Optional[Tuple[float, float]] = None,
+        status: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Buffer one report (flushing first if the window has elapsed)."""
+        self.submit_batch([MedicUpdate(medic_id, gps_location, status, timestamp)])
+
+    def submit_batch(self, updates: Iterable[MedicUpdate]) -> None:
+        """Buffer many reports under one lock acquisition."""
+        now = self.clock()
+        with self._lock:
+            for u in updates:
+                ts = now if u.timestamp is None else u.timestamp
+                self.submitted += 1
+                if u.gps_location is not None:
+                    self._buffer(self._locations, self._applied_location_ts, u.medic_id, ts, u.gps_location)
+                if u.status is not None:
+                    self._buffer(self._statuses, self._applied_status_ts, u.medic_id, ts, u.status)
+        if self._thread is None and now - self._last_flush >= self.window_s:
+            self.flush()
+
+    def _buffer(self, pending: Dict, applied_ts: Dict, medic_id: str, ts: float, value) -> None:
+        if ts < applied_ts.get(medic_id, float("-inf")):
+            self.stale += 1
+            return
+        current = pending.get(medic_id)
+        if current is not None:
+            self.coalesced += 1
+            if ts < current[0]:
+                return
+        pending[medic_id] = (ts, value)
+
+    def flush(self) -> int:
+        """Apply everything buffered; returns the number of changes applied."""
+        # Flushes are serialized so an older batch never lands after a newer one.
+        with self._flush_lock:
+            with self._lock:
+                locations, self._locations = self._locations, {}
+                statuses, self._statuses = self._statuses, {}
+                self._last_flush = self.clock()
+                for medic_id, (ts, _) in locations.items():
+                    self._applied_location_ts[medic_id] = ts
+                for medic_id, (ts, _) in statuses.items():
+                    self._applied_status_ts[medic_id] = ts
+            if not locations and not statuses:
+                return 0
+
+            applied = self.db.apply_updates(
+                {k: v for k, (_, v) in locations.items()},
+                {k: v for k, (_, v) in statuses.items()},
+            )
+            self.applied += applied
+            return applied
+
+    @property
+    def pending(self) -> int:
+        """Changes buffered and not yet applied."""
+        return len(self._locations) + len(self._statuses)
+
+    def start(self) -> None:
+        """Flush every window_s on a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="medic-ingest", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and apply what is left."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.window_s):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Medic update flush failed")
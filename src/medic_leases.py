@@ -0,0 +1,174 @@
+"""
+Medic Leases
+Time-bounded holds on medics between matching and dispatch.
+
+A lease moves a medic from "available" to "reserved", so concurrent matches
+skip it. The holder either confirms it (the medic goes "on_mission") or
+releases it; leases that are neither confirmed nor released before they
+expire put the medic back to "available" on the next release_expired(),
+which MedicMatcher.match_and_reserve() runs before every match.
+
+All state changes happen under the database's lock, through
+MedicDatabase.compare_and_set_status(), so the status buckets, roster
+arrays and availability_version stay consistent with the leases. A store
+shared between processes (medic_store.SQLiteMedicDatabase) implements it
+in the store itself, so two processes cannot lease the same medic. Field
+status reports (MedicDatabase.apply_updates()) skip reserved medics, and
+ending a lease only moves a medic that is still reserved under it.
+"""
+
+import heapq
+import itertools
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+RESERVED = "reserved"
+ON_MISSION = "on_mission"
+AVAILABLE = "available"
+
+
+@dataclass
+class Lease:
+    """A hold on one medic for one incident."""
+    lease_id: str
+    medic_id: str
+    incident_id: str
+    expires_at: float  # on the LeaseBook clock
+
+    def as_dict(self) -> Dict:
+        return asdict(self)
+
+
+class LeaseBook:
+    """
+    Active leases over a MedicDatabase.
+
+    Attributes:
+        leases: lease_id -> Lease, for leases not yet confirmed, released
+            or expired
+    """
+
+    DEFAULT_LEASE_SECONDS = 30.0
+
+    def __init__(self, db, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            db: MedicDatabase whose medics are leased
+            clock: Monotonic time source in seconds
+        """
+        self.db = db
+        self.clock = clock
+        self.leases: Dict[str, Lease] = {}
+        self._by_medic: Dict[str, str] = {}
+        self._expiries: List[Tuple[float, str]] = []
+        self._ids = itertools.count(1)
+
+    def reserve(
+        self,
+        medic_id: str,
+        incident_id: str,
+        lease_seconds: Optional[float] = None,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Lease]:
+        """
+        Lease an available medic.
+
+        Args:
+            medic_id: Medic to hold
+            incident_id: Incident it is held for
+            lease_seconds: Lease length (default: DEFAULT_LEASE_SECONDS)
+            expected_version: Fail if db.availability_version differs
+                (the caller's match may be stale)
+
+        Returns:
+            The Lease, or None if the medic is not available or the
+            version check failed
+        """
+        reserved = self.reserve_first([medic_id], incident_id, lease_seconds, expected_version)
+        return reserved[1] if reserved is not None else None
+
+    def reserve_first(
+        self,
+        medic_ids: Sequence[str],
+        incident_id: str,
+        lease_seconds: Optional[float] = None,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Tuple[int, Lease]]:
+        """
+        Lease the first medic in medic_ids that is still available.
+
+        Returns:
+            (index into medic_ids, Lease), or None if none is available or
+            the version check failed
+        """
+        ttl = self.DEFAULT_LEASE_SECONDS if lease_seconds is None else lease_seconds
+        with self.db.lock:
+            if expected_version is not None and self.db.availability_version != expected_version:
+                return None
+            for index, medic_id in enumerate(medic_ids):
+                # Compare-and-set: with a shared store another process may
+                # have taken the medic since this one last synced.
+                if self.db.compare_and_set_status(medic_id, AVAILABLE, RESERVED):
+                    break
+            else:
+                return None
+
+            lease = Lease(f"LEASE-{next(self._ids)}", medic_id, incident_id, self.clock() + ttl)
+            self.leases[lease.lease_id] = lease
+            self._by_medic[medic_id] = lease.lease_id
+            heapq.heappush(self._expiries, (lease.expires_at, lease.lease_id))
+            return index, lease
+
+    def confirm(self, lease_id: str) -> bool:
+        """
+        Dispatch a leased medic (status "on_mission").
+
+        Returns:
+            False if the lease expired, was released, was superseded by a
+            newer lease on the medic or never existed
+        """
+        with self.db.lock:
+            lease = self.leases.get(lease_id)
+            if lease is None:
+                return False
+            if self.clock() >= lease.expires_at:
+                self._end(lease, AVAILABLE)
+                return False
+            return self._end(lease, ON_MISSION)
+
+    def release(self, lease_id: str) -> bool:
+        """Give a leased medic back; False if the lease is no longer active."""
+        with self.db.lock:
+            lease = self.leases.get(lease_id)
+            if lease is None:
+                return False
+            return self._end(lease, AVAILABLE)
+
+    def release_expired(self) -> int:
+        """Release every lease past its expiry; returns how many."""
+        released = 0
+        with self.db.lock:
+            now = self.clock()
+            while self._expiries and self._expiries[0][0] <= now:
+                _, lease_id = heapq.heappop(self._expiries)
+                lease = self.leases.get(lease_id)
+                if lease is not None:
+                    self._end(lease, AVAILABLE)
+                    released += 1
+        return released
+
+    def lease_for(self, medic_id: str) -> Optional[Lease]:
+        """Active lease on a medic, if any."""
+        lease_id = self._by_medic.get(medic_id)
+        return self.leases.get(lease_id) if lease_id is not None else None
+
+    def _end(self, lease: Lease, status: str) -> bool:
+        """Drop a lease; move its medic to status if the lease still holds it."""
+        del self.leases[lease.lease_id]
+        if self._by_medic.get(lease.medic_id) != lease.lease_id:
+            # Superseded by a newer lease on the same medic: leave that one be.
+            return False
+        del self._by_medic[lease.medic_id]
+        return self.db.compare_and_set_status(lease.medic_id, RESERVED, status)
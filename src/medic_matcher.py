@@ -3,12 +3,22 @@ SAHM Step 4: Medic Matching System
 Ultra-fast medic assignment (<3 seconds) based on location, specialty, and availability.
 """
 
+import heapq
+import math
 import random
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from .ground_eta import estimate_ground_eta, parse_hour, road_distance_km
+from .medic_index import MedicGridIndex
+from .medic_leases import RESERVED, LeaseBook
+from .medic_roster import MedicRoster
+
 
 @dataclass
 class Medic:
@@ -25,6 +35,30 @@ class Medic:
     languages: List[str]  
 
 
+@dataclass
+class MedicMapView:
+    """
+    Which roster entries find_best_match() returns as "all_medics".
+    
+    Medics inside the box are listed in roster order, then paginated.
+    With neither radius_deg nor bbox set, the whole roster is in view.
+    """
+    radius_deg: Optional[float] = None  # half-width of a box centred on the patient
+    bbox: Optional[Tuple[float, float, float, float]] = None  # (lat_min, lon_min, lat_max, lon_max)
+    offset: int = 0
+    limit: Optional[int] = None
+    
+    def bounds(self, patient_location: tuple[float, float]) -> Optional[Tuple[float, float, float, float]]:
+        """(lat_min, lon_min, lat_max, lon_max) for a patient, or None for no filter"""
+        if self.bbox is not None:
+            return self.bbox
+        if self.radius_deg is not None:
+            lat, lon = patient_location
+            r = self.radius_deg
+            return (lat - r, lon - r, lat + r, lon + r)
+        return None
+
+
 class MedicDatabase:
     """Mock database of available medics (in production: SQL/NoSQL)"""
     
@@ -44,8 +78,75 @@ class MedicDatabase:
     def __init__(self, seed: int = 42):
         """Initialize with fixed seed for deterministic medic generation"""
         self._rng = random.Random(seed)
+        # Serializes writers. Readers (the rankers) run without it and use
+        # availability_version to detect changes they may have missed.
+        self.lock = threading.RLock()
+        self.availability_version = 0
         self.medics = self._generate_mock_medics()
     
+    @property
+    def medics(self) -> List[Medic]:
+        """
+        Roster in insertion order (list position breaks score ties).
+        
+        Assigning a new list rebuilds the id, status and specialty indexes
+        and bumps availability_version; statuses and locations must change
+        through update_status() and update_location() to keep them current.
+        """
+        return self._medics
+    
+    @medics.setter
+    def medics(self, medics: List[Medic]):
+        with self.lock:
+            self._medics = medics
+            self._grid: Optional[MedicGridIndex] = None
+            self._roster: Optional[MedicRoster] = None
+            
+            # Lookup indexes over roster positions, kept in sync by update_status().
+            self._positions: Dict[str, int] = {}
+            self._by_status: Dict[str, Set[int]] = {}
+            self._by_specialty: Dict[str, Set[int]] = {}
+            for position, medic in enumerate(medics):
+                self._positions[medic.id] = position
+                self._by_status.setdefault(medic.status, set()).add(position)
+                self._by_specialty.setdefault(medic.specialty, set()).add(position)
+            # A new roster can hold better matches than the one a ranking saw.
+            self.availability_version += 1
+    
+    @property
+    def grid(self) -> MedicGridIndex:
+        """
+        Spatial index over roster positions, built on first use.
+        
+        Locations must change through update_location() for the index to
+        see them; replacing self.medics rebuilds it.
+        """
+        if self._grid is None:
+            # Built under the lock so no update_location() lands mid-build.
+            with self.lock:
+                if self._grid is None:
+                    self._grid = MedicGridIndex([m.gps_location for m in self._medics])
+        return self._grid
+    
+    @property
+    def roster(self) -> MedicRoster:
+        """
+        Structure-of-arrays view of the scoring fields, built on first use.
+        
+        Kept in sync by update_status() and update_location().
+        """
+        if self._roster is None:
+            with self.lock:
+                if self._roster is None:
+                    self._roster = MedicRoster(self._medics)
+        return self._roster
+    
+    def refresh(self) -> None:
+        """Pick up roster changes made elsewhere (nothing to do in memory)"""
+    
+    def _position_of(self, medic_id: str) -> Optional[int]:
+        return self._positions.get(medic_id)
+    
     def _generate_mock_medics(self) -> List[Medic]:
         """Generate realistic mock medic profiles (deterministic with seed)"""""
         
@@ -87,30 +188,172 @@ class MedicDatabase:
     
     def get_available_medics(self) -> List[Medic]:
         """Return only medics with 'available' status"""
-        return [m for m in self.medics if m.status == "available"]
+        return self.find_medics(status="available")
+    
+    def find_medics(self, status: Optional[str] = None, specialty: Optional[str] = None) -> List[Medic]:
+        """
+        Medics matching a status and/or specialty, in roster order.
+        
+        Answered from the status and specialty buckets, so the cost scales
+        with the size of the smaller bucket rather than the roster.
+        """
+        buckets = []
+        if status is not None:
+            buckets.append(self._by_status.get(status, set()))
+        if specialty is not None:
+            buckets.append(self._by_specialty.get(specialty, set()))
+        if not buckets:
+            return list(self._medics)
+        
+        buckets.sort(key=len)
+        positions = buckets[0].intersection(*buckets[1:]) if len(buckets) > 1 else buckets[0]
+        return [self._medics[position] for position in sorted(positions)]
+    
+    def count_medics(self, status: str) -> int:
+        """Number of medics with a status"""
+        return len(self._by_status.get(status, ()))
     
     def get_by_id(self, medic_id: str) -> Optional[Medic]:
         """Retrieve specific medic by ID"""
-        for medic in self.medics:
-            if medic.id == medic_id:
-                return medic
-        return None
+        position = self._positions.get(medic_id)
+        return self._medics[position] if position is not None else None
     
     def update_status(self, medic_id: str, new_status: str):
-        """Update medic availability status"""
-        medic = self.get_by_id(medic_id)
-        if medic:
-            medic.status = new_status
+        """
+        Update medic availability status.
+        
+        A medic becoming available bumps availability_version; taking one
+        out of service does not, since it cannot improve anyone's match.
+        """
+        with self.lock:
+            position = self._position_of(medic_id)
+            if position is not None:
+                medic = self._medics[position]
+                old_status = medic.status
+                bucket = self._by_status[old_status]
+                bucket.discard(position)
+                if not bucket:
+                    del self._by_status[old_status]
+                self._by_status.setdefault(new_status, set()).add(position)
+                medic.status = new_status
+                if self._roster is not None:
+                    self._roster.set_status(position, new_status)
+                if new_status == "available" and old_status != "available":
+                    self.availability_version += 1
+    
+    def compare_and_set_status(self, medic_id: str, expected: str, new_status: str) -> bool:
+        """
+        update_status() only if the medic's status is still expected.
+        
+        Returns:
+            True if the status was changed
+        """
+        with self.lock:
+            medic = self.get_by_id(medic_id)
+            if medic is None or medic.status != expected:
+                return False
+            self.update_status(medic_id, new_status)
+            return True
+    
+    def update_location(self, medic_id: str, gps_location: tuple[float, float]):
+        """Move a medic and keep the spatial index in sync"""
+        with self.lock:
+            position = self._position_of(medic_id)
+            if position is not None:
+                medic = self._medics[position]
+                if self._grid is not None:
+                    self._grid.move(position, medic.gps_location, gps_location)
+                if self._roster is not None:
+                    self._roster.set_location(position, gps_location)
+                medic.gps_location = gps_location
+                self.availability_version += 1
+    
+    def apply_updates(
+        self,
+        locations: Optional[Dict[str, tuple[float, float]]] = None,
+        statuses: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Apply a batch of location and status changes under one lock hold.
+        
+        Locations are applied before statuses. Unknown ids are skipped, and
+        so are status changes for reserved medics: the lease holding one
+        decides its next status (see medic_leases.LeaseBook).
+        
+        Returns:
+            Number of changes applied
+        """
+        applied = 0
+        with self.lock:
+            for medic_id, gps_location in (locations or {}).items():
+                if medic_id in self._positions:
+                    self.update_location(medic_id, gps_location)
+                    applied += 1
+            for medic_id, status in (statuses or {}).items():
+                position = self._positions.get(medic_id)
+                if position is not None and self._medics[position].status != RESERVED:
+                    self.update_status(medic_id, status)
+                    applied += 1
+        return applied
+
+
+# Traffic hour for ground ETAs when the call gives no time_of_day, so the
+# same scenario gets the same ETA whatever the wall-clock time.
+DEFAULT_TRAFFIC_HOUR = 12
 
 
 class MedicMatcher:
     """
     Core matching algorithm.
     Finds optimal medic in <3 seconds based on multiple factors.
+    
+    Candidates come from the database's spatial grid: rings around the
+    patient are scored until no unvisited medic can reach the top
+    TOP_K. The result is identical to scoring every available medic.
     """
     
-    def __init__(self):
-        self.db = MedicDatabase()
+    # Assigned medic plus alternatives.
+    TOP_K = 4
+    
+    # Largest possible non-distance part of the composite score
+    # (specialty + workload + rating + certification weights).
+    MAX_NON_DISTANCE_SCORE = 0.20 + 0.10 + 0.05 + 0.05
+    
+    CERT_SCORES = {"paramedic": 0.7, "emt_advanced": 0.85, "critical_care": 1.0}
+    
+    # Largest gap between the vectorized (unrounded) composite and the
+    # reported one: 0.0005 from rounding the score plus 0.6 * 0.005 / 20
+    # from rounding the distance, with headroom.
+    SCORE_TOLERANCE = 0.001
+    
+    # Optimistic match_and_reserve() attempts before matching under the lock.
+    MAX_RESERVE_ATTEMPTS = 3
+    
+    def __init__(
+        self,
+        traffic_hour: Optional[int] = DEFAULT_TRAFFIC_HOUR,
+        use_index: bool = True,
+        db: Optional[MedicDatabase] = None,
+        road_network=None,
+    ):
+        """
+        Args:
+            traffic_hour: Hour of day for ground traffic profiles when a
+                call gives no time_of_day (None: the current hour at
+                estimation time)
+            use_index: Prune candidates with the spatial grid (False scores
+                every available medic in one vectorized pass)
+            db: Roster to match from (default: the in-memory mock roster)
+            road_network: road_network.RoadNetwork for ground ETAs
+                (default: straight-line distance x detour factor)
+        """
+        self.db = db if db is not None else MedicDatabase()
+        self.leases = LeaseBook(self.db)
+        self.traffic_hour = traffic_hour
+        self.use_index = use_index
+        self.road_network = road_network
+        # match_and_reserve() attempts that lost a race and re-matched.
+        self.reserve_conflicts = 0
     
     def _calculate_distance(
         self,
@@ -132,24 +375,28 @@ class MedicMatcher:
         distance_km = ((lat_diff ** 2 + lon_diff ** 2) ** 0.5) * 111
         return round(distance_km, 2)
     
-    def _estimate_eta(self, distance_km: float, mode: str) -> float:
+    def _estimate_eta(self, distance_km: float, mode: str, hour: Optional[int] = None) -> float:
         """
         Estimate time to reach patient.
         
         Args:
             distance_km: Distance to patient
             mode: "aerial" or "ground"
+            hour: Traffic hour (default: self.traffic_hour)
         
         Returns:
             Estimated minutes to arrival
+        
+        Ground ETAs come from the hourly traffic profiles in ground_eta.py.
+        With a road_network, _calculate_match_score() uses its road-graph
+        ETA instead and only falls back here when no road connects.
         """
-        if mode == "aerial":
-            
-            speed_kmh = 120
-        else:
-            
-            speed_kmh = 40
+        if mode != "aerial":
+            return estimate_ground_eta(
+                road_distance_km(distance_km), hour=self.traffic_hour if hour is None else hour
+            )
         
+        speed_kmh = 120
         eta_minutes = (distance_km / speed_kmh) * 60
         return round(eta_minutes, 1)
     
@@ -174,6 +421,23 @@ class MedicMatcher:
         
         return 0.4
     
+    def _composite_score(self, distance: float, specialty_score: float, medic: Medic) -> float:
+        """Weighted composite of the match factors, rounded to 0.001."""
+        distance_score = max(0, 1 - (distance / 20))  
+        workload_score = 1 - (medic.current_load / 100)
+        rating_score = medic.rating / 5.0
+        cert_score = self.CERT_SCORES[medic.certification_level]
+        
+        
+        composite_score = (
+            distance_score * 0.60 +
+            specialty_score * 0.20 +
+            workload_score * 0.10 +
+            rating_score * 0.05 +
+            cert_score * 0.05
+        )
+        return round(composite_score, 3)
+    
     def _calculate_match_score(
         self,
         medic: Medic,
@@ -181,6 +445,7 @@ class MedicMatcher:
         patient_location: tuple[float, float],
         severity: int,
         mode: str,
+        hour: Optional[int] = None,
     ) -> Dict:
         """
         Calculate composite match score.
@@ -192,28 +457,24 @@ class MedicMatcher:
         - Rating (10% weight)
         - Certification (5% weight)
         """
+        hour = self.traffic_hour if hour is None else hour
         distance = self._calculate_distance(medic.gps_location, patient_location)
-        eta = self._estimate_eta(distance, mode)
+        eta = self._estimate_eta(distance, mode, hour)
+        if mode != "aerial" and self.road_network is not None:
+            road_eta = self.road_network.eta_minutes(medic.gps_location, patient_location, hour)
+            if math.isfinite(road_eta):
+                eta = road_eta
         specialty_score = self._calculate_specialty_match(medic.specialty, case_category)
         
         
         distance_score = max(0, 1 - (distance / 20))  
         workload_score = 1 - (medic.current_load / 100)
         rating_score = medic.rating / 5.0
-        cert_score = {"paramedic": 0.7, "emt_advanced": 0.85, "critical_care": 1.0}[medic.certification_level]
-        
-        
-        composite_score = (
-            distance_score * 0.60 +
-            specialty_score * 0.20 +
-            workload_score * 0.10 +
-            rating_score * 0.05 +
-            cert_score * 0.05
-        )
+        cert_score = self.CERT_SCORES[medic.certification_level]
         
         return {
             "medic_id": medic.id,
-            "composite_score": round(composite_score, 3),
+            "composite_score": self._composite_score(distance, specialty_score, medic),
             "distance_km": distance,
             "eta_minutes": eta,
             "specialty_match": specialty_score,
@@ -226,12 +487,241 @@ class MedicMatcher:
             }
         }
     
+    def _rank_exhaustive(
+        self,
+        case_category: str,
+        patient_location: tuple[float, float],
+        severity: int,
+        mode: str,
+        hour: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Score every available medic one by one and return the top TOP_K, best
+        first (ties keep roster order). Reference implementation for the
+        faster rankers.
+        """
+        scores = []
+        
+        for medic in self.db.get_available_medics():
+            score_data = self._calculate_match_score(
+                medic, case_category, patient_location, severity, mode, hour
+            )
+            scores.append({
+                "medic": medic,
+                "score_data": score_data,
+            })
+        
+        
+        # nlargest is stable, so ties keep roster order as a full sort would.
+        return heapq.nlargest(
+            self.TOP_K, scores, key=lambda x: x["score_data"]["composite_score"]
+        )
+    
+    def _approximate_scores(
+        self,
+        positions: np.ndarray,
+        case_category: str,
+        patient_location: tuple[float, float],
+    ) -> np.ndarray:
+        """
+        Composite scores for roster positions in one vectorized expression.
+        
+        Same weights as _calculate_match_score() but without rounding the
+        distance or the score, so values are within SCORE_TOLERANCE of it.
+        """
+        roster = self.db.roster
+        specialty_table = np.array([
+            self._calculate_specialty_match(name, case_category) for name in roster.specialties.names
+        ])
+        cert_table = np.array([self.CERT_SCORES[name] for name in roster.certifications.names])
+        
+        distance = np.hypot(roster.lat[positions] - patient_location[0],
+                            roster.lon[positions] - patient_location[1]) * 111
+        return (
+            np.maximum(0, 1 - distance / 20) * 0.60 +
+            specialty_table[roster.specialty[positions]] * 0.20 +
+            (1 - roster.load[positions] / 100) * 0.10 +
+            (roster.rating[positions] / 5.0) * 0.05 +
+            cert_table[roster.certification[positions]] * 0.05
+        )
+    
+    def _score_bound(self, min_distance_km: float) -> float:
+        """Best composite score any medic at least min_distance_km away could round to."""
+        # Distances are rounded to 0.01 km, so allow for that before scoring.
+        distance_bound = max(0, 1 - (min_distance_km - 0.005) / 20)
+        return round(distance_bound * 0.60 + self.MAX_NON_DISTANCE_SCORE + 1e-9, 3)
+    
+    def _rank_indexed(
+        self,
+        case_category: str,
+        patient_location: tuple[float, float],
+        severity: int,
+        mode: str,
+        k: Optional[int] = None,
+        hour: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Top k (default TOP_K) available medics via ring expansion over the
+        spatial grid.
+        
+        Each ring is scored with _approximate_scores() until the ring bound
+        proves no unvisited medic can reach the top k; _select_top()
+        then settles the exact order. Returns the same leading entries, in
+        the same order, as _rank_exhaustive().
+        
+        Past 20 km the distance score is 0 and the bound stops falling, so
+        the walk could only end at the last ring; from there the whole
+        roster is scored with _rank_vectorized() instead.
+        """
+        roster = self.db.roster
+        available = roster.available_code
+        k = self.TOP_K if k is None else k
+        visited: List[np.ndarray] = []
+        approx: List[np.ndarray] = []
+        n_visited = 0
+        floor = self._score_bound(math.inf)
+        
+        for positions, min_distance_km in self.db.grid.rings(patient_location):
+            if positions:
+                positions = np.asarray(positions, dtype=np.intp)
+                positions = positions[roster.status[positions] == available]
+                visited.append(positions)
+                approx.append(self._approximate_scores(positions, case_category, patient_location))
+                n_visited += len(positions)
+            
+            if math.isinf(min_distance_km):
+                continue
+            
+            score_bound = self._score_bound(min_distance_km)
+            
+            if n_visited >= k:
+                scores = np.concatenate(approx)
+                visited, approx = [np.concatenate(visited)], [scores]
+                kth = -np.partition(-scores, k - 1)[k - 1]
+                # Strictly greater: an unvisited medic with an equal score but
+                # an earlier roster position would win the tie.
+                if kth - self.SCORE_TOLERANCE > score_bound:
+                    break
+            
+            if score_bound <= floor:
+                return self._rank_vectorized(case_category, patient_location, severity, mode, k, hour)
+        
+        if not n_visited:
+            return []
+        # Rings are walked without the lock, so a medic moved by a
+        # concurrent update_location() can show up in two of them.
+        positions, first = np.unique(np.concatenate(visited), return_index=True)
+        return self._select_top(
+            positions, np.concatenate(approx)[first],
+            case_category, patient_location, severity, mode, k, hour,
+        )
+    
+    def _rank_vectorized(
+        self,
+        case_category: str,
+        patient_location: tuple[float, float],
+        severity: int,
+        mode: str,
+        k: Optional[int] = None,
+        hour: Optional[int] = None,
+    ) -> List[Dict]:
+        """Top k (default TOP_K) available medics, scoring the whole roster in one pass."""
+        roster = self.db.roster
+        positions = np.flatnonzero(roster.status == roster.available_code)
+        if not len(positions):
+            return []
+        return self._select_top(
+            positions, self._approximate_scores(positions, case_category, patient_location),
+            case_category, patient_location, severity, mode, k, hour,
+        )
+    
+    def _select_top(
+        self,
+        positions: np.ndarray,
+        scores: np.ndarray,
+        case_category: str,
+        patient_location: tuple[float, float],
+        severity: int,
+        mode: str,
+        k: Optional[int] = None,
+        hour: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Exact top k (default TOP_K) from approximate scores.
+        
+        Medics within 2 * SCORE_TOLERANCE of the k-th best approximate score
+        are rescored exactly and the best k by (score desc, roster
+        position) are taken with a heap; breakdown payloads are built for
+        the returned medics only.
+        """
+        k = self.TOP_K if k is None else k
+        kth_index = min(k, len(scores)) - 1
+        kth = -np.partition(-scores, kth_index)[kth_index]
+        finalists = positions[scores >= kth - 2 * self.SCORE_TOLERANCE]
+        
+        medics = self.db.medics
+        exact = []
+        for position in finalists.tolist():
+            medic = medics[position]
+            distance = self._calculate_distance(medic.gps_location, patient_location)
+            specialty_score = self._calculate_specialty_match(medic.specialty, case_category)
+            exact.append((-self._composite_score(distance, specialty_score, medic), position))
+        
+        return [
+            {
+                "medic": medics[position],
+                "score_data": self._calculate_match_score(
+                    medics[position], case_category, patient_location, severity, mode, hour
+                ),
+            }
+            for _, position in heapq.nsmallest(k, exact)
+        ]
+    
+    def _medics_in_view(
+        self,
+        view: MedicMapView,
+        patient_location: tuple[float, float],
+        assigned_id: str,
+    ) -> Tuple[List[Dict], int]:
+        """
+        Map payload for the medics a view selects.
+        
+        Returns:
+            (page of medic dicts, number of medics in the box before paging)
+        """
+        roster = self.db.roster
+        bounds = view.bounds(patient_location)
+        if bounds is None:
+            positions = np.arange(len(roster))
+        else:
+            lat_min, lon_min, lat_max, lon_max = bounds
+            positions = np.flatnonzero(
+                (roster.lat >= lat_min) & (roster.lat <= lat_max) &
+                (roster.lon >= lon_min) & (roster.lon <= lon_max)
+            )
+        
+        end = None if view.limit is None else view.offset + view.limit
+        medics = self.db.medics
+        page = [
+            {
+                "id": m.id,
+                "name": m.name,
+                "specialty": m.specialty,
+                "status": m.status.replace('_', ' ').title() if m.id != assigned_id else "En Route",
+                "gps_location": m.gps_location,
+            }
+            for m in (medics[position] for position in positions[view.offset:end].tolist())
+        ]
+        return page, len(positions)
+    
     def find_best_match(
         self,
         decision_output: Dict,
         triage_output: Dict,
         patient_location: tuple[float, float] = None,
         scenario_seed: int = None,
+        medic_view: Optional[MedicMapView] = None,
+        time_of_day=None,
     ) -> Dict:
         """
         Main matching function.
@@ -242,18 +732,38 @@ class MedicMatcher:
             triage_output: Result from Step 2 (AI Triage)
             patient_location: (lat, lon) or None for derived location
             scenario_seed: Optional seed for deterministic patient location
+            medic_view: Roster entries to include as "all_medics" (with their
+                pre-paging count as "all_medics_total"); omitted when None
+            time_of_day: Scenario time (e.g. "5:00 PM (Rush)") for ground
+                traffic; unparseable or None uses self.traffic_hour
         
         Returns:
             Dict with assigned medic details and match reasoning
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         
         response_mode = decision_output["response_mode"]
         severity = triage_output["severity_level"]
         category = triage_output["category"]
         
+        patient_location = self._resolve_patient_location(patient_location, scenario_seed)
+        
         
+        if response_mode == "ground_only":
+            return self._ground_only_result(start_time)
+        
+        
+        mode = "aerial" if response_mode in ["aerial_only", "combined"] else "ground"
+        scores = self._rank(category, patient_location, severity, mode, hour=parse_hour(time_of_day))
+        return self._match_result(scores, category, patient_location, medic_view, start_time)
+    
+    def _resolve_patient_location(
+        self,
+        patient_location: Optional[tuple[float, float]],
+        scenario_seed: Optional[int],
+    ) -> tuple[float, float]:
+        """Explicit location, or one derived deterministically from the seed"""
         if patient_location is None:
             
             seed = scenario_seed if scenario_seed is not None else 1
@@ -262,43 +772,49 @@ class MedicMatcher:
                 self.db.RIYADH_CENTER[0] + loc_rng.uniform(-0.15, 0.15),
                 self.db.RIYADH_CENTER[1] + loc_rng.uniform(-0.15, 0.15),
             )
-        
-        
-        if response_mode == "ground_only":
-            return {
-                "assigned_medic": None,
-                "reasoning": "Ground ambulance only, no aerial medic needed",
-                "match_time_seconds": round(time.time() - start_time, 3),
-            }
-        
-        
-        available = self.db.get_available_medics()
-        
-        if not available:
+        return patient_location
+    
+    def _rank(
+        self,
+        case_category: str,
+        patient_location: tuple[float, float],
+        severity: int,
+        mode: str,
+        k: Optional[int] = None,
+        hour: Optional[int] = None,
+    ) -> List[Dict]:
+        """Top k (default TOP_K) available medics with the configured ranker"""
+        self.db.refresh()
+        if self.use_index:
+            return self._rank_indexed(case_category, patient_location, severity, mode, k, hour)
+        return self._rank_vectorized(case_category, patient_location, severity, mode, k, hour)
+    
+    @staticmethod
+    def _ground_only_result(start_time: float) -> Dict:
+        return {
+            "assigned_medic": None,
+            "reasoning": "Ground ambulance only, no aerial medic needed",
+            "match_time_seconds": round(time.perf_counter() - start_time, 6),
+        }
+    
+    def _match_result(
+        self,
+        scores: List[Dict],
+        category: str,
+        patient_location: tuple[float, float],
+        medic_view: Optional[MedicMapView],
+        start_time: float,
+    ) -> Dict:
+        """find_best_match() payload for a ranking (best first)"""
+        if not scores:
             return {
                 "assigned_medic": None,
                 "reasoning": "No medics currently available",
-                "match_time_seconds": round(time.time() - start_time, 3),
+                "match_time_seconds": round(time.perf_counter() - start_time, 6),
                 "status": "error",
             }
         
         
-        mode = "aerial" if response_mode in ["aerial_only", "combined"] else "ground"
-        scores = []
-        
-        for medic in available:
-            score_data = self._calculate_match_score(
-                medic, category, patient_location, severity, mode
-            )
-            scores.append({
-                "medic": medic,
-                "score_data": score_data,
-            })
-        
-        
-        scores.sort(key=lambda x: x["score_data"]["composite_score"], reverse=True)
-        
-        
         best = scores[0]
         best_medic = best["medic"]
         best_score = best["score_data"]
@@ -307,9 +823,9 @@ class MedicMatcher:
         
         
         
-        match_time = round(time.time() - start_time, 3)
+        match_time = round(time.perf_counter() - start_time, 6)
         
-        return {
+        result = {
             "assigned_medic": {
                 "id": best_medic.id,
                 "name": best_medic.name,
@@ -343,16 +859,6 @@ class MedicMatcher:
                 }
                 for alt in scores[1:4]  
             ] if len(scores) > 1 else [],
-            "all_medics": [
-                {
-                    "id": m.id,
-                    "name": m.name,
-                    "specialty": m.specialty,
-                    "status": m.status.replace('_', ' ').title() if m.id != best_medic.id else "En Route",
-                    "gps_location": m.gps_location,
-                }
-                for m in self.db.medics
-            ],
             "match_time_seconds": match_time,
             "patient_location": {
                 "latitude": round(patient_location[0], 6),
@@ -360,24 +866,118 @@ class MedicMatcher:
             },
             "status": "success",
         }
+        if medic_view is not None:
+            result["all_medics"], result["all_medics_total"] = self._medics_in_view(
+                medic_view, patient_location, best_medic.id
+            )
+        return result
+    
+    def match_and_reserve(
+        self,
+        decision_output: Dict,
+        triage_output: Dict,
+        incident_id: str,
+        patient_location: tuple[float, float] = None,
+        scenario_seed: int = None,
+        lease_seconds: Optional[float] = None,
+        medic_view: Optional[MedicMapView] = None,
+        time_of_day=None,
+    ) -> Dict:
+        """
+        Match a medic and hold it for an incident in one atomic step.
+        
+        Ranking runs without the database lock; the reservation is then
+        committed under it only if availability_version has not moved.
+        Medics taken meanwhile by other incidents only shrink the candidate
+        set, so the first ranked medic still available is the best one left;
+        a medic becoming available or moving could beat it, so that forces
+        a re-match, as does losing every ranked medic. After
+        MAX_RESERVE_ATTEMPTS conflicts the match runs under the lock.
+        
+        The medic is "reserved" until the lease is confirmed with
+        self.leases.confirm() (-> "on_mission"), released, or expires.
+        
+        Args:
+            incident_id: Incident the medic is held for
+            lease_seconds: Lease length (default: LeaseBook.DEFAULT_LEASE_SECONDS)
+            (others as for find_best_match())
+        
+        Returns:
+            find_best_match() result, plus a "lease" dict when a medic was
+            reserved
+        """
+        start_time = time.perf_counter()
+        self.leases.release_expired()
+        
+        severity = triage_output["severity_level"]
+        category = triage_output["category"]
+        patient_location = self._resolve_patient_location(patient_location, scenario_seed)
+        if decision_output["response_mode"] == "ground_only":
+            return self._ground_only_result(start_time)
+        mode = "aerial" if decision_output["response_mode"] in ["aerial_only", "combined"] else "ground"
+        hour = parse_hour(time_of_day)
+        
+        def attempt(expected_version: Optional[int]) -> Optional[Dict]:
+            scores = self._rank(category, patient_location, severity, mode, hour=hour)
+            if not scores:
+                if expected_version is None or expected_version == self.db.availability_version:
+                    return self._match_result(scores, category, patient_location, medic_view, start_time)
+                return None
+            
+            reserved = self.leases.reserve_first(
+                [s["medic"].id for s in scores], incident_id, lease_seconds, expected_version
+            )
+            if reserved is None:
+                return None
+            index, lease = reserved
+            result = self._match_result(scores[index:], category, patient_location, medic_view, start_time)
+            result["lease"] = lease.as_dict()
+            return result
+        
+        for _ in range(self.MAX_RESERVE_ATTEMPTS):
+            result = attempt(self.db.availability_version)
+            if result is not None:
+                return result
+            self.reserve_conflicts += 1
+        
+        with self.db.lock:
+            return attempt(None)
 
 
 _matcher_instance: Optional[MedicMatcher] = None
+_matcher_lock = threading.Lock()
 
 def get_matcher() -> MedicMatcher:
-    """Get or create singleton MedicMatcher instance for deterministic results"""
+    """
+    Get or create singleton MedicMatcher instance for deterministic results
+    (ground ETAs use DEFAULT_TRAFFIC_HOUR unless a call passes time_of_day).
+    """
     global _matcher_instance
     if _matcher_instance is None:
-        _matcher_instance = MedicMatcher()
+        with _matcher_lock:
+            if _matcher_instance is None:
+                _matcher_instance = MedicMatcher()
     return _matcher_instance
 
 
+def set_matcher(matcher: Optional[MedicMatcher]) -> None:
+    """
+    Replace the singleton used by assign_medic() and reserve_medic(), e.g.
+    with a medic_shards.ShardedMedicMatcher; None restores the default.
+    """
+    global _matcher_instance
+    with _matcher_lock:
+        _matcher_instance = matcher
+
+
 
 def assign_medic(
     decision_output: Dict,
     triage_output: Dict,
     patient_location: tuple[float, float] = None,
     scenario_seed: int = None,
+    medic_view: Optional[MedicMapView] = None,
+    time_of_day=None,
 ) -> Dict:
     """
     Wrapper function for easy integration.
@@ -388,10 +988,35 @@ def assign_medic(
         triage_output: Result from AI Triage
         patient_location: Optional explicit (lat, lon)
         scenario_seed: Optional seed for deterministic patient location
+        medic_view: Optional MedicMapView selecting the "all_medics" payload
+        time_of_day: Optional scenario time of day for ground traffic
     
     Usage:
         from medic_matcher import assign_medic
         assignment = assign_medic(decision_result, triage_result, scenario_seed=scenario_id)
     """
     matcher = get_matcher()
-    return matcher.find_best_match(decision_output, triage_output, patient_location, scenario_seed)
+    return matcher.find_best_match(
+        decision_output, triage_output, patient_location, scenario_seed, medic_view, time_of_day
+    )
+
+
+def reserve_medic(
+    decision_output: Dict,
+    triage_output: Dict,
+    incident_id: str,
+    patient_location: tuple[float, float] = None,
+    scenario_seed: int = None,
+    lease_seconds: Optional[float] = None,
+    time_of_day=None,
+) -> Dict:
+    """
+    assign_medic() that also holds the medic for the incident.
+    
+    Safe to call from several threads: no medic is leased to two incidents
+    at once. Confirm with get_matcher().leases.confirm(lease_id).
+    """
+    return get_matcher().match_and_reserve(
+        decision_output, triage_output, incident_id, patient_location, scenario_seed, lease_seconds,
+        time_of_day=time_of_day,
+    )
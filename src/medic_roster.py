@@ -0,0 +1,77 @@
+"""
+Medic Roster Arrays
+Structure-of-arrays copy of the medic fields MedicMatcher scores on.
+
+Position i in every array is MedicDatabase.medics[i]. Strings (specialty,
+certification, status) are stored as small integer codes with a per-roster
+name table, so a whole candidate set is scored with a handful of NumPy
+gathers instead of per-medic attribute and dict lookups.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+class CodeTable:
+    """Bidirectional string <-> small int code mapping that grows on demand."""
+
+    def __init__(self, names: Sequence[str] = ()):
+        self.names: List[str] = []
+        self._codes: Dict[str, int] = {}
+        for name in names:
+            self.code(name)
+
+    def code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def encode(self, values: Sequence[str]) -> np.ndarray:
+        return np.fromiter((self.code(v) for v in values), dtype=np.int32, count=len(values))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class MedicRoster:
+    """
+    Parallel arrays over a medic list.
+
+    Attributes:
+        lat, lon: Location in degrees (float64)
+        specialty: Code into specialties.names
+        certification: Code into certifications.names
+        load: current_load (float64)
+        rating: rating (float64)
+        status: Code into statuses.names
+    """
+
+    def __init__(self, medics: Sequence):
+        n = len(medics)
+        self.specialties = CodeTable()
+        self.certifications = CodeTable()
+        self.statuses = CodeTable(["available"])
+
+        self.lat = np.fromiter((m.gps_location[0] for m in medics), dtype=np.float64, count=n)
+        self.lon = np.fromiter((m.gps_location[1] for m in medics), dtype=np.float64, count=n)
+        self.specialty = self.specialties.encode([m.specialty for m in medics])
+        self.certification = self.certifications.encode([m.certification_level for m in medics])
+        self.load = np.fromiter((m.current_load for m in medics), dtype=np.float64, count=n)
+        self.rating = np.fromiter((m.rating for m in medics), dtype=np.float64, count=n)
+        self.status = self.statuses.encode([m.status for m in medics])
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    @property
+    def available_code(self) -> int:
+        return self.statuses.code("available")
+
+    def set_status(self, position: int, status: str) -> None:
+        self.status[position] = self.statuses.code(status)
+
+    def set_location(self, position: int, gps_location: Tuple[float, float]) -> None:
+        self.lat[position], self.lon[position] = gps_location
@@ -0,0 +1,370 @@
+"""
+Region-Sharded Medic Matching
+Spreads the roster over worker processes by region so matching is not
+bound to one interpreter's GIL.
+
+The roster is cut into one region per worker by recursive median splits on
+latitude or longitude (whichever spans wider), so regions hold about the
+same number of medics. Every worker keeps a MedicMatcher over its region's
+medics, with the parent's traffic_hour and road_network; the parent keeps the full MedicDatabase (for leases, payloads and
+updates, which it forwards to the owning worker).
+
+A query is scatter-gather in two waves:
+  1. the worker whose region is nearest the patient returns its local top-k;
+  2. every other region whose nearest edge could still hold a medic scoring
+     at least the current k-th best (MedicMatcher._score_bound) is queried
+     in parallel, and all local top-k lists are merged.
+
+Scores and tie-breaks (composite score, then roster position) are the same
+as in MedicMatcher, so results match the single-process matcher exactly.
+A medic stays with its worker when it moves; that region's bounding box
+grows to cover it.
+
+Usage:
+    matcher = ShardedMedicMatcher(workers=4)
+    set_matcher(matcher)  # assign_medic() now scatter-gathers
+"""
+
+import heapq
+import itertools
+import math
+import multiprocessing
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .medic_index import KM_PER_DEGREE
+from .medic_matcher import DEFAULT_TRAFFIC_HOUR, Medic, MedicDatabase, MedicMatcher
+
+
+Query = Tuple[str, Tuple[float, float], int, str]  # category, patient location, severity, mode
+
+
+def partition_regions(lat: np.ndarray, lon: np.ndarray, parts: int) -> List[np.ndarray]:
+    """
+    Split roster positions into parts regions of near-equal size.
+
+    Returns:
+        Sorted roster positions per region
+    """
+    def split(positions: np.ndarray, parts: int) -> List[np.ndarray]:
+        if parts == 1 or len(positions) <= 1:
+            return [np.sort(positions)] + [np.empty(0, dtype=np.intp)] * (parts - 1)
+        lat_span = np.ptp(lat[positions])
+        lon_span = np.ptp(lon[positions])
+        axis = lat if lat_span >= lon_span else lon
+        order = positions[np.argsort(axis[positions], kind="stable")]
+        left = parts // 2
+        cut = len(order) * left // parts
+        return split(order[:cut], left) + split(order[cut:], parts - left)
+
+    return split(np.arange(len(lat), dtype=np.intp), parts)
+
+
+def _serve(conn) -> None:
+    """Worker loop: a MedicMatcher over one region, configured like the parent's."""
+    matcher: Optional[MedicMatcher] = None
+    positions: List[int] = []
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        op = message[0]
+        if op == "rank":
+            _, request_id, category, location, severity, mode, k, hour = message
+            try:
+                ranked = matcher._rank(category, location, severity, mode, k, hour)
+                conn.send((request_id, [
+                    (-r["score_data"]["composite_score"], positions[matcher.db._position_of(r["medic"].id)])
+                    for r in ranked
+                ]))
+            except Exception as e:
+                conn.send((request_id, e))
+        elif op == "load":
+            _, medics, positions, traffic_hour, road_network = message
+            matcher = MedicMatcher(traffic_hour=traffic_hour, road_network=road_network)
+            matcher.db.medics = medics
+            matcher.db.grid
+            matcher.db.roster
+        elif op == "status":
+            matcher.db.update_status(message[1], message[2])
+        elif op == "location":
+            matcher.db.update_location(message[1], message[2])
+        elif op == "stop":
+            return
+
+
+class _Shard:
+    """Parent-side handle on one worker: its pipe, pending requests and region."""
+
+    def __init__(self, context, name: str):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child,), name=name, daemon=True)
+        self.process.start()
+        child.close()
+        self._send_lock = threading.Lock()
+        # Guards _pending and _closed; once the reader has exited nothing
+        # would ever resolve a new request, so request() fails it at once.
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Future] = {}
+        self._closed = False
+        # lat_min, lat_max, lon_min, lon_max of the region's medics (None if empty)
+        self.bbox: Optional[List[float]] = None
+        self._reader = threading.Thread(target=self._read, name=f"{name}-reader", daemon=True)
+        self._reader.start()
+
+    def send(self, message: tuple) -> None:
+        with self._send_lock:
+            self.conn.send(message)
+
+    def request(self, request_id: int, message: tuple) -> Future:
+        """Send a request; the Future fails at once if the worker is gone."""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                future.set_exception(self._exited())
+                return future
+            self._pending[request_id] = future
+        try:
+            self.send(message)
+        except (BrokenPipeError, OSError):
+            with self._lock:
+                unanswered = self._pending.pop(request_id, None)
+            if unanswered is not None:
+                future.set_exception(self._exited())
+        return future
+
+    def _exited(self) -> RuntimeError:
+        return RuntimeError(f"{self.process.name} exited")
+
+    def _read(self) -> None:
+        while True:
+            try:
+                request_id, result = self.conn.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                future = self._pending.pop(request_id)
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        with self._lock:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(self._exited())
+
+    def cover(self, location: Tuple[float, float]) -> None:
+        lat, lon = location
+        if self.bbox is None:
+            self.bbox = [lat, lat, lon, lon]
+        else:
+            b = self.bbox
+            b[0], b[1] = min(b[0], lat), max(b[1], lat)
+            b[2], b[3] = min(b[2], lon), max(b[3], lon)
+
+    def min_distance_km(self, location: Tuple[float, float]) -> float:
+        """Lower bound on the matcher distance from location to any medic in the region."""
+        if self.bbox is None:
+            return math.inf
+        lat, lon = location
+        lat_min, lat_max, lon_min, lon_max = self.bbox
+        return math.hypot(max(lat_min - lat, 0, lat - lat_max), max(lon_min - lon, 0, lon - lon_max)) * KM_PER_DEGREE
+
+    def close(self) -> None:
+        try:
+            self.send(("stop",))
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+        self._reader.join(timeout=5)
+
+
+class ShardedMedicDatabase(MedicDatabase):
+    """
+    MedicDatabase whose roster is also spread over region workers.
+
+    Status and location changes are applied here and forwarded, in order,
+    to the worker owning the medic.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        seed: int = 42,
+        traffic_hour: Optional[int] = DEFAULT_TRAFFIC_HOUR,
+        road_network=None,
+    ):
+        """
+        Args:
+            workers: Number of region worker processes
+            seed: Random seed for the mock roster
+            traffic_hour, road_network: Configuration of the workers'
+                matchers (see MedicMatcher)
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self.traffic_hour = traffic_hour
+        self.road_network = road_network
+        context = multiprocessing.get_context("spawn")
+        self.shards = [_Shard(context, f"medic-shard-{i}") for i in range(workers)]
+        self._shard_of: List[int] = []
+        super().__init__(seed)
+
+    def _set_medics(self, medics: List[Medic]) -> None:
+        MedicDatabase.medics.fset(self, medics)
+        with self.lock:
+            lat = np.array([m.gps_location[0] for m in medics], dtype=np.float64)
+            lon = np.array([m.gps_location[1] for m in medics], dtype=np.float64)
+            self._shard_of = [0] * len(medics)
+            for i, (shard, positions) in enumerate(zip(self.shards, partition_regions(lat, lon, len(self.shards)))):
+                positions = positions.tolist()
+                shard.bbox = None
+                for p in positions:
+                    self._shard_of[p] = i
+                    shard.cover(medics[p].gps_location)
+                shard.send((
+                    "load", [medics[p] for p in positions], positions, self.traffic_hour, self.road_network
+                ))
+
+    medics = MedicDatabase.medics.setter(_set_medics)
+
+    def update_status(self, medic_id: str, new_status: str):
+        with self.lock:
+            super().update_status(medic_id, new_status)
+            position = self._position_of(medic_id)
+            if position is not None:
+                self.shards[self._shard_of[position]].send(("status", medic_id, new_status))
+
+    def update_location(self, medic_id: str, gps_location: tuple[float, float]):
+        with self.lock:
+            super().update_location(medic_id, gps_location)
+            position = self._position_of(medic_id)
+            if position is not None:
+                shard = self.shards[self._shard_of[position]]
+                shard.cover(gps_location)
+                shard.send(("location", medic_id, gps_location))
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        for shard in self.shards:
+            shard.close()
+
+
+class ShardedMedicMatcher(MedicMatcher):
+    """
+    MedicMatcher that ranks by scatter-gather over region workers.
+
+    find_best_match(), match_and_reserve() and the batch helpers work
+    unchanged; only ranking is distributed. Call close() (or use as a
+    context manager) to stop the workers.
+    """
+
+    # Seconds to wait for a worker's reply before giving up on a query.
+    REQUEST_TIMEOUT_S = 30.0
+
+    def __init__(
+        self,
+        workers: int = 4,
+        traffic_hour: Optional[int] = DEFAULT_TRAFFIC_HOUR,
+        medics: Optional[List[Medic]] = None,
+        road_network=None,
+    ):
+        """
+        Args:
+            workers: Number of region worker processes
+            traffic_hour: Hour of day for ground traffic profiles
+            medics: Roster (default: the mock roster)
+            road_network: road_network.RoadNetwork for ground ETAs; each
+                worker gets a copy
+        """
+        db = ShardedMedicDatabase(workers, traffic_hour=traffic_hour, road_network=road_network)
+        if medics is not None:
+            db.medics = medics
+        super().__init__(traffic_hour=traffic_hour, db=db, road_network=road_network)
+        self._request_ids = itertools.count()
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "ShardedMedicMatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _rank(
+        self,
+        case_category: str,
+        patient_location: tuple[float, float],
+        severity: int,
+        mode: str,
+        k: Optional[int] = None,
+        hour: Optional[int] = None,
+    ) -> List[Dict]:
+        """Top k (default TOP_K) available medics, gathered from the region workers"""
+        return self.rank_many([(case_category, patient_location, severity, mode)], k, hour)[0]
+
+    def rank_many(
+        self, queries: Sequence[Query], k: Optional[int] = None, hour: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        _rank() for many queries at once; each wave is sent for every query
+        before any reply is awaited, so all workers stay busy.
+
+        Args:
+            queries: (case_category, patient_location, severity, mode) each
+            k: Medics per query (default TOP_K)
+            hour: Traffic hour for the ETAs (default: self.traffic_hour)
+
+        Raises:
+            RuntimeError: If a worker needed for a query has exited
+            concurrent.futures.TimeoutError: If a worker does not answer
+                within REQUEST_TIMEOUT_S
+        """
+        k = self.TOP_K if k is None else k
+        shards = self.db.shards
+
+        def ask(shard: _Shard, query: Query) -> Future:
+            request_id = next(self._request_ids)
+            return shard.request(request_id, ("rank", request_id, *query, k, hour))
+
+        distances = [[shard.min_distance_km(q[1]) for shard in shards] for q in queries]
+        nearest = [min(range(len(shards)), key=d.__getitem__) for d in distances]
+        first = [ask(shards[s], q) if not math.isinf(d[s]) else None for q, d, s in zip(queries, distances, nearest)]
+
+        found: List[List[Tuple[float, int]]] = []
+        rest: List[List[Future]] = []
+        for q, d, s, future in zip(queries, distances, nearest, first):
+            local = future.result(timeout=self.REQUEST_TIMEOUT_S) if future is not None else []
+            found.append(local)
+            # Strictly greater: a medic in another region with an equal score
+            # but an earlier roster position would win the tie.
+            kth = -sorted(local)[k - 1][0] if len(local) >= k else -math.inf
+            rest.append([
+                ask(shard, q) for i, shard in enumerate(shards)
+                if i != s and not math.isinf(d[i]) and not kth > self._score_bound(d[i])
+            ])
+
+        medics = self.db.medics
+        results = []
+        for (category, location, severity, mode), local, futures in zip(queries, found, rest):
+            for future in futures:
+                local = local + future.result(timeout=self.REQUEST_TIMEOUT_S)
+            results.append([
+                {
+                    "medic": medics[position],
+                    "score_data": self._calculate_match_score(
+                        medics[position], category, location, severity, mode, hour
+                    ),
+                }
+                for _, position in heapq.nsmallest(k, local)
+            ])
+        return results
@@ -0,0 +1,408 @@
+"""
+SQLite Medic Store
+Persistent medic roster shared by several worker processes.
+
+SQLiteMedicDatabase is a MedicDatabase whose roster lives in an SQLite file
+(WAL mode, so readers never block the writer and several processes can
+open it at once):
+
+    medics       one row per medic; the INTEGER PRIMARY KEY is the roster
+                 position, so positions are stable across processes
+    medic_rtree  R*Tree over medic locations for bounding-box queries
+
+Each process keeps the in-memory indexes MedicMatcher scores from (status
+buckets, roster arrays). Every write stamps the row with a new version;
+refresh() (run before each ranking) uses PRAGMA data_version to notice
+commits from other connections and applies only rows with a newer version.
+Candidate search goes to the R*Tree: RTreeGridIndex answers the grid's ring
+queries with one box query per ring, so the matcher's pruning bound is
+unchanged.
+
+Leases (LeaseBook) are per process, but taking a medic is a compare-and-set
+in SQL (UPDATE ... WHERE status = 'available'), so of several processes
+racing for the same medic exactly one reserves it; the others move on to
+their next candidate.
+"""
+
+import os
+import random
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .medic_index import MedicGridIndex, cell_deg_for
+from .medic_leases import RESERVED
+from .medic_matcher import Medic, MedicDatabase
+from .medic_roster import MedicRoster
+
+
+PathLike = Union[str, os.PathLike]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS medics (
+    position INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    specialty TEXT NOT NULL,
+    certification_level TEXT NOT NULL,
+    lat REAL NOT NULL,
+    lon REAL NOT NULL,
+    status TEXT NOT NULL,
+    current_load INTEGER NOT NULL,
+    missions_completed INTEGER NOT NULL,
+    rating REAL NOT NULL,
+    languages TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS medics_version ON medics(version);
+CREATE VIRTUAL TABLE IF NOT EXISTS medic_rtree USING rtree(position, min_lat, max_lat, min_lon, max_lon);
+"""
+
+_COLUMNS = (
+    "position, id, name, specialty, certification_level, lat, lon, status, "
+    "current_load, missions_completed, rating, languages"
+)
+
+# R*Tree coordinates are float32, rounded outwards; box queries are widened
+# by this much and the exact float64 locations decide membership.
+_RTREE_SLACK_DEG = 1e-4
+
+
+def connect(path: PathLike) -> sqlite3.Connection:
+    """Open a roster file in WAL mode, creating the schema if needed."""
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _row(position: int, medic: Medic) -> tuple:
+    lat, lon = medic.gps_location
+    return (
+        position, medic.id, medic.name, medic.specialty, medic.certification_level,
+        lat, lon, medic.status, medic.current_load, medic.missions_completed,
+        medic.rating, ",".join(medic.languages),
+    )
+
+
+def _medic(row: Sequence) -> Medic:
+    return Medic(
+        id=row[1],
+        name=row[2],
+        specialty=row[3],
+        certification_level=row[4],
+        gps_location=(row[5], row[6]),
+        status=row[7],
+        current_load=row[8],
+        missions_completed=row[9],
+        rating=row[10],
+        languages=row[11].split(",") if row[11] else [],
+    )
+
+
+def bulk_load(
+    target: Union[PathLike, sqlite3.Connection],
+    medics: Iterable[Medic],
+    batch_size: int = 50_000,
+) -> int:
+    """
+    Append medics to a roster file in a single transaction.
+
+    Rows go in with executemany() in batches; the R*Tree is filled from the
+    new rows with one INSERT ... SELECT afterwards.
+
+    Args:
+        target: Roster file path or an open connection
+        medics: Medics to append (ids must be new)
+        batch_size: Rows per executemany() call
+
+    Returns:
+        Number of medics loaded
+    """
+    conn = target if isinstance(target, sqlite3.Connection) else connect(target)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        start = conn.execute("SELECT coalesce(max(position) + 1, 0) FROM medics").fetchone()[0]
+        insert = f"INSERT INTO medics ({_COLUMNS}) VALUES ({', '.join('?' * 12)})"
+        count = 0
+        batch: List[tuple] = []
+        for medic in medics:
+            batch.append(_row(start + count, medic))
+            count += 1
+            if len(batch) == batch_size:
+                conn.executemany(insert, batch)
+                batch = []
+        if batch:
+            conn.executemany(insert, batch)
+        conn.execute(
+            "INSERT INTO medic_rtree SELECT position, lat, lat, lon, lon FROM medics WHERE position >= ?",
+            (start,),
+        )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        if conn is not target:
+            conn.close()
+    return count
+
+
+class RTreeGridIndex(MedicGridIndex):
+    """
+    MedicGridIndex whose cells are answered by the medic_rtree table.
+
+    Cells, rings and distance bounds are exactly the in-memory grid's; only
+    the lookup of positions in a ring is a box query. Locations are written
+    to the R*Tree by SQLiteMedicDatabase, so insert/move only track bounds.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, roster: MedicRoster, cell_deg: Optional[float] = None):
+        self._conn = conn
+        self._roster = roster
+        self.cells = {}
+        self._bounds = None
+        n = len(roster)
+        if cell_deg is None:
+            cell_deg = cell_deg_for(n, float(np.ptp(roster.lat)), float(np.ptp(roster.lon))) if n else 1.0
+        self.cell_deg = cell_deg
+        if n:
+            rows = np.floor(roster.lat / cell_deg).astype(np.int64)
+            cols = np.floor(roster.lon / cell_deg).astype(np.int64)
+            self._bounds = [int(rows.min()), int(rows.max()), int(cols.min()), int(cols.max())]
+
+    def insert(self, position: int, location: Tuple[float, float]) -> None:
+        row, col = self.cell_of(location)
+        if self._bounds is None:
+            self._bounds = [row, row, col, col]
+        else:
+            b = self._bounds
+            b[0], b[1] = min(b[0], row), max(b[1], row)
+            b[2], b[3] = min(b[2], col), max(b[3], col)
+
+    def remove(self, position: int, location: Tuple[float, float]) -> None:
+        pass
+
+    def move(self, position: int, old: Tuple[float, float], new: Tuple[float, float]) -> None:
+        self.insert(position, new)
+
+    def _ring_positions(self, row: int, col: int, r: int) -> List[int]:
+        c, e = self.cell_deg, _RTREE_SLACK_DEG
+        # Outer box of the ring, minus what is certainly inside the inner rings.
+        found = self._conn.execute(
+            "SELECT position FROM medic_rtree"
+            " WHERE max_lat >= ? AND min_lat <= ? AND max_lon >= ? AND min_lon <= ?"
+            " AND NOT (min_lat > ? AND max_lat < ? AND min_lon > ? AND max_lon < ?)",
+            (
+                (row - r) * c - e, (row + r + 1) * c + e, (col - r) * c - e, (col + r + 1) * c + e,
+                (row - r + 1) * c + e, (row + r) * c - e, (col - r + 1) * c + e, (col + r) * c - e,
+            ),
+        ).fetchall()
+        if not found:
+            return []
+        positions = np.fromiter((f[0] for f in found), dtype=np.intp, count=len(found))
+        positions = positions[positions < len(self._roster)]
+        # Exact cell membership from the float64 locations, as cell_of() computes it.
+        ring = np.maximum(
+            np.abs(np.floor(self._roster.lat[positions] / c).astype(np.int64) - row),
+            np.abs(np.floor(self._roster.lon[positions] / c).astype(np.int64) - col),
+        )
+        return np.sort(positions[ring == r]).tolist()
+
+
+class SQLiteMedicDatabase(MedicDatabase):
+    """
+    MedicDatabase persisted in an SQLite file.
+
+    An empty file is seeded with the same mock roster MedicDatabase
+    generates. Status and location updates are written through to the file
+    before the in-memory indexes change.
+    """
+
+    def __init__(self, path: PathLike, seed: int = 42, cell_deg: Optional[float] = None):
+        """
+        Args:
+            path: Roster file (created if missing)
+            seed: Seed for the mock roster written to an empty file
+            cell_deg: Grid cell edge for ring queries (default: sized from
+                roster density)
+        """
+        self.path = path
+        self.lock = threading.RLock()
+        self.availability_version = 0
+        self._cell_deg = cell_deg
+        self._conn = connect(path)
+        self._rng = random.Random(seed)
+        if self._conn.execute("SELECT count(*) FROM medics").fetchone()[0] == 0:
+            bulk_load(self._conn, self._generate_mock_medics())
+        self._load()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _load(self) -> None:
+        rows = self._conn.execute(f"SELECT {_COLUMNS} FROM medics ORDER BY position").fetchall()
+        if any(row[0] != i for i, row in enumerate(rows)):
+            raise ValueError(f"{self.path}: medic positions are not contiguous from 0")
+        MedicDatabase.medics.fset(self, [_medic(row) for row in rows])
+        self._synced_version = self._conn.execute("SELECT coalesce(max(version), 0) FROM medics").fetchone()[0]
+        self._data_version = self._data_version_now()
+
+    def _set_medics(self, medics: List[Medic]) -> None:
+        """Replace the whole roster, in the file and in memory."""
+        with self.lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM medics")
+            self._conn.execute("DELETE FROM medic_rtree")
+            self._conn.execute("COMMIT")
+            bulk_load(self._conn, medics)
+            self._load()
+
+    medics = MedicDatabase.medics.setter(_set_medics)
+
+    @property
+    def grid(self) -> MedicGridIndex:
+        """R*Tree-backed ring index over roster positions, built on first use."""
+        if self._grid is None:
+            with self.lock:
+                if self._grid is None:
+                    self._grid = RTreeGridIndex(self._conn, self.roster, self._cell_deg)
+        return self._grid
+
+    def _data_version_now(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def refresh(self) -> None:
+        """Apply status and location changes committed by other connections."""
+        if self._data_version_now() == self._data_version:
+            return
+        with self.lock:
+            self._data_version = self._data_version_now()
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS}, version FROM medics WHERE version > ? ORDER BY version",
+                (self._synced_version,),
+            ).fetchall()
+            for row in rows:
+                medic = self._medics[row[0]]
+                if medic.status != row[7]:
+                    MedicDatabase.update_status(self, medic.id, row[7])
+                if medic.gps_location != (row[5], row[6]):
+                    MedicDatabase.update_location(self, medic.id, (row[5], row[6]))
+                self._synced_version = max(self._synced_version, row[-1])
+
+    def _write(self, position: int, expected_status: Optional[str] = None, **columns) -> bool:
+        """
+        Update one medic row (and its R*Tree entry for lat/lon) under a new
+        version; with expected_status, only if the row still has it.
+
+        Returns:
+            False if expected_status did not match
+        """
+        assignments = ", ".join(f"{name} = ?" for name in columns)
+        condition, parameters = "", ()
+        if expected_status is not None:
+            condition, parameters = " AND status = ?", (expected_status,)
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = self._conn.execute("SELECT coalesce(max(version), 0) + 1 FROM medics").fetchone()[0]
+            updated = self._conn.execute(
+                f"UPDATE medics SET {assignments}, version = ? WHERE position = ?{condition}",
+                (*columns.values(), version, position, *parameters),
+            ).rowcount
+            if "lat" in columns:
+                lat, lon = columns["lat"], columns["lon"]
+                self._conn.execute(
+                    "UPDATE medic_rtree SET min_lat = ?, max_lat = ?, min_lon = ?, max_lon = ? WHERE position = ?",
+                    (lat, lat, lon, lon, position),
+                )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        return updated == 1
+
+    def update_status(self, medic_id: str, new_status: str):
+        """Update medic availability status (written through to the file)"""
+        with self.lock:
+            position = self._position_of(medic_id)
+            if position is not None:
+                self._write(position, status=new_status)
+                super().update_status(medic_id, new_status)
+
+    def compare_and_set_status(self, medic_id: str, expected: str, new_status: str) -> bool:
+        """
+        Change a status only if the row in the file still has expected.
+
+        The check and the write are one UPDATE, so across processes sharing
+        the file exactly one wins; a loser picks up the winner's change.
+        """
+        with self.lock:
+            position = self._position_of(medic_id)
+            if position is None:
+                return False
+            if not self._write(position, expected_status=expected, status=new_status):
+                self.refresh()
+                return False
+            MedicDatabase.update_status(self, medic_id, new_status)
+            return True
+
+    def update_location(self, medic_id: str, gps_location: Tuple[float, float]):
+        """Move a medic (written through to the file and its R*Tree entry)"""
+        with self.lock:
+            position = self._position_of(medic_id)
+            if position is not None:
+                self._write(position, lat=gps_location[0], lon=gps_location[1])
+                super().update_location(medic_id, gps_location)
+
+    def apply_updates(
+        self,
+        locations: Optional[Dict[str, Tuple[float, float]]] = None,
+        statuses: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Apply a batch of changes in one transaction, then in memory.
+
+        Status changes skip rows that are reserved in the file, including
+        medics leased by another process since this one last synced.
+        """
+        with self.lock:
+            locations = {k: v for k, v in (locations or {}).items() if k in self._positions}
+            statuses = {k: v for k, v in (statuses or {}).items() if k in self._positions}
+            if not locations and not statuses:
+                return 0
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                version = self._conn.execute("SELECT coalesce(max(version), 0) + 1 FROM medics").fetchone()[0]
+                moved = [(lat, lon, self._positions[k]) for k, (lat, lon) in locations.items()]
+                self._conn.executemany(
+                    "UPDATE medics SET lat = ?, lon = ?, version = ? WHERE position = ?",
+                    [(lat, lon, version, p) for lat, lon, p in moved],
+                )
+                self._conn.executemany(
+                    "UPDATE medic_rtree SET min_lat = ?, max_lat = ?, min_lon = ?, max_lon = ? WHERE position = ?",
+                    [(lat, lat, lon, lon, p) for lat, lon, p in moved],
+                )
+                # Compare-and-set per row, as in compare_and_set_status().
+                statuses = {
+                    k: status for k, status in statuses.items()
+                    if self._conn.execute(
+                        "UPDATE medics SET status = ?, version = ? WHERE position = ? AND status != ?",
+                        (status, version, self._positions[k], RESERVED),
+                    ).rowcount
+                }
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            for medic_id, gps_location in locations.items():
+                MedicDatabase.update_location(self, medic_id, gps_location)
+            for medic_id, status in statuses.items():
+                MedicDatabase.update_status(self, medic_id, status)
+            # Pick up reservations made elsewhere that the skipped rows hit.
+            self.refresh()
+            return len(locations) + len(statuses)
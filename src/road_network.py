@@ -0,0 +1,354 @@
+"""
+Road Network ETA
+Ground ETAs over a road graph instead of straight-line distance x detour.
+
+The graph is read from a local edge-list CSV (no network access needed):
+
+    source,source_lat,source_lon,target,target_lat,target_lon,length_km,road_class,oneway
+    A,24.7701,46.6512,B,24.7712,46.6598,0.9,arterial,0
+
+length_km may be left empty (great-circle length is used), road_class is one
+of ground_eta.ROAD_CLASSES (default arterial) and oneway defaults to 0. Edge
+travel times come from the same hourly minutes-per-km table as
+ground_eta.estimate_ground_eta(), so an ETA is
+
+    DISPATCH_OVERHEAD_MIN + access legs + shortest road time
+
+where the access legs connect each point to its nearest graph node at local
+road speed.
+
+Queries are many-to-one (candidate medics -> one patient):
+  - precompute() runs Dijkstra from depots and medic hubs once per hour and
+    keeps each shortest-path tree's distance labels; medics snapped to a
+    hub node are answered by one array gather.
+  - any other medic is answered from a reverse tree grown from the
+    patient's node, built on first use and cached per (node, hour), so
+    every further candidate for the same patient is a lookup.
+"""
+
+import csv
+import heapq
+import math
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .ground_eta import DEFAULT_ROAD_CLASS, DISPATCH_OVERHEAD_MIN, MINUTES_PER_KM, ROAD_CLASSES
+from .landing_zone import haversine_distance
+from .medic_index import KM_PER_DEGREE, MedicGridIndex
+
+
+# Road class of the off-network legs between a point and its nearest node.
+ACCESS_ROAD_CLASS = "local"
+
+# Reverse trees kept per hour (one per recently queried patient node).
+REVERSE_TREE_CACHE = 64
+
+# Snapped locations remembered (medics mostly report from the same spots).
+SNAP_CACHE = 100_000
+
+
+def _hour(hour: Optional[int]) -> int:
+    return (datetime.now().hour if hour is None else int(hour)) % 24
+
+
+class RoadNetwork:
+    """
+    Directed road graph; edge travel times are derived per hour of day.
+
+    Safe to query from several threads: the snap and tree caches are
+    guarded by a lock, and Dijkstra runs outside it.
+
+    Attributes:
+        node_ids: External node identifiers, by node index
+        lat, lon: Node coordinates
+    """
+
+    def __init__(
+        self,
+        node_ids: Sequence[str],
+        coordinates: Sequence[Tuple[float, float]],
+        edges: Iterable[Tuple[int, int, float, str]],
+    ):
+        """
+        Args:
+            node_ids: Identifier per node index
+            coordinates: (lat, lon) per node index
+            edges: Directed (source index, target index, length_km, road_class)
+        """
+        self.node_ids = list(node_ids)
+        self._index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        coords = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        self.lat, self.lon = coords[:, 0].copy(), coords[:, 1].copy()
+
+        source, target, length, road_class = [], [], [], []
+        for u, v, km, rc in edges:
+            if km < 0:
+                raise ValueError(f"Negative edge length {km} between {self.node_ids[u]} and {self.node_ids[v]}")
+            source.append(u)
+            target.append(v)
+            length.append(km)
+            try:
+                road_class.append(ROAD_CLASSES.index(rc))
+            except ValueError:
+                raise ValueError(f"Unknown road class: {rc!r} (expected one of {ROAD_CLASSES})")
+
+        self._sources = np.asarray(source, dtype=np.intp)
+        self._targets = np.asarray(target, dtype=np.intp)
+        self._length_km = np.asarray(length, dtype=np.float64)
+        self._road_class = np.asarray(road_class, dtype=np.intp)
+
+        self._points = list(zip(self.lat.tolist(), self.lon.tolist()))
+        self._nodes = MedicGridIndex(self._points)
+        self._lock = threading.Lock()
+        self._snapped: Dict[Tuple[float, float], Tuple[int, float]] = {}
+        # hour -> (forward adjacency, reverse adjacency) as Python lists for Dijkstra
+        self._adjacency: Dict[int, Tuple[List, List]] = {}
+        # hour -> (hub node indexes, (len(hubs), n) float64 minutes, like the reverse trees)
+        self._trees: Dict[int, Tuple[Dict[int, int], np.ndarray]] = {}
+        self._reverse: Dict[int, "OrderedDict[int, np.ndarray]"] = {}
+
+    def __getstate__(self) -> dict:
+        # Locks do not pickle (medic_shards ships the network to its
+        # workers); the snap and reverse-tree caches are rebuilt on use.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_snapped"], state["_reverse"] = {}, {}
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._targets)
+
+    @classmethod
+    def from_edge_list(cls, path: str) -> "RoadNetwork":
+        """
+        Load a graph from an edge-list CSV (format in the module docstring).
+
+        Raises:
+            ValueError: If a row has an unknown road class, a negative length
+                or conflicting coordinates for a node
+        """
+        node_ids: List[str] = []
+        coordinates: List[Tuple[float, float]] = []
+        index: Dict[str, int] = {}
+        edges: List[Tuple[int, int, float, str]] = []
+
+        def node(node_id: str, lat: str, lon: str) -> int:
+            location = (float(lat), float(lon))
+            i = index.get(node_id)
+            if i is None:
+                i = index[node_id] = len(node_ids)
+                node_ids.append(node_id)
+                coordinates.append(location)
+            elif coordinates[i] != location:
+                raise ValueError(f"Node {node_id} listed at {coordinates[i]} and {location}")
+            return i
+
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(line for line in f if not line.startswith("#")):
+                u = node(row["source"], row["source_lat"], row["source_lon"])
+                v = node(row["target"], row["target_lat"], row["target_lon"])
+                length = (row.get("length_km") or "").strip()
+                km = float(length) if length else haversine_distance(*coordinates[u], *coordinates[v])
+                road_class = (row.get("road_class") or "").strip() or DEFAULT_ROAD_CLASS
+                edges.append((u, v, km, road_class))
+                if (row.get("oneway") or "0").strip().lower() not in ("1", "true", "yes"):
+                    edges.append((v, u, km, road_class))
+
+        return cls(node_ids, coordinates, edges)
+
+    def node_index(self, node_id: str) -> int:
+        return self._index[node_id]
+
+    def nearest_node(self, location: Tuple[float, float]) -> Tuple[int, float]:
+        """
+        Nearest graph node to a location.
+
+        Returns:
+            (node index, distance in km), distance measured like
+            MedicMatcher (planar degrees x KM_PER_DEGREE)
+        """
+        location = tuple(location)
+        with self._lock:
+            snapped = self._snapped.get(location)
+        if snapped is not None:
+            return snapped
+
+        lat, lon = location
+        points = self._points
+        best, best_km = -1, math.inf
+        for positions, min_distance_km in self._nodes.rings(location):
+            for p in positions:
+                node_lat, node_lon = points[p]
+                km = math.hypot(node_lat - lat, node_lon - lon) * KM_PER_DEGREE
+                if km < best_km or (km == best_km and p < best):
+                    best, best_km = p, km
+            if best_km <= min_distance_km:
+                break
+
+        with self._lock:
+            if len(self._snapped) >= SNAP_CACHE:
+                self._snapped.clear()
+            self._snapped[location] = (best, best_km)
+        return best, best_km
+
+    def _edge_minutes(self, hour: int) -> np.ndarray:
+        return self._length_km * MINUTES_PER_KM[hour, self._road_class]
+
+    def _lists(self, hour: int) -> Tuple[List, List]:
+        adjacency = self._adjacency.get(hour)
+        if adjacency is None:
+            minutes = self._edge_minutes(hour).tolist()
+            forward = [[] for _ in range(len(self))]
+            reverse = [[] for _ in range(len(self))]
+            for u, v, w in zip(self._sources.tolist(), self._targets.tolist(), minutes):
+                forward[u].append((v, w))
+                reverse[v].append((u, w))
+            with self._lock:
+                adjacency = self._adjacency.setdefault(hour, (forward, reverse))
+        return adjacency
+
+    @staticmethod
+    def _dijkstra(adjacency: List, source: int) -> np.ndarray:
+        dist = [math.inf] * len(adjacency)
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            for v, w in adjacency[u]:
+                nd = d + w
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+        return np.asarray(dist, dtype=np.float64)
+
+    def shortest_path_tree(self, source: int, hour: Optional[int] = None, reverse: bool = False) -> np.ndarray:
+        """
+        Travel minutes from node source to every node (to source when
+        reverse); unreachable nodes are inf.
+        """
+        forward, backward = self._lists(_hour(hour))
+        return self._dijkstra(backward if reverse else forward, source)
+
+    def precompute(self, hubs: Iterable[Tuple[float, float]], hours: Optional[Iterable[int]] = None) -> int:
+        """
+        Build shortest-path trees from depot and medic hub locations.
+
+        Args:
+            hubs: (lat, lon) of depots and hubs; each is snapped to its
+                nearest node
+            hours: Hours of day to build for (default: the current hour)
+
+        Returns:
+            Number of distinct hub nodes
+        """
+        nodes = sorted({self.nearest_node(h)[0] for h in hubs})
+        for hour in (hours if hours is not None else [None]):
+            hour = _hour(hour)
+            forward, _ = self._lists(hour)
+            trees = np.empty((len(nodes), len(self)), dtype=np.float64)
+            for row, node in enumerate(nodes):
+                trees[row] = self._dijkstra(forward, node)
+            with self._lock:
+                self._trees[hour] = ({node: row for row, node in enumerate(nodes)}, trees)
+        return len(nodes)
+
+    def _reverse_tree(self, node: int, hour: int) -> np.ndarray:
+        with self._lock:
+            cache = self._reverse.setdefault(hour, OrderedDict())
+            tree = cache.get(node)
+            if tree is not None:
+                cache.move_to_end(node)
+                return tree
+        # Built unlocked; two threads may race to build the same tree, and
+        # the first one stored wins.
+        tree = self._dijkstra(self._lists(hour)[1], node)
+        with self._lock:
+            tree = cache.setdefault(node, tree)
+            cache.move_to_end(node)
+            if len(cache) > REVERSE_TREE_CACHE:
+                cache.popitem(last=False)
+        return tree
+
+    def travel_minutes(
+        self,
+        origins: Sequence[Tuple[float, float]],
+        destination: Tuple[float, float],
+        hour: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Many-to-one ground ETA from each origin to the destination.
+
+        Args:
+            origins: (lat, lon) per candidate (e.g. medic locations)
+            destination: (lat, lon) of the patient
+            hour: Hour of day (default: current hour)
+
+        Returns:
+            Minutes per origin, including dispatch overhead and access legs,
+            rounded to 0.1; inf when no road connects them
+        """
+        hour = _hour(hour)
+        access = MINUTES_PER_KM[hour, ROAD_CLASSES.index(ACCESS_ROAD_CLASS)]
+        target, target_km = self.nearest_node(destination)
+        snapped = [self.nearest_node(o) for o in origins]
+        nodes = np.array([n for n, _ in snapped], dtype=np.intp)
+        access_km = np.array([km for _, km in snapped]) + target_km
+
+        network = np.empty(len(nodes))
+        with self._lock:
+            hubs, trees = self._trees.get(hour, ({}, None))
+        rows = np.array([hubs.get(n, -1) for n in nodes.tolist()], dtype=np.intp)
+        at_hub = rows >= 0
+        if at_hub.any():
+            network[at_hub] = trees[rows[at_hub], target]
+        if not at_hub.all():
+            network[~at_hub] = self._reverse_tree(target, hour)[nodes[~at_hub]]
+
+        return np.round(DISPATCH_OVERHEAD_MIN + access_km * access + network, 1)
+
+    def eta_minutes(
+        self,
+        origin: Tuple[float, float],
+        destination: Tuple[float, float],
+        hour: Optional[int] = None,
+    ) -> float:
+        """Single-origin travel_minutes()."""
+        return float(self.travel_minutes([origin], destination, hour)[0])
+
+
+def grid_network(
+    rows: int,
+    cols: int,
+    origin: Tuple[float, float],
+    spacing_deg: float,
+    road_class: str = DEFAULT_ROAD_CLASS,
+) -> RoadNetwork:
+    """
+    Synthetic rows x cols street grid with two-way edges between neighbours,
+    node "r{row}c{col}" at origin + (row, col) * spacing_deg.
+    """
+    ids = [f"r{r}c{c}" for r in range(rows) for c in range(cols)]
+    coordinates = [(origin[0] + r * spacing_deg, origin[1] + c * spacing_deg) for r in range(rows) for c in range(cols)]
+    km = spacing_deg * KM_PER_DEGREE
+    edges = []
+    for r in range(rows):
+        for c in range(cols):
+            i = r * cols + c
+            for j in ([i + 1] if c + 1 < cols else []) + ([i + cols] if r + 1 < rows else []):
+                edges.append((i, j, km, road_class))
+                edges.append((j, i, km, road_class))
+    return RoadNetwork(ids, coordinates, edges)
@@ -0,0 +1,255 @@
+"""
+Landing Zone Spatial Index
+KD-tree over landing zones as 3-D unit vectors, built once per catalogue.
+
+On the unit sphere the straight-line (chord) distance between two points
+grows monotonically with their great-circle distance, so nearest, k-nearest
+and radius queries can be answered in Euclidean 3-space with a KD-tree and
+give the same zones as a haversine scan. Only the zones returned get their
+haversine distance, bearing and flight time computed (zone_result()).
+
+A radius of r km is a chord of 2 sin(r / 2R).
+
+The tree is static: leaves of up to LEAF_SIZE zones are scanned with NumPy,
+internal nodes split the widest axis at the median, and every node keeps
+its bounding box for pruning.
+"""
+
+import heapq
+import logging
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .landing_zone import (
+    DEFAULT_PATIENT_LAT,
+    DEFAULT_PATIENT_LON,
+    EARTH_RADIUS_KM,
+    LandingZoneResult,
+    _validate_coordinates,
+    haversine_distance,
+    zone_result,
+)
+
+logger = logging.getLogger(__name__)
+
+
+LEAF_SIZE = 16
+
+# Rounding slack of LandingZoneResult.distance_km (0.01 km) for radius queries.
+_RADIUS_SLACK_KM = 0.005 + 1e-6
+
+
+def unit_vectors(lat, lon) -> np.ndarray:
+    """(n, 3) unit vectors for latitudes and longitudes in degrees."""
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def chord_for_km(distance_km: float) -> float:
+    """Unit-sphere chord length of a great-circle distance."""
+    return 2 * math.sin(min(max(distance_km, 0.0) / EARTH_RADIUS_KM, math.pi) / 2)
+
+
+class UnitVectorKDTree:
+    """
+    Static KD-tree over points on the unit sphere.
+
+    Attributes:
+        points: (n, 3) unit vectors, in tree order
+        order: Input index of each point in tree order
+    """
+
+    def __init__(self, lat: Sequence[float], lon: Sequence[float]):
+        xyz = unit_vectors(lat, lon).reshape(-1, 3)
+        self.order = np.arange(len(xyz), dtype=np.intp)
+        # Per node: start, end, left child, right child (-1 for leaves)
+        self._nodes: List[List[int]] = []
+        self._lo: List[np.ndarray] = []
+        self._hi: List[np.ndarray] = []
+        if len(xyz):
+            self._build(xyz, 0, len(xyz))
+        self.points = xyz[self.order]
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def _build(self, xyz: np.ndarray, start: int, end: int) -> int:
+        node = len(self._nodes)
+        block = xyz[self.order[start:end]]
+        lo, hi = block.min(axis=0), block.max(axis=0)
+        self._nodes.append([start, end, -1, -1])
+        self._lo.append(lo)
+        self._hi.append(hi)
+        if end - start > LEAF_SIZE:
+            axis = int(np.argmax(hi - lo))
+            mid = (end - start) // 2
+            split = np.argpartition(block[:, axis], mid, kind="introselect")
+            self.order[start:end] = self.order[start:end][split]
+            self._nodes[node][2] = self._build(xyz, start, start + mid)
+            self._nodes[node][3] = self._build(xyz, start + mid, end)
+        return node
+
+    def _min_d2(self, node: int, q: np.ndarray) -> float:
+        gap = np.maximum(self._lo[node] - q, 0) + np.maximum(q - self._hi[node], 0)
+        return float(gap @ gap)
+
+    def query(self, lat: float, lon: float, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        k nearest points, nearest first (ties by input index).
+
+        Returns:
+            (input indexes, squared chord distances)
+        """
+        if not len(self) or k < 1:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        q = unit_vectors(lat, lon)
+        best_index = np.empty(0, dtype=np.intp)
+        best_d2 = np.empty(0)
+        heap = [(0.0, 0)]
+        while heap:
+            bound, node = heapq.heappop(heap)
+            # Strict: a point at exactly the k-th distance can still win on index.
+            if len(best_d2) >= k and bound > best_d2[-1]:
+                break
+            start, end, left, right = self._nodes[node]
+            if left < 0:
+                d = self.points[start:end] - q
+                best_index = np.concatenate([best_index, self.order[start:end]])
+                best_d2 = np.concatenate([best_d2, np.einsum("ij,ij->i", d, d)])
+                keep = np.lexsort((best_index, best_d2))[:k]
+                best_index, best_d2 = best_index[keep], best_d2[keep]
+            else:
+                heapq.heappush(heap, (self._min_d2(left, q), left))
+                heapq.heappush(heap, (self._min_d2(right, q), right))
+        return best_index, best_d2
+
+    def query_radius(self, lat: float, lon: float, chord: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Points within a chord distance, nearest first (ties by input index).
+
+        Returns:
+            (input indexes, squared chord distances)
+        """
+        if not len(self):
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        q = unit_vectors(lat, lon)
+        r2 = chord * chord
+        found_index, found_d2 = [], []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._min_d2(node, q) > r2:
+                continue
+            start, end, left, right = self._nodes[node]
+            if left < 0:
+                d = self.points[start:end] - q
+                d2 = np.einsum("ij,ij->i", d, d)
+                inside = d2 <= r2
+                found_index.append(self.order[start:end][inside])
+                found_d2.append(d2[inside])
+            else:
+                stack.extend((left, right))
+        if not found_index:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        index, d2 = np.concatenate(found_index), np.concatenate(found_d2)
+        keep = np.lexsort((index, d2))
+        return index[keep], d2[keep]
+
+
+class LandingZoneIndex:
+    """
+    Nearest, k-nearest and radius queries over a landing zone catalogue.
+
+    Answers the same queries as find_nearest_zone(), get_all_zones_sorted()
+    and get_zones_within_radius() without scanning every zone.
+
+    Attributes:
+        zones: Zones with valid coordinates, in catalogue order
+    """
+
+    def __init__(self, zones: List[Dict]):
+        """
+        Args:
+            zones: List of landing zones from data_loader.load_landing_zones()
+        """
+        self.zones = []
+        for zone in zones:
+            if _validate_coordinates(zone.get("latitude", 0), zone.get("longitude", 0)):
+                self.zones.append(zone)
+            else:
+                logger.warning(f"Invalid zone coordinates: {zone.get('name', 'Unknown')}")
+        self._tree = UnitVectorKDTree(
+            [z["latitude"] for z in self.zones],
+            [z["longitude"] for z in self.zones],
+        )
+
+    def __len__(self) -> int:
+        return len(self.zones)
+
+    def _results(self, indexes: np.ndarray, patient_lat: float, patient_lon: float) -> List[LandingZoneResult]:
+        """Results for the given zones, ordered like get_all_zones_sorted()."""
+        results = []
+        for i in np.sort(indexes).tolist():
+            zone = self.zones[i]
+            distance = haversine_distance(patient_lat, patient_lon, zone["latitude"], zone["longitude"])
+            results.append(zone_result(zone, distance, patient_lat, patient_lon))
+        return sorted(results, key=lambda z: z.distance_km)
+
+    def nearest(
+        self,
+        patient_lat: float = DEFAULT_PATIENT_LAT,
+        patient_lon: float = DEFAULT_PATIENT_LON,
+    ) -> Optional[LandingZoneResult]:
+        """Nearest zone (first in catalogue order on ties), or None for an empty catalogue."""
+        indexes, _ = self._tree.query(patient_lat, patient_lon, 1)
+        if not len(indexes):
+            return None
+        zone = self.zones[int(indexes[0])]
+        distance = haversine_distance(patient_lat, patient_lon, zone["latitude"], zone["longitude"])
+        return zone_result(zone, distance, patient_lat, patient_lon)
+
+    def k_nearest(
+        self,
+        k: int,
+        patient_lat: float = DEFAULT_PATIENT_LAT,
+        patient_lon: float = DEFAULT_PATIENT_LON,
+    ) -> List[LandingZoneResult]:
+        """
+        The k nearest zones, same as get_all_zones_sorted(...)[:k].
+
+        That list sorts on the rounded distance_km, so zones just beyond the
+        k-th that round to the same distance are considered too.
+        """
+        indexes, d2 = self._tree.query(patient_lat, patient_lon, k)
+        if not len(indexes):
+            return []
+        kth_km = 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(d2[-1]) / 2, 1.0))
+        indexes, _ = self._tree.query_radius(patient_lat, patient_lon, chord_for_km(kth_km + 2 * _RADIUS_SLACK_KM))
+        return self._results(indexes, patient_lat, patient_lon)[:k]
+
+    def within_radius(
+        self,
+        radius_km: float,
+        patient_lat: float = DEFAULT_PATIENT_LAT,
+        patient_lon: float = DEFAULT_PATIENT_LON,
+    ) -> List[LandingZoneResult]:
+        """
+        Zones within radius_km, same as get_zones_within_radius(): the
+        reported (rounded) distance_km is compared with the radius.
+        """
+        indexes, _ = self._tree.query_radius(patient_lat, patient_lon, chord_for_km(radius_km + _RADIUS_SLACK_KM))
+        return [z for z in self._results(indexes, patient_lat, patient_lon) if z.distance_km <= radius_km]
+
+
+@lru_cache(maxsize=1)
+def load_zone_index() -> LandingZoneIndex:
+    """LandingZoneIndex over data_loader.load_landing_zones(), built on first call."""
+    # Imported here: data_loader configures logging when imported.
+    from .data_loader import load_landing_zones
+
+    return LandingZoneIndex(load_landing_zones())
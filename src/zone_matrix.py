@@ -0,0 +1,230 @@
+"""
+Landing Zone Distance Matrices
+Patients x zones distance, bearing and flight time for planning studies.
+
+The same formulas as landing_zone.haversine_distance(), calculate_bearing()
+and estimate_flight_time(), broadcast over arrays of patient and zone
+coordinates. Patients are processed in row chunks sized so the temporaries
+of one chunk stay under max_chunk_bytes, whatever the number of patients.
+
+    lat, lon = zone_coordinates(load_landing_zones())
+    m = zone_matrices(incident_lat, incident_lon, lat, lon)
+    m.distance_km[i, j]  # patient i to zone j
+
+For only the closest zones, nearest_zones() keeps k per patient and never
+materializes the full matrix.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from .landing_zone import EARTH_RADIUS_KM
+
+
+DEFAULT_DRONE_SPEED_KMH = 120.0
+
+# Working memory per chunk (several float64 temporaries of chunk x zones).
+DEFAULT_MAX_CHUNK_BYTES = 64 * 1024 * 1024
+_TEMPORARIES = 8
+
+
+@dataclass
+class ZoneMatrices:
+    """
+    Patients x zones results (row = patient, column = zone).
+
+    Attributes:
+        distance_km: Great-circle distance
+        bearing: Initial compass bearing from patient to zone (0-360)
+        flight_time_min: Drone flight time at the requested speed
+    """
+    distance_km: np.ndarray
+    bearing: np.ndarray
+    flight_time_min: np.ndarray
+
+
+def zone_coordinates(zones: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """(latitudes, longitudes) of zone dicts, in list order."""
+    return (
+        np.array([z.get("latitude", 0) for z in zones], dtype=np.float64),
+        np.array([z.get("longitude", 0) for z in zones], dtype=np.float64),
+    )
+
+
+def _as_array(values) -> np.ndarray:
+    return np.atleast_1d(np.asarray(values, dtype=np.float64))
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Element-wise (broadcasting) haversine_distance() in km."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def flight_time_matrix(distance_km, drone_speed_kmh: float = DEFAULT_DRONE_SPEED_KMH) -> np.ndarray:
+    """Vectorized estimate_flight_time(): minutes, 0 for non-positive distance or speed."""
+    distance_km = np.asarray(distance_km, dtype=np.float64)
+    if drone_speed_kmh <= 0:
+        return np.zeros_like(distance_km)
+    return np.where(distance_km > 0, distance_km / drone_speed_kmh * 60, 0.0)
+
+
+def chunk_rows(n_zones: int, max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES) -> int:
+    """Patients per chunk so that one chunk's temporaries fit max_chunk_bytes."""
+    return max(1, max_chunk_bytes // (max(n_zones, 1) * 8 * _TEMPORARIES))
+
+
+class _Zones:
+    """Zone-side terms shared by every chunk."""
+
+    def __init__(self, zone_lat, zone_lon):
+        self.lat = _as_array(zone_lat)
+        self.lon = _as_array(zone_lon)
+        if self.lat.shape != self.lon.shape:
+            raise ValueError(f"zone_lat and zone_lon differ in shape: {self.lat.shape} vs {self.lon.shape}")
+        self.lat_rad = np.radians(self.lat)
+        self.lon_rad = np.radians(self.lon)
+        self.cos_lat = np.cos(self.lat_rad)
+        self.sin_lat = np.sin(self.lat_rad)
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def distance(self, lat_rad: np.ndarray, lon_rad: np.ndarray, columns=slice(None)) -> np.ndarray:
+        """Haversine km from patients (column vectors of radians) to zones[columns]."""
+        dlat = self.lat_rad[columns] - lat_rad
+        dlon = self.lon_rad[columns] - lon_rad
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat_rad) * self.cos_lat[columns] * np.sin(dlon / 2) ** 2
+        return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    def bearing(self, lat_rad: np.ndarray, lon_rad: np.ndarray, columns=slice(None)) -> np.ndarray:
+        """Initial bearing in degrees from patients to zones[columns]."""
+        dlon = self.lon_rad[columns] - lon_rad
+        zone_cos = self.cos_lat[columns]
+        x = np.sin(dlon) * zone_cos
+        y = np.cos(lat_rad) * self.sin_lat[columns] - np.sin(lat_rad) * zone_cos * np.cos(dlon)
+        return (np.degrees(np.arctan2(x, y)) + 360) % 360
+
+
+def iter_zone_matrices(
+    patient_lat,
+    patient_lon,
+    zone_lat,
+    zone_lon,
+    drone_speed_kmh: float = DEFAULT_DRONE_SPEED_KMH,
+    max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+) -> Iterator[Tuple[slice, ZoneMatrices]]:
+    """
+    Patients x zones matrices one row chunk at a time.
+
+    Yields:
+        (patient rows covered, ZoneMatrices for those rows)
+    """
+    zones = _Zones(zone_lat, zone_lon)
+    lat = np.radians(_as_array(patient_lat))
+    lon = np.radians(_as_array(patient_lon))
+    step = chunk_rows(len(zones), max_chunk_bytes)
+    for start in range(0, len(lat), step):
+        rows = slice(start, min(start + step, len(lat)))
+        chunk_lat, chunk_lon = lat[rows, None], lon[rows, None]
+        distance = zones.distance(chunk_lat, chunk_lon)
+        yield rows, ZoneMatrices(
+            distance, zones.bearing(chunk_lat, chunk_lon), flight_time_matrix(distance, drone_speed_kmh)
+        )
+
+
+def zone_matrices(
+    patient_lat,
+    patient_lon,
+    zone_lat,
+    zone_lon,
+    drone_speed_kmh: float = DEFAULT_DRONE_SPEED_KMH,
+    dtype=np.float64,
+    max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+) -> ZoneMatrices:
+    """
+    Full patients x zones matrices.
+
+    The outputs are allocated once (3 x patients x zones of dtype; float32
+    halves them) and filled chunk by chunk, so working memory on top of
+    them stays within max_chunk_bytes.
+
+    Args:
+        patient_lat, patient_lon: Patient coordinates in degrees
+        zone_lat, zone_lon: Zone coordinates in degrees
+        drone_speed_kmh: Cruise speed for flight times
+        dtype: Output dtype
+        max_chunk_bytes: Working-memory budget per chunk
+
+    Returns:
+        ZoneMatrices of shape (patients, zones)
+
+    Examples:
+        >>> m = zone_matrices([24.7745], [46.6575], [24.7703], [46.6529])
+        >>> round(float(m.distance_km[0, 0]), 2), round(float(m.bearing[0, 0]), 1)
+        (0.66, 224.8)
+    """
+    n_patients = len(_as_array(patient_lat))
+    n_zones = len(_as_array(zone_lat))
+    out = ZoneMatrices(*(np.empty((n_patients, n_zones), dtype=dtype) for _ in range(3)))
+    for rows, chunk in iter_zone_matrices(
+        patient_lat, patient_lon, zone_lat, zone_lon, drone_speed_kmh, max_chunk_bytes
+    ):
+        out.distance_km[rows] = chunk.distance_km
+        out.bearing[rows] = chunk.bearing
+        out.flight_time_min[rows] = chunk.flight_time_min
+    return out
+
+
+def nearest_zones(
+    patient_lat,
+    patient_lon,
+    zone_lat,
+    zone_lon,
+    k: int = 1,
+    drone_speed_kmh: float = DEFAULT_DRONE_SPEED_KMH,
+    max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+) -> Tuple[np.ndarray, ZoneMatrices]:
+    """
+    The k nearest zones per patient, nearest first.
+
+    Only distances are computed for the whole chunk; bearing and flight
+    time are computed for the selected zones only. Ties at equal distance
+    go to the lower zone index.
+
+    Returns:
+        (zone indexes of shape (patients, k), ZoneMatrices of shape
+        (patients, k)); k is capped at the number of zones
+    """
+    zones = _Zones(zone_lat, zone_lon)
+    lat = np.radians(_as_array(patient_lat))
+    lon = np.radians(_as_array(patient_lon))
+    k = max(0, min(k, len(zones)))
+    indexes = np.empty((len(lat), k), dtype=np.intp)
+    distance = np.empty((len(lat), k))
+    bearing = np.empty((len(lat), k))
+    if k < 1:
+        return indexes, ZoneMatrices(distance, bearing, distance.copy())
+
+    step = chunk_rows(len(zones), max_chunk_bytes)
+    for start in range(0, len(lat), step):
+        rows = slice(start, min(start + step, len(lat)))
+        chunk_lat, chunk_lon = lat[rows, None], lon[rows, None]
+        full = zones.distance(chunk_lat, chunk_lon)
+
+        order = np.argpartition(full, k - 1, axis=1)[:, :k]
+        kth = np.take_along_axis(full, order, axis=1).max(axis=1, keepdims=True)
+        # argpartition picks arbitrarily among zones tied at the k-th
+        # distance; redo those rows with a stable sort.
+        for r in np.flatnonzero((full <= kth).sum(axis=1) > k).tolist():
+            order[r] = np.argsort(np.where(full[r] <= kth[r], full[r], np.inf), kind="stable")[:k]
+        order = np.take_along_axis(order, np.lexsort((order, np.take_along_axis(full, order, axis=1))), axis=1)
+
+        indexes[rows] = order
+        distance[rows] = np.take_along_axis(full, order, axis=1)
+        bearing[rows] = zones.bearing(chunk_lat, chunk_lon, order)
+
+    return indexes, ZoneMatrices(distance, bearing, flight_time_matrix(distance, drone_speed_kmh))
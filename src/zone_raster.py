@@ -0,0 +1,317 @@
+"""
+Nearest-Zone Raster
+Precomputed nearest landing zone per cell of the service area.
+
+The service bounds (AL_GHADIR_BOUNDS by default) are cut into square cells
+of cell_deg. A cell stores the index of its nearest zone when all four
+corners have the same nearest zone, each with a margin of MARGIN_KM over
+the runner-up: nearest-zone regions are convex, so the whole cell then
+belongs to that zone and a lookup is one array index.
+
+Other cells are ambiguous (a region boundary crosses them) and store a
+short list of candidate zones instead: every zone whose distance to the
+cell centre is within the largest corner nearest-distance plus the cell
+diagonal, which includes the nearest zone of every point in the cell. A
+lookup there is an exact haversine check over those few candidates.
+Points outside the bounds fall back to the zone_index KD-tree.
+
+Building works tile by tile: each tile of TILE x TILE cells only considers
+zones that can be nearest to some point of the tile, so the build scales
+with cells rather than cells x zones. The raster is built once, saved with
+save() and reloaded on restart with load_or_build(), which rebuilds when
+the zones, bounds or cell size changed.
+"""
+
+import logging
+import math
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .landing_zone import AL_GHADIR_BOUNDS, LandingZoneResult, haversine_distance, zone_result
+from .zone_index import LandingZoneIndex, chord_for_km
+from .zone_matrix import haversine_km, nearest_zones
+
+logger = logging.getLogger(__name__)
+
+
+# Required gap between the nearest and second-nearest zone at every corner
+# of a single-zone cell (covers floating-point and spherical-edge error).
+MARGIN_KM = 0.002
+
+TILE = 32
+
+MIN_CELL_DEG = 1e-5
+
+# Slack on candidate radii (km).
+_SLACK_KM = 1e-3
+
+
+def auto_cell_deg(n_zones: int, bounds: Dict[str, float]) -> float:
+    """Cell edge of about an eighth of the mean zone spacing over bounds."""
+    lat_span = bounds["lat_max"] - bounds["lat_min"]
+    lon_span = bounds["lon_max"] - bounds["lon_min"]
+    spacing = math.sqrt(lat_span * lon_span / max(n_zones, 1))
+    return max(spacing / 8, MIN_CELL_DEG)
+
+
+class NearestZoneRaster:
+    """
+    Nearest-zone lookup raster over a bounding box.
+
+    Attributes:
+        index: LandingZoneIndex the raster refers to (zone indexes are
+            positions in index.zones)
+        bounds: lat_min, lat_max, lon_min, lon_max
+        cell_deg: Cell edge in degrees
+        cells: (rows, cols) int32; >= 0 is the zone index, -(j + 1) marks
+            ambiguous cell j
+    """
+
+    def __init__(
+        self,
+        index: LandingZoneIndex,
+        bounds: Dict[str, float],
+        cell_deg: float,
+        cells: np.ndarray,
+        offsets: np.ndarray,
+        candidates: np.ndarray,
+    ):
+        self.index = index
+        self.bounds = dict(bounds)
+        self.cell_deg = cell_deg
+        self.cells = cells
+        self._offsets = offsets
+        self._candidates = candidates
+        self._lat_min = bounds["lat_min"]
+        self._lon_min = bounds["lon_min"]
+        self._rows, self._cols = cells.shape
+        self._zone_lat = np.array([z["latitude"] for z in index.zones], dtype=np.float64)
+        self._zone_lon = np.array([z["longitude"] for z in index.zones], dtype=np.float64)
+
+    @property
+    def ambiguous_fraction(self) -> float:
+        return float((self.cells < 0).mean()) if self.cells.size else 0.0
+
+    @classmethod
+    def build(
+        cls,
+        zones: List[Dict],
+        bounds: Dict[str, float] = AL_GHADIR_BOUNDS,
+        cell_deg: Optional[float] = None,
+    ) -> "NearestZoneRaster":
+        """
+        Compute the raster.
+
+        Args:
+            zones: Landing zones (invalid coordinates are skipped)
+            bounds: Service area with lat_min, lat_max, lon_min, lon_max
+            cell_deg: Cell edge in degrees (default: auto_cell_deg())
+
+        Raises:
+            ValueError: If there are no valid zones or bounds are empty
+        """
+        index = zones if isinstance(zones, LandingZoneIndex) else LandingZoneIndex(zones)
+        if not len(index):
+            raise ValueError("No valid landing zones to rasterize")
+        if bounds["lat_max"] <= bounds["lat_min"] or bounds["lon_max"] <= bounds["lon_min"]:
+            raise ValueError(f"Empty bounds: {bounds}")
+        if cell_deg is None:
+            cell_deg = auto_cell_deg(len(index), bounds)
+
+        rows = math.ceil((bounds["lat_max"] - bounds["lat_min"]) / cell_deg)
+        cols = math.ceil((bounds["lon_max"] - bounds["lon_min"]) / cell_deg)
+        corner_lat = bounds["lat_min"] + np.arange(rows + 1) * cell_deg
+        corner_lon = bounds["lon_min"] + np.arange(cols + 1) * cell_deg
+        zone_lat = np.array([z["latitude"] for z in index.zones], dtype=np.float64)
+        zone_lon = np.array([z["longitude"] for z in index.zones], dtype=np.float64)
+
+        cells = np.empty((rows, cols), dtype=np.int32)
+        offsets = [0]
+        candidates: List[np.ndarray] = []
+
+        for r0 in range(0, rows, TILE):
+            r1 = min(r0 + TILE, rows)
+            for c0 in range(0, cols, TILE):
+                c1 = min(c0 + TILE, cols)
+                tile_lat, tile_lon = corner_lat[r0:r1 + 1], corner_lon[c0:c1 + 1]
+
+                # Zones that can be nearest anywhere in the tile.
+                center = ((tile_lat[0] + tile_lat[-1]) / 2, (tile_lon[0] + tile_lon[-1]) / 2)
+                half_diag = haversine_distance(*center, tile_lat[0], tile_lon[0])
+                nearest, _ = index._tree.query(*center, 1)
+                center_km = haversine_distance(*center, zone_lat[nearest[0]], zone_lon[nearest[0]])
+                near, _ = index._tree.query_radius(*center, chord_for_km(center_km + 2 * half_diag + _SLACK_KM))
+                near = np.sort(near)
+
+                # Nearest and runner-up at every corner.
+                grid_lat, grid_lon = np.meshgrid(tile_lat, tile_lon, indexing="ij")
+                k = min(2, len(near))
+                order, found = nearest_zones(grid_lat.ravel(), grid_lon.ravel(), zone_lat[near], zone_lon[near], k=k)
+                first = near[order[:, 0]].reshape(grid_lat.shape)
+                d1 = found.distance_km[:, 0].reshape(grid_lat.shape)
+                margin = (found.distance_km[:, 1] - found.distance_km[:, 0] if k == 2
+                          else np.full(len(order), np.inf)).reshape(grid_lat.shape)
+
+                sure = margin > MARGIN_KM
+                same = (
+                    (first[:-1, :-1] == first[1:, :-1]) & (first[:-1, :-1] == first[:-1, 1:])
+                    & (first[:-1, :-1] == first[1:, 1:])
+                    & sure[:-1, :-1] & sure[1:, :-1] & sure[:-1, 1:] & sure[1:, 1:]
+                )
+                block = np.where(same, first[:-1, :-1], -1).astype(np.int32)
+
+                # Candidate lists for the ambiguous cells.
+                ambiguous = np.argwhere(~same)
+                if len(ambiguous):
+                    i, j = ambiguous[:, 0], ambiguous[:, 1]
+                    cell_lat = (tile_lat[i] + tile_lat[i + 1]) / 2
+                    cell_lon = (tile_lon[j] + tile_lon[j + 1]) / 2
+                    diag = haversine_km(tile_lat[i], tile_lon[j], tile_lat[i + 1], tile_lon[j + 1])
+                    reach = np.maximum.reduce([d1[i, j], d1[i + 1, j], d1[i, j + 1], d1[i + 1, j + 1]]) + diag
+                    within = haversine_km(cell_lat[:, None], cell_lon[:, None], zone_lat[near], zone_lon[near]) \
+                        <= (reach + _SLACK_KM)[:, None]
+                    for n, row in enumerate(within):
+                        candidates.append(near[row])
+                        offsets.append(offsets[-1] + int(row.sum()))
+                        block[i[n], j[n]] = -(len(offsets) - 1)
+                cells[r0:r1, c0:c1] = block
+
+        raster = cls(
+            index, bounds, cell_deg, cells,
+            np.asarray(offsets, dtype=np.int64),
+            np.concatenate(candidates).astype(np.int32) if candidates else np.empty(0, dtype=np.int32),
+        )
+        logger.info(f"Nearest-zone raster {rows}x{cols} at {cell_deg:.6f} deg, "
+                    f"{raster.ambiguous_fraction:.1%} ambiguous cells")
+        return raster
+
+    def save(self, path: str) -> None:
+        """Write the raster (with the zone coordinates it was built for) to an .npz file."""
+        tmp = f"{path}.tmp.npz"
+        np.savez_compressed(
+            tmp,
+            bounds=np.array([self.bounds[k] for k in ("lat_min", "lat_max", "lon_min", "lon_max")]),
+            cell_deg=np.array(self.cell_deg),
+            cells=self.cells,
+            offsets=self._offsets,
+            candidates=self._candidates,
+            zone_lat=self._zone_lat,
+            zone_lon=self._zone_lon,
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        zones: List[Dict],
+        bounds: Optional[Dict[str, float]] = None,
+        cell_deg: Optional[float] = None,
+    ) -> "NearestZoneRaster":
+        """
+        Read a raster written by save().
+
+        Args:
+            path: .npz file
+            zones: The zones it must have been built for
+            bounds, cell_deg: Required values (default: accept the saved ones)
+
+        Raises:
+            ValueError: If the file was built for other zones, bounds or cell size
+        """
+        index = zones if isinstance(zones, LandingZoneIndex) else LandingZoneIndex(zones)
+        with np.load(path) as data:
+            saved_bounds = dict(zip(("lat_min", "lat_max", "lon_min", "lon_max"), data["bounds"].tolist()))
+            saved_cell = float(data["cell_deg"])
+            zone_lat = np.array([z["latitude"] for z in index.zones], dtype=np.float64)
+            zone_lon = np.array([z["longitude"] for z in index.zones], dtype=np.float64)
+            if not (np.array_equal(data["zone_lat"], zone_lat) and np.array_equal(data["zone_lon"], zone_lon)):
+                raise ValueError(f"{path} was built for different landing zones")
+            if bounds is not None and saved_bounds != {k: float(bounds[k]) for k in saved_bounds}:
+                raise ValueError(f"{path} covers {saved_bounds}, not {bounds}")
+            if cell_deg is not None and saved_cell != cell_deg:
+                raise ValueError(f"{path} has cell size {saved_cell}, not {cell_deg}")
+            return cls(index, saved_bounds, saved_cell, data["cells"], data["offsets"], data["candidates"])
+
+    @classmethod
+    def load_or_build(
+        cls,
+        path: str,
+        zones: List[Dict],
+        bounds: Dict[str, float] = AL_GHADIR_BOUNDS,
+        cell_deg: Optional[float] = None,
+    ) -> "NearestZoneRaster":
+        """Load the raster at path, or build and save it if missing or stale."""
+        index = zones if isinstance(zones, LandingZoneIndex) else LandingZoneIndex(zones)
+        if os.path.exists(path):
+            try:
+                return cls.load(path, index, bounds, cell_deg)
+            except (ValueError, OSError, KeyError) as e:
+                logger.warning(f"Rebuilding nearest-zone raster: {e}")
+        raster = cls.build(index, bounds, cell_deg)
+        raster.save(path)
+        return raster
+
+    def nearest_index(self, patient_lat: float, patient_lon: float) -> Optional[int]:
+        """
+        Index into index.zones of the nearest zone (first in catalogue
+        order on ties, like find_nearest_zone()).
+        """
+        row = math.floor((patient_lat - self._lat_min) / self.cell_deg)
+        col = math.floor((patient_lon - self._lon_min) / self.cell_deg)
+        if 0 <= row < self._rows and 0 <= col < self._cols:
+            value = int(self.cells[row, col])
+            if value >= 0:
+                return value
+            j = -value - 1
+            return self._closest(self._candidates[self._offsets[j]:self._offsets[j + 1]], patient_lat, patient_lon)
+
+        indexes, _ = self.index._tree.query(patient_lat, patient_lon, 1)
+        return int(indexes[0]) if len(indexes) else None
+
+    def _closest(self, candidates: np.ndarray, patient_lat: float, patient_lon: float) -> int:
+        best, best_km = -1, math.inf
+        for i in candidates.tolist():
+            km = haversine_distance(patient_lat, patient_lon, self._zone_lat[i], self._zone_lon[i])
+            if km < best_km:
+                best, best_km = i, km
+        return best
+
+    def nearest_indexes(self, patient_lat, patient_lon) -> np.ndarray:
+        """Vectorized nearest_index() (-1 where there are no zones)."""
+        lat = np.atleast_1d(np.asarray(patient_lat, dtype=np.float64))
+        lon = np.atleast_1d(np.asarray(patient_lon, dtype=np.float64))
+        row = np.floor((lat - self._lat_min) / self.cell_deg).astype(np.int64)
+        col = np.floor((lon - self._lon_min) / self.cell_deg).astype(np.int64)
+        inside = (row >= 0) & (row < self._rows) & (col >= 0) & (col < self._cols)
+
+        result = np.full(len(lat), -1, dtype=np.int64)
+        result[inside] = self.cells[row[inside], col[inside]]
+
+        # Ambiguous cells: candidate lists padded to the longest one.
+        ambiguous = np.flatnonzero(inside & (result < 0))
+        if len(ambiguous):
+            slot = -result[ambiguous] - 1
+            start, count = self._offsets[slot], self._offsets[slot + 1] - self._offsets[slot]
+            width = np.arange(count.max())
+            valid = width < count[:, None]
+            zone = self._candidates[np.where(valid, start[:, None] + width, start[:, None])]
+            km = haversine_km(lat[ambiguous, None], lon[ambiguous, None], self._zone_lat[zone], self._zone_lon[zone])
+            # Candidates are in ascending index order, so argmin keeps the lower index on ties.
+            result[ambiguous] = zone[np.arange(len(zone)), np.argmin(np.where(valid, km, np.inf), axis=1)]
+
+        for p in np.flatnonzero(~inside).tolist():
+            found = self.nearest_index(lat[p], lon[p])
+            result[p] = -1 if found is None else found
+        return result
+
+    def nearest(self, patient_lat: float, patient_lon: float) -> Optional[LandingZoneResult]:
+        """find_nearest_zone() answered from the raster."""
+        i = self.nearest_index(patient_lat, patient_lon)
+        if i is None:
+            return None
+        zone = self.index.zones[i]
+        distance = haversine_distance(patient_lat, patient_lon, zone["latitude"], zone["longitude"])
+        return zone_result(zone, distance, patient_lat, patient_lon)
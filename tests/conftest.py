@@ -0,0 +1,34 @@
+from typing import List, Optional
+
+import pytest
+
+from src.medic_matcher import Medic
+from src.roster_generator import RosterSpec, generate_roster
+
+
+def _make_roster(n: int, seed: int, spread: float = 0.3, snap: Optional[float] = None) -> List[Medic]:
+    """
+    generate_roster() over a square of half-width spread, with a 3:1:1
+    available / on_mission / off_duty mix. With snap, locations are rounded
+    to a snap-degree lattice and loads and ratings to a few levels, so many
+    medics tie on score and the rankers' tie-breaking is exercised.
+    """
+    medics = generate_roster(RosterSpec(
+        n=n,
+        seed=seed,
+        radius_deg=spread,
+        status_mix={"available": 3.0, "on_mission": 1.0, "off_duty": 1.0},
+    ))
+    if snap:
+        for medic in medics:
+            lat, lon = medic.gps_location
+            medic.gps_location = (round(lat / snap) * snap, round(lon / snap) * snap)
+            medic.current_load = 20 * min(medic.current_load // 20, 2)
+            medic.rating = 5.0 if medic.rating >= 4.6 else 4.5
+    return medics
+
+
+@pytest.fixture
+def make_roster():
+    """Synthetic roster factory: make_roster(n, seed, spread=0.3, snap=None)."""
+    return _make_roster
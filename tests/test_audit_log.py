@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from src.audit_log import RECORD, AuditLogWriter, read_audit_log
+from src.dispatch_engine import dispatch, dispatch_batch
+
+
+def test_scalar_and_batch_records_round_trip(tmp_path):
+    path = tmp_path / "decisions.audit"
+    cases = [(88.0, 4, 29.8, 3.6), (14.0, 4, 29.8, 3.6), (10.0, 30, 20.0, 3.6), (10.0, 30, 8.0, 3.6)]
+
+    with AuditLogWriter(path) as log:
+        for i, case in enumerate(cases):
+            log.append(dispatch(*case), timestamp=1000.0 + i)
+
+    columns = [np.array(c, dtype=float) for c in zip(*cases)]
+    with AuditLogWriter(path) as log:
+        log.append_batch(dispatch_batch(*columns), *columns, timestamps=2000.0)
+
+    audit = read_audit_log(path)
+    assert len(audit) == 8
+    for i, case in enumerate(cases * 2):
+        assert audit.decision(i) == dispatch(*case)
+    assert audit.rule_counts()["SAFETY_FILTER"] == 2
+    assert audit.mode_counts(audit.between(start=2000.0)) == {"DOCTOR_DRONE": 0, "AMBULANCE": 2, "BOTH": 2}
+    assert audit["ground_eta_min"].tolist() == columns[2].tolist() * 2
+
+
+def test_partial_trailing_record_is_ignored_and_truncated(tmp_path):
+    path = tmp_path / "decisions.audit"
+    with AuditLogWriter(path) as log:
+        log.append(dispatch(14.0, 4, 29.8, 3.6), timestamp=1.0)
+    with open(path, "ab") as f:
+        f.write(b"\x00" * (RECORD.size // 2))
+
+    assert len(read_audit_log(path)) == 1
+    with AuditLogWriter(path) as log:
+        log.append(dispatch(88.0, 4, 29.8, 3.6), timestamp=2.0)
+    audit = read_audit_log(path)
+    assert audit.timestamps.tolist() == [1.0, 2.0]
+    assert audit.decision(1).rule_triggered == "SAFETY_FILTER"
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "not-a-log.bin"
+    path.write_bytes(b"{\"json\": true}\n" * 4)
+    with pytest.raises(ValueError):
+        read_audit_log(path)
+    with pytest.raises(ValueError):
+        AuditLogWriter(path)
+
+    path.write_bytes(b"SAHM")
+    with pytest.raises(ValueError):
+        read_audit_log(path)
+    with pytest.raises(ValueError):
+        AuditLogWriter(path)
@@ -0,0 +1,71 @@
+import numpy as np
+
+from src.calibration import calibrate_thresholds, load_labelled_rows
+from src.dispatch_engine import is_air_response_mode
+
+
+def _row(weather, harm, ground, air, expected):
+    return {
+        "weather_risk_pct": weather,
+        "harm_threshold_min": harm,
+        "ground_eta_min": ground,
+        "air_eta_min": air,
+        "expected_decision": expected,
+    }
+
+
+def test_baseline_thresholds_agree_with_all_labels():
+    report = calibrate_thresholds()
+    assert report.n_rows == len(load_labelled_rows())
+    assert report.baseline.agreement == 1.0
+    assert report.best().agreement == 1.0
+    assert report.best().weather_threshold == 35.0
+    assert report.best().efficiency_delta == 10.0
+
+
+def test_grid_matches_scalar_dispatch():
+    rows = load_labelled_rows()
+    thresholds = [0.0, 20.0, 35.0, 60.0]
+    deltas = [0.0, 10.0, 25.0]
+    report = calibrate_thresholds(rows, thresholds, deltas)
+
+    expected_air = [is_air_response_mode(r["expected_decision"]) for r in rows]
+    for i, t in enumerate(thresholds):
+        for j, d in enumerate(deltas):
+            correct = 0
+            for row, label in zip(rows, expected_air):
+                w, h, g, a = (row[k] for k in ("weather_risk_pct", "harm_threshold_min",
+                                               "ground_eta_min", "air_eta_min"))
+                if w > t:
+                    predicted = False
+                elif g > h:
+                    predicted = True
+                else:
+                    predicted = g - a > d
+                correct += predicted == label
+            assert report.point(i, j).agreement == correct / len(rows)
+
+
+def test_pareto_front_trades_false_negatives_for_false_positives():
+    rows = [
+        _row(40, 60, 30, 5, "DOCTOR_DRONE"),   # drone only if weather threshold >= 40
+        _row(10, 60, 12, 5, "AMBULANCE"),      # ambulance only if delta >= 7
+        _row(10, 60, 20, 5, "DOCTOR_DRONE"),   # drone only if delta < 15
+    ]
+    report = calibrate_thresholds(rows, [30.0, 45.0], [5.0, 10.0, 20.0])
+    front = report.pareto_front()
+
+    pairs = [(p.false_negative, p.false_positive) for p in front]
+    assert pairs == sorted(pairs)
+    assert (0, 0) in pairs and len(pairs) == 1
+    assert front[0].weather_threshold == 45.0 and front[0].efficiency_delta == 10.0
+
+
+def test_chunking_does_not_change_counts(monkeypatch):
+    import src.calibration as calibration
+
+    rows = load_labelled_rows() * 7
+    full = calibrate_thresholds(rows, [20.0, 35.0], [5.0, 10.0])
+    monkeypatch.setattr(calibration, "MAX_CUBE_CELLS", 8)
+    chunked = calibrate_thresholds(rows, [20.0, 35.0], [5.0, 10.0])
+    assert np.array_equal(full.confusion, chunked.confusion)
@@ -0,0 +1,26 @@
+import numpy as np
+
+from src.decision_surface import decision_surface, rasterize_surface
+from src.dispatch_engine import RULE_CODES
+
+
+def test_analytic_regions_match_rasterized_dispatch():
+    surface = decision_surface(20.0, 15, ground_range=(0, 60), air_range=(0, 30))
+    ground_axis, air_axis, codes = rasterize_surface(
+        20.0, 15, np.arange(0, 60.05, 0.1), np.arange(0, 30.05, 0.1)
+    )
+    ground_grid, air_grid = np.meshgrid(ground_axis, air_axis)
+
+    for rule, region in surface.regions.items():
+        expected = codes == RULE_CODES.index(rule)
+        assert np.array_equal(region.contains(ground_grid, air_grid), expected)
+
+    total_area = sum(region.area for region in surface.regions.values())
+    assert abs(total_area - 60 * 30) < 1e-9
+
+
+def test_unsafe_weather_collapses_to_safety_filter():
+    surface = decision_surface(80.0, 4)
+    non_empty = [rule for rule, region in surface.regions.items() if not region.empty]
+    assert non_empty == ["SAFETY_FILTER"]
+    assert surface.rule_at(40.0, 2.0) == "SAFETY_FILTER"
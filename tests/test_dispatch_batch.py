@@ -0,0 +1,46 @@
+import random
+
+from src.dispatch_engine import (
+    RESPONSE_MODE_CODES,
+    RULE_CODES,
+    dispatch,
+    dispatch_batch,
+)
+
+
+def _random_rows(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        rows.append((
+            rng.choice([35.0, rng.uniform(0, 100)]),
+            rng.choice([4, 10, 15, 30]),
+            round(rng.uniform(1, 60), 1),
+            round(rng.uniform(1, 15), 1),
+        ))
+    # Exact boundary rows from the dispatch engine self-test.
+    rows.append((35.0, 10, 15.0, 3.6))
+    rows.append((5.0, 20, 13.6, 3.6))
+    rows.append((5.0, 20, 20.0, 3.6))
+    return rows
+
+
+def test_batch_agrees_with_scalar_dispatch():
+    rows = _random_rows(2000)
+    batch = dispatch_batch(*zip(*rows))
+
+    for i, row in enumerate(rows):
+        scalar = dispatch(*row)
+        assert RESPONSE_MODE_CODES[batch.mode_codes[i]] == scalar.response_mode
+        assert RULE_CODES[batch.rule_codes[i]] == scalar.rule_triggered
+        assert batch.time_delta_min[i] == scalar.time_delta_min
+        assert bool(batch.exceeds_weather[i]) == scalar.exceeds_weather
+        assert bool(batch.exceeds_harm[i]) == scalar.exceeds_harm
+        assert bool(batch.exceeds_efficiency[i]) == scalar.exceeds_efficiency
+        assert batch.confidence[i] == scalar.confidence
+
+
+def test_batch_broadcasts_scalar_columns():
+    batch = dispatch_batch(10.0, 30, [29.8, 10.1], 3.6)
+    assert batch.rules_triggered() == ["EFFICIENCY_OPTIMIZATION", "DEFAULT"]
+    assert batch.response_modes() == ["BOTH", "AMBULANCE"]
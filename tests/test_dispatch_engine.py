@@ -0,0 +1,22 @@
+import pytest
+
+from src.dispatch_engine import dispatch
+
+
+def test_reasons_render_on_demand_from_stored_fields():
+    result = dispatch(6.0, 30, 29.8, 3.6)
+    assert result.reasons == [
+        "Drone saves 26.2 min (threshold: 10.0 min)",
+        "Ground ETA: 29.8 min vs Drone ETA: 3.6 min",
+        "Dispatching Drone for immediate aid + Ambulance for transport",
+    ]
+
+    default = dispatch(2.0, 15, 10.1, 3.6)
+    assert default.reasons[2] == "Ground ETA (10.1 min) within harm threshold (15 min)"
+
+
+def test_dispatch_result_is_immutable():
+    result = dispatch(88.0, 4, 29.8, 3.6)
+    with pytest.raises(AttributeError):
+        result.response_mode = "BOTH"
+    assert not hasattr(result, "__dict__")
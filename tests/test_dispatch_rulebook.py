@@ -0,0 +1,137 @@
+import gc
+import json
+import threading
+
+import pytest
+
+from src.dispatch_engine import (
+    RULE_CODES,
+    Rulebook,
+    RuleSpec,
+    builtin_rulebook,
+    dispatch,
+    dispatch_batch,
+    get_rulebook,
+    get_rulebook_version,
+    load_rulebook,
+    reload_rulebook,
+    rulebook_from_dict,
+    set_rulebook,
+)
+
+
+def _night_shift(version: int = 901, weather: float = 30.0) -> Rulebook:
+    return Rulebook(
+        version=version,
+        rules=(
+            RuleSpec("SAFETY_FILTER", "AMBULANCE", 1.0, weather),
+            RuleSpec("EFFICIENCY_OPTIMIZATION", "BOTH", 0.85, 8.0),
+            RuleSpec("EMERGENCY_OVERRIDE", "DOCTOR_DRONE", 0.95),
+            RuleSpec("DEFAULT", "AMBULANCE", 0.9),
+        ),
+        description="night shift",
+    )
+
+
+def test_shipped_rulebook_matches_d1_defaults():
+    shipped = load_rulebook()
+    assert shipped.version == 1
+    assert shipped.rules == builtin_rulebook().rules
+    assert dispatch(14.0, 4, 29.8, 3.6).rulebook_version == get_rulebook().version
+
+
+def test_swapped_rulebook_drives_scalar_and_batch_paths():
+    previous = set_rulebook(_night_shift())
+    try:
+        result = dispatch(32.0, 4, 29.8, 3.6)
+        assert result.rule_triggered == "SAFETY_FILTER"
+        assert result.rulebook_version == 901
+        assert "(30.0%)" in result.reasons[0]
+
+        # Efficiency now outranks the harm override.
+        result = dispatch(10.0, 4, 29.8, 3.6)
+        assert (result.rule_triggered, result.response_mode) == ("EFFICIENCY_OPTIMIZATION", "BOTH")
+        result = dispatch(10.0, 4, 10.0, 3.6)
+        assert (result.rule_triggered, result.response_mode) == ("EMERGENCY_OVERRIDE", "DOCTOR_DRONE")
+
+        rows = [(w, h, g, 3.6) for w in (10.0, 30.0, 31.0) for h in (4, 20) for g in (5.0, 11.6, 11.7, 30.0)]
+        batch = dispatch_batch(*zip(*rows))
+        assert batch.rulebook_version == 901
+        for i, row in enumerate(rows):
+            scalar = dispatch(*row)
+            assert RULE_CODES[batch.rule_codes[i]] == scalar.rule_triggered
+            assert batch.confidence[i] == scalar.confidence
+    finally:
+        set_rulebook(previous)
+
+
+def test_reload_from_file(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({
+        "version": 902,
+        "rules": [
+            {"rule": "SAFETY_FILTER", "response_mode": "AMBULANCE", "confidence": 1.0, "threshold": 50},
+            {"rule": "DEFAULT", "response_mode": "AMBULANCE", "confidence": 0.9},
+        ],
+    }))
+    previous = get_rulebook()
+    try:
+        assert reload_rulebook(path).version == 902
+        result = dispatch(40.0, 4, 29.8, 3.6)
+        assert result.rule_triggered == "DEFAULT" and not result.exceeds_efficiency
+    finally:
+        set_rulebook(previous)
+
+
+def test_invalid_rulebooks_are_rejected():
+    with pytest.raises(ValueError):
+        rulebook_from_dict({"version": 903, "rules": [{"rule": "SAFETY_FILTER", "response_mode": "AMBULANCE", "confidence": 1.0, "threshold": 35}]})
+    with pytest.raises(ValueError):
+        rulebook_from_dict({"version": 903, "rules": [{"rule": "DEFAULT", "response_mode": "HELICOPTER", "confidence": 1.0}]})
+    live = _night_shift(version=904)
+    with pytest.raises(ValueError):
+        _night_shift(version=904, weather=25.0)
+    assert get_rulebook_version(904) is live
+
+
+def test_old_results_render_with_their_own_rulebook():
+    previous = set_rulebook(_night_shift(version=906, weather=20.0))
+    try:
+        result = dispatch(25.0, 4, 29.8, 3.6)
+    finally:
+        set_rulebook(previous)
+    gc.collect()
+
+    assert result.reasons[0] == "Weather risk 25.0% exceeds safety threshold (20.0%)"
+    with pytest.raises(ValueError):
+        _night_shift(version=906, weather=25.0)
+    unknown = result._replace(rulebook_version=999_999)
+    assert unknown.reasons[0] == "Weather risk 25.0% exceeds safety threshold (rulebook v999999)"
+
+
+def test_swap_during_dispatch_never_mixes_rule_sets():
+    night = _night_shift(version=905)
+    previous = get_rulebook()
+    errors = []
+    stop = threading.Event()
+
+    def worker():
+        while not stop.is_set():
+            result = dispatch(32.0, 60, 20.0, 3.6)
+            expected = "SAFETY_FILTER" if result.rulebook_version == 905 else "EFFICIENCY_OPTIMIZATION"
+            if result.rule_triggered != expected:
+                errors.append(result)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    try:
+        for _ in range(200):
+            set_rulebook(night)
+            set_rulebook(previous)
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+        set_rulebook(previous)
+    assert not errors
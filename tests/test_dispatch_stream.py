@@ -0,0 +1,64 @@
+import io
+import json
+
+from src.dispatch_engine import dispatch
+from src.dispatch_stream import stream_dispatch
+
+
+def test_stream_dispatches_raw_and_normalized_records_in_order():
+    lines = [
+        json.dumps({"scenario_id": 1, "weather_risk_score": 0.1, "harm_threshold_min": 4,
+                    "ground_time_min": 28.4, "air_time_min": 3.6}),
+        "",
+        "not json",
+        json.dumps({"Weather Risk": "10%", "time_to_irreversible_harm": "15-30 min",
+                    "Ground ETA": 20.0, "Air ETA": 3.6}),
+        json.dumps({"incident_id": "X", "weather_risk_pct": 50}),
+    ]
+    out, err = io.StringIO(), io.StringIO()
+    stats = stream_dispatch(io.StringIO("\n".join(lines) + "\n"), out, chunk_size=2, progress=err)
+
+    decisions = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [d["line"] for d in decisions] == [1, 3, 4, 5]
+
+    first = decisions[0]
+    expected = dispatch(10.0, 4, 28.4, 3.6)
+    assert (first["id"], first["response_mode"], first["rule_triggered"]) == (
+        1, expected.response_mode, expected.rule_triggered
+    )
+    assert "error" in decisions[1]
+    assert decisions[2]["harm_threshold_min"] == 15.0
+    assert decisions[2]["rule_triggered"] == dispatch(10.0, 15, 20.0, 3.6).rule_triggered
+    assert decisions[3]["error"] == "missing ground ETA"
+
+    assert (stats.records, stats.errors) == (4, 2)
+    assert "records=4 errors=2" in err.getvalue()
+
+
+def test_missing_non_finite_and_negative_inputs_are_rejected():
+    records = [
+        {"weather_risk_pct": 10, "ground_eta_min": "nan", "air_eta_min": 5},
+        {"weather_risk_pct": 10, "ground_eta_min": 20, "air_eta_min": "inf"},
+        {"weather_risk_pct": 10, "ground_eta_min": -3, "air_eta_min": 5},
+        {"weather_risk_pct": 10, "harm_threshold_min": float("nan"), "ground_eta_min": 20, "air_eta_min": 5},
+        {"weather_risk_pct": 10, "harm_threshold_min": "inf", "ground_eta_min": 20, "air_eta_min": 5},
+        {"ground_eta_min": 20, "air_eta_min": 5},
+        {"Weather Risk": "nan%", "ground_eta_min": 20, "air_eta_min": 5},
+        {"weather_risk_score": "calm", "ground_eta_min": 20, "air_eta_min": 5},
+    ]
+    out = io.StringIO()
+    stats = stream_dispatch(io.StringIO("\n".join(json.dumps(r) for r in records) + "\n"), out, progress=io.StringIO())
+
+    decisions = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [d["error"] for d in decisions] == [
+        "invalid ground ETA: 'nan'",
+        "invalid air ETA: 'inf'",
+        "invalid ground ETA: -3",
+        "invalid harm threshold: nan",
+        "invalid harm threshold: 'inf'",
+        "missing weather risk",
+        "invalid weather risk: 'nan%'",
+        "invalid weather risk: 'calm'",
+    ]
+    assert (stats.records, stats.errors) == (8, 8)
+    assert "NaN" not in out.getvalue() and "Infinity" not in out.getvalue()
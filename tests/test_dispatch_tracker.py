@@ -0,0 +1,98 @@
+from dataclasses import replace
+
+import numpy as np
+
+from src.dispatch_engine import Rulebook, RuleSpec, builtin_rulebook, dispatch
+from src.dispatch_tracker import DispatchTracker
+
+
+def _assert_matches_dispatch(tracker, columns):
+    for incident_id, (w, h, g, a) in columns.items():
+        expected = dispatch(w, h, g, a)
+        assert tracker.rule_of(incident_id) == expected.rule_triggered
+        assert tracker.decision(incident_id) == expected
+
+
+def test_random_updates_stay_in_sync_with_dispatch():
+    rng = np.random.default_rng(4)
+    tracker = DispatchTracker(builtin_rulebook(), capacity=4)
+    n = 300
+    ids = [f"INC-{i}" for i in range(n)]
+    inputs = np.column_stack([
+        rng.uniform(20, 50, n), rng.choice([4.0, 15.0, 30.0], n),
+        rng.uniform(5, 35, n), rng.uniform(2, 8, n),
+    ])
+    tracker.open_incidents(ids, *inputs.T)
+
+    for _ in range(20):
+        picked = rng.choice(n, 50, replace=False)
+        inputs[picked, 0] += rng.normal(0, 5, 50)
+        inputs[picked, 2] += rng.normal(0, 3, 50)
+        before = {ids[i]: tracker.rule_of(ids[i]) for i in picked}
+        changes = tracker.update([ids[i] for i in picked],
+                                 weather_risk_pct=inputs[picked, 0], ground_eta_min=inputs[picked, 2])
+
+        changed = {c.incident_id: c for c in changes}
+        for i in picked:
+            rule_now = dispatch(*inputs[i]).rule_triggered
+            if rule_now != before[ids[i]]:
+                assert changed[ids[i]].previous_rule == before[ids[i]]
+                assert changed[ids[i]].rule_triggered == rule_now
+            else:
+                assert ids[i] not in changed
+
+    _assert_matches_dispatch(tracker, {ids[i]: tuple(inputs[i]) for i in range(n)})
+    assert tracker.rows_reevaluated < tracker.updates_applied
+
+
+def test_updates_within_margins_are_not_reevaluated():
+    tracker = DispatchTracker(builtin_rulebook())
+    tracker.open_incident("A", 10.0, 30, 20.0, 4.0)
+    assert tracker.margins("A") == {"weather": -25.0, "harm": -10.0, "efficiency": 6.0}
+
+    assert tracker.update_incident("A", ground_eta_min=25.0) is None
+    assert tracker.rows_reevaluated == 0
+
+    change = tracker.update_incident("A", ground_eta_min=31.0)
+    assert (change.previous_rule, change.rule_triggered) == ("EFFICIENCY_OPTIMIZATION", "EMERGENCY_OVERRIDE")
+    assert (change.previous_mode, change.response_mode) == ("BOTH", "BOTH")
+
+    change = tracker.update_incident("A", weather_risk_pct=60.0)
+    assert change.response_mode == "AMBULANCE" and change.rule_triggered == "SAFETY_FILTER"
+
+
+def test_close_moves_last_row_and_rulebook_swap_emits_changes():
+    tracker = DispatchTracker(builtin_rulebook())
+    tracker.open_incidents(["A", "B", "C"], [32.0, 10.0, 40.0], 30, [20.0, 8.0, 20.0], 3.6)
+    tracker.close_incident("A")
+    assert len(tracker) == 2 and "A" not in tracker
+    assert tracker.incident_ids == ["C", "B"]
+    _assert_matches_dispatch(tracker, {"B": (10.0, 30, 8.0, 3.6), "C": (40.0, 30, 20.0, 3.6)})
+
+    strict = Rulebook(
+        version=911,
+        rules=(
+            RuleSpec("SAFETY_FILTER", "AMBULANCE", 1.0, 5.0),
+            RuleSpec("DEFAULT", "AMBULANCE", 0.9),
+        ),
+    )
+    changes = tracker.set_rulebook(strict)
+    assert [(c.incident_id, c.rule_triggered, c.rulebook_version) for c in changes] == [("B", "SAFETY_FILTER", 911)]
+    assert tracker.decision("B").rulebook_version == 911
+
+
+def test_rulebook_swap_reports_mode_only_changes():
+    tracker = DispatchTracker(builtin_rulebook())
+    tracker.open_incidents(["E", "D"], [10.0, 10.0], 60, [29.8, 8.0], 3.6)
+    assert tracker.rule_of("E") == "EFFICIENCY_OPTIMIZATION"
+
+    drone_only = Rulebook(
+        version=912,
+        rules=tuple(
+            replace(spec, response_mode="DOCTOR_DRONE") if spec.rule == "EFFICIENCY_OPTIMIZATION" else spec
+            for spec in builtin_rulebook().rules
+        ),
+    )
+    changes = tracker.set_rulebook(drone_only)
+    assert [(c.incident_id, c.previous_mode, c.response_mode, c.previous_rule, c.rule_triggered)
+            for c in changes] == [("E", "BOTH", "DOCTOR_DRONE", "EFFICIENCY_OPTIMIZATION", "EFFICIENCY_OPTIMIZATION")]
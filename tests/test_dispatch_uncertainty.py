@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from src.dispatch_engine import dispatch
+from src.dispatch_uncertainty import INITIAL_CHUNK_SIZE, InputDistribution, dispatch_probabilistic
+
+
+def test_point_inputs_reduce_to_scalar_dispatch():
+    result = dispatch_probabilistic(14.0, 4, 29.8, 3.6, n_samples=1000, seed=3)
+    scalar = dispatch(14.0, 4, 29.8, 3.6)
+    assert result.rule_probabilities[scalar.rule_triggered] == 1.0
+    assert result.mode_probabilities[scalar.response_mode] == 1.0
+    assert result.n_samples == 1000 and not result.truncated
+
+
+def test_weather_straddling_threshold_splits_probability():
+    result = dispatch_probabilistic(
+        InputDistribution.uniform(25.0, 45.0), 60, 30.0, 3.6,
+        n_samples=100_000, seed=11, time_budget_ms=None,
+    )
+    assert abs(result.rule_probabilities["SAFETY_FILTER"] - 0.5) < 0.01
+    assert abs(result.air_response_probability - 0.5) < 0.01
+
+
+def test_seed_makes_runs_reproducible():
+    a = dispatch_probabilistic((30.0, 5.0), 15, (14.0, 3.0), (3.6, 0.5), seed=5, time_budget_ms=None)
+    b = dispatch_probabilistic((30.0, 5.0), 15, (14.0, 3.0), (3.6, 0.5), seed=5, time_budget_ms=None)
+    assert a.rule_probabilities == b.rule_probabilities
+
+
+def test_time_budget_truncates_but_evaluates_one_chunk():
+    result = dispatch_probabilistic(
+        (30.0, 5.0), 15, (14.0, 3.0), 3.6,
+        n_samples=1_000_000, seed=2, time_budget_ms=0.0, chunk_size=1000,
+    )
+    assert result.truncated
+    assert result.n_samples == 1000
+
+
+def test_tight_budget_truncates_default_sized_run():
+    ticks = iter(range(1_000))
+
+    def clock():  # 1 ms per reading, whatever the machine
+        return next(ticks) / 1000.0
+
+    run = dict(n_samples=100_000, seed=2, clock=clock)
+    result = dispatch_probabilistic((30.0, 5.0), 15, (14.0, 3.0), 3.6, time_budget_ms=3, **run)
+    assert result.truncated
+    assert result.n_samples == INITIAL_CHUNK_SIZE
+    assert not dispatch_probabilistic((30.0, 5.0), 15, (14.0, 3.0), 3.6, time_budget_ms=1_000, **run).truncated
+
+
+def test_lognormal_is_parameterized_by_its_mean():
+    samples = InputDistribution.lognormal(20.0, 6.0).sample(np.random.default_rng(0), 400_000)
+    assert abs(samples.mean() - 20.0) < 0.05
+    assert abs(samples.std() - 6.0) < 0.1
+    with pytest.raises(ValueError):
+        InputDistribution.lognormal(0.0, 1.0)
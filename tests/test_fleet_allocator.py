@@ -0,0 +1,45 @@
+import numpy as np
+
+from src.fleet_allocator import FLEET_FALLBACK_REASON, allocate_fleet, allocate_fleet_columns
+
+
+def _incident(incident_id, harm, ground, weather=10.0, air=3.6):
+    return {
+        "incident_id": incident_id,
+        "weather_risk_pct": weather,
+        "harm_threshold_min": harm,
+        "ground_eta_min": ground,
+        "air_eta_min": air,
+    }
+
+
+def test_scarce_drones_go_to_smallest_harm_slack():
+    incidents = [
+        _incident("efficiency", harm=60, ground=30.0),   # slack 30
+        _incident("cardiac", harm=4, ground=28.0),        # slack -24
+        _incident("stroke", harm=10, ground=22.0),        # slack -12
+        _incident("unsafe", harm=4, ground=28.0, weather=80.0),
+        _incident("minor", harm=30, ground=8.0),
+    ]
+    allocation = allocate_fleet(incidents, drones_available=2)
+    records = {r["incident_id"]: r for r in allocation.to_records()}
+
+    assert records["cardiac"]["drone_assigned"] and records["cardiac"]["priority"] == 0
+    assert records["stroke"]["drone_assigned"] and records["stroke"]["priority"] == 1
+    assert records["efficiency"]["response_mode"] == "AMBULANCE"
+    assert records["efficiency"]["requested_mode"] == "BOTH"
+    assert records["efficiency"]["fallback_reason"] == FLEET_FALLBACK_REASON
+    assert records["unsafe"]["priority"] == -1 and not records["unsafe"]["fleet_fallback"]
+    assert records["minor"]["rule_triggered"] == "DEFAULT"
+    assert allocation.drones_assigned == 2 and allocation.fallback_count == 1
+
+
+def test_equal_slack_prefers_larger_time_saved():
+    allocation = allocate_fleet_columns(
+        weather_risk_pct=[5.0, 5.0],
+        harm_threshold_min=[10.0, 10.0],
+        ground_eta_min=[20.0, 20.0],
+        air_eta_min=[6.0, 2.0],
+        drones_available=1,
+    )
+    assert np.array_equal(allocation.drone_assigned, [False, True])
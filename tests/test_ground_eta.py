@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from src.data_loader import load_cases, load_scenarios
+from src.ground_eta import (
+    ROAD_CLASSES,
+    estimate_ground_eta,
+    estimate_ground_eta_batch,
+    ground_eta_for_record,
+    parse_hour,
+)
+from src.medic_matcher import DEFAULT_TRAFFIC_HOUR, MedicMatcher
+
+
+def test_reference_ground_times_are_reproduced():
+    for scenario in load_scenarios():
+        assert ground_eta_for_record(scenario) == scenario["ground_eta_min"]
+        # The hourly profile alone gives the same answer for the scenario's time of day.
+        assert estimate_ground_eta(hour=parse_hour(scenario["time_of_day"])) == scenario["ground_eta_min"]
+    for case in load_cases():
+        assert abs(ground_eta_for_record(case) - case["ground_eta_min"]) <= 0.3
+
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(2)
+    n = 500
+    distance = rng.uniform(0.5, 20, n)
+    hours = rng.integers(0, 24, n)
+    codes = rng.integers(0, len(ROAD_CLASSES), n)
+    flow = np.where(rng.random(n) < 0.5, np.nan, rng.uniform(0.05, 1.0, n))
+
+    batch = estimate_ground_eta_batch(distance, hours, codes, flow)
+    for i in range(n):
+        road_class = ROAD_CLASSES[codes[i]]
+        expected = estimate_ground_eta(distance[i], hour=int(hours[i]), road_class=road_class, traffic_flow=flow[i])
+        assert batch[i] == expected
+        if np.isnan(flow[i]):
+            # NaN means "not observed" on both paths: fall back to the hourly profile.
+            assert expected == estimate_ground_eta(distance[i], hour=int(hours[i]), road_class=road_class)
+
+    named = estimate_ground_eta_batch(distance, hours, [ROAD_CLASSES[c] for c in codes])
+    assert np.array_equal(named, estimate_ground_eta_batch(distance, hours, codes))
+
+
+def test_invalid_inputs():
+    assert parse_hour("Unknown") is None
+    with pytest.raises(ValueError):
+        estimate_ground_eta(4.8, hour=3, road_class="dirt")
+    with pytest.raises(ValueError):
+        estimate_ground_eta_batch([4.8], [3], ["dirt"])
+
+
+def test_matcher_ground_eta_follows_time_of_day_not_the_clock():
+    decision, triage = {"response_mode": "ground"}, {"severity_level": 3, "category": "cardiac"}
+    patient = (24.80, 46.72)
+
+    def eta(matcher, **kwargs):
+        return matcher.find_best_match(decision, triage, patient_location=patient, **kwargs)["assigned_medic"]["eta_minutes"]
+
+    default = eta(MedicMatcher())
+    assert default == eta(MedicMatcher(traffic_hour=DEFAULT_TRAFFIC_HOUR))
+    rush = eta(MedicMatcher(), time_of_day="5:00 PM (Rush)")
+    assert rush == eta(MedicMatcher(traffic_hour=17))
+    assert rush > default
+    assert eta(MedicMatcher(), time_of_day="Unknown") == default
@@ -0,0 +1,92 @@
+import itertools
+import random
+
+import pytest
+
+from src.medic_batch import assign_batch, assign_greedy
+from src.medic_matcher import Medic, MedicMatcher
+
+
+def _matcher(locations):
+    matcher = MedicMatcher(traffic_hour=12)
+    matcher.db.medics = [
+        Medic(f"MED-{i}", f"Medic {i}", "cardiac", "paramedic", loc, "available", 0, 10, 5.0, ["ar"])
+        for i, loc in enumerate(locations)
+    ]
+    return matcher
+
+
+def test_batch_beats_greedy_when_first_incident_takes_the_shared_medic():
+    # Incident A is slightly closer to MED-0, but MED-0 is B's only close medic.
+    matcher = _matcher([(24.700, 46.600), (24.700, 46.620), (24.700, 46.800)])
+    patients = [(24.700, 46.609), (24.700, 46.595)]
+
+    version = matcher.db.availability_version
+    greedy = assign_greedy(matcher, patients, "cardiac", incident_ids=["A", "B"], objective="eta")
+    batch = assign_batch(matcher, patients, "cardiac", incident_ids=["A", "B"], objective="eta")
+
+    assert greedy.medic_ids == ["MED-0", "MED-1"]
+    assert batch.medic_ids == ["MED-1", "MED-0"]
+    assert greedy.objective == batch.objective == "eta"
+    assert batch.total_eta_minutes < greedy.total_eta_minutes
+    # The greedy baseline never touches the shared database.
+    assert [m.status for m in matcher.db.medics] == ["available"] * 3
+    assert matcher.db.availability_version == version
+
+
+@pytest.mark.parametrize("objective", ["eta", "score"])
+def test_greedy_takes_each_incidents_own_best_without_reserving(objective):
+    rng = random.Random(8)
+    matcher = _matcher([(24.7 + rng.uniform(-0.05, 0.05), 46.67 + rng.uniform(-0.05, 0.05)) for _ in range(9)])
+    patients = [(24.7 + rng.uniform(-0.05, 0.05), 46.67 + rng.uniform(-0.05, 0.05)) for _ in range(6)]
+    greedy = assign_greedy(matcher, patients, "cardiac", objective=objective)
+
+    free = list(matcher.db.medics)
+    for i, patient in enumerate(patients):
+        def value(medic):
+            data = matcher._calculate_match_score(medic, "cardiac", patient, 3, "aerial")
+            return -data["eta_minutes"] if objective == "eta" else data["composite_score"]
+        assert value(matcher.db.get_by_id(greedy.medic_ids[i])) == max(value(m) for m in free)
+        free = [m for m in free if m.id != greedy.medic_ids[i]]
+    assert all(m.status == "available" for m in matcher.db.medics)
+
+    batch = assign_batch(matcher, patients, "cardiac", objective=objective)
+    if objective == "eta":
+        assert batch.total_eta_minutes <= greedy.total_eta_minutes
+    else:
+        assert batch.total_score >= greedy.total_score
+
+
+@pytest.mark.parametrize("objective", ["eta", "score"])
+def test_batch_matches_brute_force_optimum(objective):
+    rng = random.Random(5)
+    matcher = _matcher([(24.7 + rng.uniform(-0.05, 0.05), 46.67 + rng.uniform(-0.05, 0.05)) for _ in range(7)])
+    for i, medic in enumerate(matcher.db.medics):
+        medic.specialty = ["cardiac", "neuro", "general"][i % 3]
+    matcher.db.medics = matcher.db.medics
+    patients = [(24.7 + rng.uniform(-0.05, 0.05), 46.67 + rng.uniform(-0.05, 0.05)) for _ in range(5)]
+    categories = ["cardiac", "stroke", "cardiac", "other_unclear", "stroke"]
+
+    batch = assign_batch(matcher, patients, categories, objective=objective, candidates_per_incident=7)
+
+    def value(medic, i):
+        data = matcher._calculate_match_score(medic, categories[i], patients[i], 3, "aerial")
+        return -data["eta_minutes"] if objective == "eta" else data["composite_score"]
+
+    best = max(
+        sum(value(m, i) for i, m in enumerate(perm))
+        for perm in itertools.permutations(matcher.db.medics, len(patients))
+    )
+    got = -batch.total_eta_minutes if objective == "eta" else batch.total_score
+    assert got == pytest.approx(best)
+    assert len(set(batch.medic_ids)) == len(patients)
+
+
+def test_incidents_outnumbering_candidates_still_get_distinct_medics():
+    matcher = _matcher([(24.70 + i * 0.001, 46.66) for i in range(12)])
+    patients = [(24.70, 46.66)] * 10
+    batch = assign_batch(matcher, patients, "cardiac", candidates_per_incident=2)
+    assert batch.assigned_count == 10 and len(set(batch.medic_ids)) == 10
+
+    crowded = assign_batch(matcher, [(24.70, 46.66)] * 14, "cardiac", candidates_per_incident=3)
+    assert crowded.assigned_count == 12 and crowded.medic_ids.count(None) == 2
@@ -0,0 +1,136 @@
+import math
+import random
+
+from src.medic_batch import _nearest_available
+from src.medic_matcher import MedicMapView, MedicMatcher
+
+
+def _rankings(matcher, patient, category="cardiac", mode="aerial"):
+    rankers = (matcher._rank_indexed, matcher._rank_vectorized, matcher._rank_exhaustive)
+    return [
+        [(s["medic"].id, s["score_data"]) for s in rank(category, patient, 3, mode)[:MedicMatcher.TOP_K]]
+        for rank in rankers
+    ]
+
+
+def test_fast_rankings_match_exhaustive_scan(make_roster):
+    matcher = MedicMatcher(traffic_hour=12)
+    rng = random.Random(7)
+    for n, snap in ((15, None), (2_000, None), (3_000, 0.01)):
+        matcher.db.medics = make_roster(n, seed=n, snap=snap)
+        for _ in range(25):
+            patient = (24.7136 + rng.uniform(-0.5, 0.5), 46.6753 + rng.uniform(-0.5, 0.5))
+            category = rng.choice(["cardiac", "stroke", "other_unclear"])
+            indexed, vectorized, exhaustive = _rankings(matcher, patient, category, rng.choice(["aerial", "ground"]))
+            assert indexed == vectorized == exhaustive
+
+
+
+def test_patients_outside_the_roster_bounds(make_roster):
+    matcher = MedicMatcher(traffic_hour=12)
+    matcher.db.medics = make_roster(3_000, seed=4)
+    grid = matcher.db.grid
+    locations = [m.gps_location for m in matcher.db.medics]
+    for patient in ((26.0, 48.0), (24.7136, 47.2), (24.3, 46.2), (25.1, 46.6753), (23.0, 44.0)):
+        indexed, vectorized, exhaustive = _rankings(matcher, patient)
+        assert indexed == vectorized == exhaustive
+
+        # Every ring bound holds for the positions not yet yielded, and the
+        # walk starts at the first ring that reaches the roster.
+        unvisited = set(range(len(locations)))
+        for n, (positions, bound) in enumerate(grid.rings(patient)):
+            assert n or positions
+            unvisited -= set(positions)
+            assert all(math.hypot(locations[p][0] - patient[0], locations[p][1] - patient[1]) * 111 >= bound
+                       for p in unvisited)
+        assert not unvisited
+
+    available = [i for i, m in enumerate(matcher.db.medics) if m.status == "available"]
+    by_distance = sorted(available, key=lambda i: (math.hypot(locations[i][0] - 26.0, locations[i][1] - 48.0), i))
+    assert _nearest_available(matcher, (26.0, 48.0), 5).tolist() == by_distance[:5]
+
+
+def test_find_best_match_agrees_and_tracks_status_and_location_changes(make_roster):
+    indexed, scan = MedicMatcher(traffic_hour=12), MedicMatcher(traffic_hour=12, use_index=False)
+    roster = make_roster(1_500, seed=3)
+    indexed.db.medics = scan.db.medics = roster
+    decision, triage = {"response_mode": "aerial_only"}, {"severity_level": 3, "category": "trauma_bleeding"}
+    patient = (24.70, 46.66)
+
+    def match(m):
+        r = m.find_best_match(decision, triage, patient_location=patient)
+        return r["assigned_medic"], r["alternatives"], r["match_breakdown"]
+
+    first = match(indexed)
+    assert first == match(scan)
+
+    for m in (indexed, scan):
+        m.db.update_status(first[0]["id"], "on_mission")
+    assert match(indexed) == match(scan)
+    assert match(indexed)[0]["id"] != first[0]["id"]
+
+    far = roster[-1]
+    for m in (indexed, scan):
+        m.db.update_location(far.id, patient)
+        m.db.update_status(far.id, "available")
+    assert match(indexed)[0]["id"] == far.id
+    assert match(indexed) == match(scan)
+
+
+def test_all_medics_is_opt_in_and_filtered_by_view(make_roster):
+    matcher = MedicMatcher(traffic_hour=12)
+    roster = make_roster(500, seed=5)
+    matcher.db.medics = roster
+    decision, triage = {"response_mode": "aerial_only"}, {"severity_level": 3, "category": "cardiac"}
+    patient = (24.70, 46.66)
+
+    assert "all_medics" not in matcher.find_best_match(decision, triage, patient_location=patient)
+
+    full = matcher.find_best_match(decision, triage, patient_location=patient, medic_view=MedicMapView())
+    assert [m["id"] for m in full["all_medics"]] == [m.id for m in roster]
+    assert full["all_medics_total"] == len(roster)
+
+    view = MedicMapView(radius_deg=0.1, offset=5, limit=20)
+    r = matcher.find_best_match(decision, triage, patient_location=patient, medic_view=view)
+    inside = [
+        m for m in full["all_medics"]
+        if abs(m["gps_location"][0] - patient[0]) <= 0.1 and abs(m["gps_location"][1] - patient[1]) <= 0.1
+    ]
+    assert r["all_medics_total"] == len(inside)
+    assert r["all_medics"] == inside[5:25]
+    assert [m["status"] for m in full["all_medics"] if m["id"] == r["assigned_medic"]["id"]] == ["En Route"]
+
+
+def test_status_and_specialty_buckets_follow_updates(make_roster):
+    matcher = MedicMatcher(traffic_hour=12)
+    roster = make_roster(400, seed=11)
+    db = matcher.db
+    db.medics = roster
+
+    def scan(status=None, specialty=None):
+        return [
+            m for m in roster
+            if (status is None or m.status == status) and (specialty is None or m.specialty == specialty)
+        ]
+
+    assert db.find_medics(status="available", specialty="cardiac") == scan("available", "cardiac")
+    assert db.get_by_id("MED-123") is roster[123]
+    assert db.get_by_id("MED-missing") is None
+
+    rng = random.Random(2)
+    for _ in range(300):
+        db.update_status(f"MED-{rng.randrange(400)}", rng.choice(["available", "on_mission", "off_duty", "break"]))
+    for status in ("available", "on_mission", "break"):
+        assert db.count_medics(status) == len(scan(status))
+        for specialty in ("cardiac", "neuro"):
+            assert db.find_medics(status=status, specialty=specialty) == scan(status, specialty)
+    assert db.get_available_medics() == scan("available")
+    assert db.find_medics(specialty="trauma") == scan(specialty="trauma")
+
+
+def test_replacing_the_roster_bumps_availability_version(make_roster):
+    db = MedicMatcher(traffic_hour=12).db
+    version = db.availability_version
+    db.medics = make_roster(50, seed=3)
+    # Rankings made against the old roster must see it was swapped out.
+    assert db.availability_version > version
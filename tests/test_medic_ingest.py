@@ -0,0 +1,97 @@
+import random
+import threading
+
+from src.medic_ingest import MedicUpdate, MedicUpdateIngestor
+from src.medic_matcher import MedicMatcher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_updates_coalesce_within_window_and_drop_stale_reports(make_roster):
+    matcher = MedicMatcher(traffic_hour=12)
+    matcher.db.medics = make_roster(50, seed=1)
+    clock = FakeClock()
+    ingest = MedicUpdateIngestor(matcher.db, window_s=5.0, clock=clock)
+
+    for t in range(10):
+        ingest.submit("MED-3", gps_location=(24.70 + t * 0.001, 46.66), timestamp=float(t))
+    ingest.submit("MED-3", gps_location=(0.0, 0.0), timestamp=4.5)  # late, out of order
+    ingest.submit("MED-3", status="break", timestamp=2.0)
+    assert ingest.pending == 2 and matcher.db.get_by_id("MED-3").gps_location != (24.709, 46.66)
+
+    clock.now = 5.0
+    ingest.submit("MED-4", status="off_duty")
+    assert ingest.pending == 0 and ingest.applied == 3
+    assert ingest.coalesced == 10
+    medic = matcher.db.get_by_id("MED-3")
+    assert medic.gps_location == (24.709, 46.66) and medic.status == "break"
+    assert matcher.db.roster.lat[3] == 24.709
+
+    ingest.submit("MED-3", gps_location=(1.0, 1.0), timestamp=8.0)
+    assert ingest.stale == 1
+    ingest.flush()
+    assert matcher.db.get_by_id("MED-3").gps_location == (24.709, 46.66)
+
+
+
+def test_status_reports_do_not_override_an_open_lease(make_roster):
+    matcher = MedicMatcher(traffic_hour=12)
+    matcher.db.medics = make_roster(50, seed=1)
+    medic_id = matcher.db.get_available_medics()[0].id
+    lease = matcher.leases.reserve(medic_id, "INC-1")
+    ingest = MedicUpdateIngestor(matcher.db, window_s=5.0, clock=FakeClock())
+
+    ingest.submit(medic_id, gps_location=(24.70, 46.66), status="available")
+    assert ingest.flush() == 1  # the location only
+    assert matcher.db.get_by_id(medic_id).status == "reserved"
+    assert matcher.leases.reserve(medic_id, "INC-2") is None
+
+    assert matcher.leases.confirm(lease.lease_id)
+    ingest.submit(medic_id, status="break")
+    assert ingest.flush() == 1 and matcher.db.get_by_id(medic_id).status == "break"
+
+def test_matching_during_background_ingest_stays_consistent(make_roster):
+    matcher = MedicMatcher(traffic_hour=12)
+    matcher.db.medics = make_roster(2_000, seed=4)
+    ingest = MedicUpdateIngestor(matcher.db, window_s=0.001)
+    ingest.start()
+
+    stop = threading.Event()
+
+    def feed():
+        rng = random.Random(0)
+        while not stop.is_set():
+            ingest.submit_batch(
+                MedicUpdate(f"MED-{rng.randrange(2_000)}",
+                            gps_location=(24.7136 + rng.uniform(-0.3, 0.3), 46.6753 + rng.uniform(-0.3, 0.3)),
+                            status=rng.choice(["available", "available", "on_mission"]))
+                for _ in range(200)
+            )
+
+    feeder = threading.Thread(target=feed)
+    feeder.start()
+    decision, triage = {"response_mode": "aerial_only"}, {"severity_level": 3, "category": "cardiac"}
+    try:
+        for i in range(100):
+            r = matcher.find_best_match(decision, triage, patient_location=(24.70, 46.66))
+            ids = [r["assigned_medic"]["id"]] + [a["id"] for a in r["alternatives"]]
+            assert len(set(ids)) == len(ids)
+    finally:
+        stop.set()
+        feeder.join()
+        ingest.stop()
+
+    assert ingest.applied > 0
+    by_grid = sorted(p for cell in matcher.db.grid.cells.values() for p in cell)
+    assert by_grid == list(range(2_000))
+    for position, medic in enumerate(matcher.db.medics):
+        assert matcher.db.grid.cell_of(medic.gps_location) in matcher.db.grid.cells
+        assert (matcher.db.roster.lat[position], matcher.db.roster.lon[position]) == medic.gps_location
+    assert matcher._rank("cardiac", (24.70, 46.66), 3, "aerial") == matcher._rank_exhaustive(
+        "cardiac", (24.70, 46.66), 3, "aerial")
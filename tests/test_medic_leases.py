@@ -0,0 +1,91 @@
+import threading
+from collections import Counter
+
+from src.medic_matcher import Medic, MedicMatcher
+
+
+DECISION = {"response_mode": "aerial_only"}
+TRIAGE = {"severity_level": 3, "category": "cardiac"}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _matcher(n=40):
+    matcher = MedicMatcher(traffic_hour=12)
+    matcher.db.medics = [
+        Medic(f"MED-{i}", f"Medic {i}", "cardiac", "paramedic", (24.70 + i * 0.001, 46.66),
+              "available", 0, 10, 5.0, ["ar"])
+        for i in range(n)
+    ]
+    return matcher
+
+
+def test_lease_lifecycle_confirm_release_and_expiry():
+    matcher = _matcher(3)
+    clock = matcher.leases.clock = FakeClock()
+    patient = (24.70, 46.66)
+
+    first = matcher.match_and_reserve(DECISION, TRIAGE, "INC-1", patient_location=patient, lease_seconds=10)
+    assert first["assigned_medic"]["id"] == "MED-0"
+    assert matcher.db.get_by_id("MED-0").status == "reserved"
+
+    second = matcher.match_and_reserve(DECISION, TRIAGE, "INC-2", patient_location=patient, lease_seconds=10)
+    assert second["assigned_medic"]["id"] == "MED-1"
+    assert matcher.leases.confirm(second["lease"]["lease_id"])
+    assert matcher.db.get_by_id("MED-1").status == "on_mission"
+
+    third = matcher.match_and_reserve(DECISION, TRIAGE, "INC-3", patient_location=patient, lease_seconds=10)
+    assert matcher.leases.release(third["lease"]["lease_id"])
+    assert not matcher.leases.confirm(third["lease"]["lease_id"])
+    assert matcher.db.get_by_id("MED-2").status == "available"
+
+    clock.now = 11
+    assert not matcher.leases.confirm(first["lease"]["lease_id"])
+    assert matcher.db.get_by_id("MED-0").status == "available"
+
+    matcher.match_and_reserve(DECISION, TRIAGE, "INC-4", patient_location=patient, lease_seconds=10)
+    clock.now = 30
+    again = matcher.match_and_reserve(DECISION, TRIAGE, "INC-5", patient_location=patient, lease_seconds=10)
+    assert again["assigned_medic"]["id"] == "MED-0"
+    assert matcher.leases.lease_for("MED-0").incident_id == "INC-5"
+
+
+
+def test_ending_a_superseded_lease_leaves_the_new_one_alone():
+    matcher = _matcher(2)
+    old = matcher.leases.reserve("MED-0", "INC-1")
+    # An operator frees the medic by hand and it is leased again.
+    matcher.db.update_status("MED-0", "available")
+    new = matcher.leases.reserve("MED-0", "INC-2")
+
+    assert not matcher.leases.release(old.lease_id)
+    assert matcher.db.get_by_id("MED-0").status == "reserved"
+    assert matcher.leases.lease_for("MED-0") == new
+    assert matcher.leases.confirm(new.lease_id)
+    assert matcher.db.get_by_id("MED-0").status == "on_mission"
+
+def test_concurrent_reservations_never_share_a_medic():
+    matcher = _matcher(40)
+    results = []
+
+    def worker(t):
+        for i in range(8):
+            r = matcher.match_and_reserve(DECISION, TRIAGE, f"INC-{t}-{i}", patient_location=(24.70, 46.66))
+            results.append(r["assigned_medic"] and r["assigned_medic"]["id"])
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assigned = Counter(r for r in results if r)
+    assert len(assigned) == 40 and max(assigned.values()) == 1
+    assert results.count(None) == 6 * 8 - 40
+    assert matcher.db.count_medics("reserved") == 40
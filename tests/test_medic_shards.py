@@ -0,0 +1,79 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.medic_matcher import MedicMatcher, assign_medic, get_matcher, set_matcher
+from src.medic_shards import ShardedMedicMatcher, partition_regions
+from src.road_network import grid_network
+
+
+def test_partition_regions_is_balanced_and_complete():
+    rng = np.random.default_rng(0)
+    lat, lon = rng.uniform(24.4, 25.0, 1_001), rng.uniform(46.3, 47.1, 1_001)
+    regions = partition_regions(lat, lon, 5)
+    assert sorted(np.concatenate(regions).tolist()) == list(range(1_001))
+    assert all(200 <= len(r) <= 201 for r in regions)
+    assert all(r.tolist() == sorted(r.tolist()) for r in regions)
+    assert [len(r) for r in partition_regions(lat[:2], lon[:2], 4)] == [1, 0, 1, 0]
+
+
+def test_sharded_matches_single_process_through_updates(make_roster):
+    single = MedicMatcher(traffic_hour=12)
+    single.db.medics = make_roster(3_000, seed=6, snap=0.01)
+    patients = [(24.7136 + dlat, 46.6753 + dlon)
+                for dlat, dlon in np.random.default_rng(1).uniform(-0.35, 0.35, (60, 2)).tolist()]
+
+    with ShardedMedicMatcher(workers=3, traffic_hour=12, medics=make_roster(3_000, seed=6, snap=0.01)) as sharded:
+        def same(category):
+            for p in patients:
+                a = single._rank(category, p, 3, "ground")
+                b = sharded._rank(category, p, 3, "ground")
+                assert [r["medic"].id for r in a] == [r["medic"].id for r in b]
+                assert [r["score_data"] for r in a] == [r["score_data"] for r in b]
+
+        same("cardiac")
+        for i in range(0, 3_000, 7):
+            for matcher in (single, sharded):
+                matcher.db.update_status(f"MED-{i}", "on_mission" if i % 2 else "available")
+                matcher.db.update_location(f"MED-{i + 1}", (24.40 + i * 1e-4, 46.40 + i * 1e-4))
+        same("trauma")
+        assert [r[0]["medic"].id for r in sharded.rank_many([("neuro", p, 2, "aerial") for p in patients])] == \
+            [single._rank("neuro", p, 2, "aerial")[0]["medic"].id for p in patients]
+
+        decision, triage = {"response_mode": "aerial_only"}, {"severity_level": 3, "category": "cardiac"}
+        set_matcher(sharded)
+        try:
+            result = assign_medic(decision, triage, patient_location=patients[0])
+        finally:
+            set_matcher(None)
+        assert result["assigned_medic"]["id"] == single.find_best_match(
+            decision, triage, patient_location=patients[0])["assigned_medic"]["id"]
+        assert get_matcher() is not sharded
+
+
+def test_workers_use_the_parents_traffic_hour_and_road_network(make_roster):
+    roads = grid_network(30, 30, (24.60, 46.55), 0.01)
+    medics = make_roster(1_000, seed=9, spread=0.12)
+    single = MedicMatcher(traffic_hour=17, road_network=roads)
+    single.db.medics = make_roster(1_000, seed=9, spread=0.12)
+    patients = [(24.65 + i * 0.01, 46.60 + i * 0.015) for i in range(10)]
+
+    with ShardedMedicMatcher(workers=2, traffic_hour=17, medics=medics, road_network=roads) as sharded:
+        for hour in (None, 3):
+            expected = [single._rank("cardiac", p, 3, "ground", hour=hour) for p in patients]
+            got = sharded.rank_many([("cardiac", p, 3, "ground") for p in patients], hour=hour)
+            assert [[(r["medic"].id, r["score_data"]) for r in ranked] for ranked in got] == \
+                [[(r["medic"].id, r["score_data"]) for r in ranked] for ranked in expected]
+
+
+def test_requests_to_an_exited_worker_fail_fast(make_roster):
+    with ShardedMedicMatcher(workers=2, traffic_hour=12, medics=make_roster(200, seed=2)) as sharded:
+        shard = sharded.db.shards[0]
+        shard.process.kill()
+        shard._reader.join(timeout=5)
+        start = time.perf_counter()
+        with pytest.raises(RuntimeError, match="exited"):
+            # Every region is in reach, so the dead worker is always asked.
+            sharded._rank("cardiac", (24.7136, 46.6753), 3, "aerial", k=200)
+        assert time.perf_counter() - start < sharded.REQUEST_TIMEOUT_S
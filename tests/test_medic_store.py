@@ -0,0 +1,100 @@
+import random
+import threading
+
+from src.medic_leases import LeaseBook
+from src.medic_matcher import MedicMatcher
+from src.medic_store import SQLiteMedicDatabase, bulk_load
+
+
+def _ids(matcher, patient):
+    return [s["medic"].id for s in matcher._rank("cardiac", patient, 3, "aerial")]
+
+
+def test_sqlite_roster_ranks_like_in_memory_and_persists(tmp_path, make_roster):
+    path = tmp_path / "roster.db"
+    assert bulk_load(path, make_roster(3_000, seed=8), batch_size=500) == 3_000
+
+    stored = MedicMatcher(traffic_hour=12, db=SQLiteMedicDatabase(path))
+    memory = MedicMatcher(traffic_hour=12)
+    memory.db.medics = make_roster(3_000, seed=8)
+
+    rng = random.Random(1)
+    for _ in range(30):
+        patient = (24.7136 + rng.uniform(-0.4, 0.4), 46.6753 + rng.uniform(-0.4, 0.4))
+        assert _ids(stored, patient) == _ids(memory, patient)
+    for patient in ((26.0, 48.0), (24.7136, 47.3)):
+        assert _ids(stored, patient) == _ids(memory, patient)
+
+    top = _ids(stored, (24.70, 46.66))[0]
+    stored.db.update_status(top, "on_mission")
+    stored.db.close()
+
+    reopened = SQLiteMedicDatabase(path)
+    assert reopened.get_by_id(top).status == "on_mission"
+    assert len(reopened.medics) == 3_000
+
+
+def test_changes_from_another_connection_are_picked_up(tmp_path):
+    path = tmp_path / "roster.db"
+    matcher = MedicMatcher(traffic_hour=12, db=SQLiteMedicDatabase(path))
+    other = SQLiteMedicDatabase(path)
+    assert [m.id for m in other.medics] == [m.id for m in matcher.db.medics]
+
+    patient = (24.70, 46.66)
+    first = _ids(matcher, patient)[0]
+    other.update_status(first, "off_duty")
+    assert first not in _ids(matcher, patient)
+
+    far = matcher.db.medics[-1].id
+    other.update_location(far, patient)
+    other.update_status(far, "available")
+    assert _ids(matcher, patient)[0] == far
+    assert matcher.db.get_by_id(far).gps_location == patient
+
+
+def test_two_connections_never_reserve_the_same_medic(tmp_path):
+    path = tmp_path / "roster.db"
+    books = [LeaseBook(SQLiteMedicDatabase(path)), LeaseBook(SQLiteMedicDatabase(path))]
+    candidates = [m.id for m in books[0].db.medics if m.status == "available"][:20]
+
+    # Both connections still see every candidate as available in memory.
+    first = books[0].reserve(candidates[0], "INC-A")
+    assert first is not None
+    assert books[1].db.get_by_id(candidates[0]).status == "available"
+    index, lease = books[1].reserve_first(candidates[:2], "INC-B")
+    assert (index, lease.medic_id) == (1, candidates[1])
+    assert books[1].db.get_by_id(candidates[0]).status == "reserved"
+
+    won = {0: [], 1: []}
+    barrier = threading.Barrier(2)
+
+    def race(side):
+        for medic_id in candidates[2:]:
+            barrier.wait()
+            if books[side].reserve(medic_id, f"INC-{side}") is not None:
+                won[side].append(medic_id)
+
+    threads = [threading.Thread(target=race, args=(side,)) for side in (0, 1)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(won[0] + won[1]) == sorted(candidates[2:])
+
+
+def test_ingest_on_another_connection_keeps_a_lease(tmp_path):
+    path = tmp_path / "roster.db"
+    book = LeaseBook(SQLiteMedicDatabase(path))
+    other = SQLiteMedicDatabase(path)
+    medic_id = next(m.id for m in book.db.medics if m.status == "available")
+    lease = book.reserve(medic_id, "INC-A")
+
+    # The other connection has not synced yet and still thinks the medic is free.
+    assert other.get_by_id(medic_id).status == "available"
+    assert other.apply_updates(statuses={medic_id: "available"}) == 0
+    assert other.get_by_id(medic_id).status == "reserved"
+    assert LeaseBook(other).reserve(medic_id, "INC-B") is None
+
+    assert book.confirm(lease.lease_id)
+    other.refresh()
+    assert other.get_by_id(medic_id).status == "on_mission"
@@ -0,0 +1,106 @@
+import math
+import threading
+
+import numpy as np
+import pytest
+
+from src.ground_eta import DISPATCH_OVERHEAD_MIN, MINUTES_PER_KM, ROAD_CLASSES
+from src.medic_matcher import MedicMatcher
+from src.road_network import RoadNetwork, grid_network
+
+
+ORIGIN = (24.70, 46.60)
+SPACING = 0.01  # 1.11 km blocks
+
+
+def test_grid_trees_give_manhattan_times_from_hubs_and_reverse_trees():
+    net = grid_network(12, 15, ORIGIN, SPACING)
+    per_block = SPACING * 111 * MINUTES_PER_KM[8, ROAD_CLASSES.index("arterial")]
+
+    tree = net.shortest_path_tree(net.node_index("r2c3"), hour=8)
+    expected = [(abs(r - 2) + abs(c - 3)) * per_block for r in range(12) for c in range(15)]
+    assert np.allclose(tree, expected)
+    assert np.allclose(net.shortest_path_tree(net.node_index("r2c3"), hour=8, reverse=True), tree)
+
+    rng = np.random.default_rng(0)
+    medics = [(ORIGIN[0] + rng.uniform(0, 0.11), ORIGIN[1] + rng.uniform(0, 0.14)) for _ in range(40)]
+    patient = (ORIGIN[0] + 0.052, ORIGIN[1] + 0.097)
+    before = net.travel_minutes(medics, patient, hour=8)
+    assert net.precompute(medics[:10], hours=[8]) == len({net.nearest_node(m)[0] for m in medics[:10]})
+    assert net.travel_minutes(medics, patient, hour=8).tolist() == before.tolist()
+
+    # Snapped exactly onto nodes: overhead plus block count only.
+    assert net.eta_minutes((ORIGIN[0] + 0.02, ORIGIN[1] + 0.03), (ORIGIN[0] + 0.05, ORIGIN[1] + 0.10), 8) == \
+        round(DISPATCH_OVERHEAD_MIN + 10 * per_block, 1)
+    # Rush hour is slower than the small hours on the same route.
+    assert net.eta_minutes(medics[0], patient, 17) > net.eta_minutes(medics[0], patient, 3)
+
+
+
+def test_hub_and_reverse_trees_agree_exactly_under_concurrent_queries():
+    net = grid_network(10, 10, ORIGIN, SPACING)
+    rng = np.random.default_rng(1)
+    points = [(ORIGIN[0] + rng.uniform(0, 0.09), ORIGIN[1] + rng.uniform(0, 0.09)) for _ in range(30)]
+    net.precompute(points, hours=[8])
+    hubs, trees = net._trees[8]
+    assert trees.dtype == np.float64
+    for node, row in hubs.items():
+        # Same labels whichever tree answers: forward from the hub or reverse to the target.
+        assert np.array_equal(trees[row], [net._reverse_tree(target, 8)[node] for target in range(len(net))])
+
+    expected = [net.travel_minutes(points, p, hour=8).tolist() for p in points]
+    net._reverse.clear()
+    net._snapped.clear()
+    results = [None] * 8
+
+    def query(worker):
+        results[worker] = [net.travel_minutes(points, p, hour=8).tolist() for p in points]
+
+    threads = [threading.Thread(target=query, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [expected] * 8
+
+def test_edge_list_file_oneway_and_unreachable(tmp_path):
+    path = tmp_path / "roads.csv"
+    path.write_text(
+        "# Al Ghadir test streets\n"
+        "source,source_lat,source_lon,target,target_lat,target_lon,length_km,road_class,oneway\n"
+        "A,24.770,46.650,B,24.770,46.660,1.0,highway,0\n"
+        "B,24.770,46.660,C,24.780,46.660,,local,1\n"
+        "D,24.900,46.900,E,24.900,46.910,1.0,arterial,0\n",
+        encoding="utf-8",
+    )
+    net = RoadNetwork.from_edge_list(str(path))
+    assert len(net) == 5 and net.edge_count == 5
+
+    a, b, c = (net.node_index(x) for x in "ABC")
+    forward = net.shortest_path_tree(a, hour=3)
+    assert forward[b] == pytest.approx(MINUTES_PER_KM[3, 0])
+    assert forward[c] > forward[b] and math.isinf(forward[net.node_index("D")])
+    assert math.isinf(net.shortest_path_tree(c, hour=3)[a])  # B -> C is one-way
+    assert math.isinf(net.eta_minutes((24.900, 46.900), (24.770, 46.650), 3))
+
+    bad = tmp_path / "bad.csv"
+    bad.write_text(path.read_text(encoding="utf-8").replace("highway", "dirt"), encoding="utf-8")
+    with pytest.raises(ValueError, match="Unknown road class"):
+        RoadNetwork.from_edge_list(str(bad))
+
+
+def test_matcher_reports_road_graph_ground_etas(make_roster):
+    net = grid_network(40, 40, (24.55, 46.50), 0.01)
+    plain = MedicMatcher(traffic_hour=17)
+    routed = MedicMatcher(traffic_hour=17, road_network=net)
+    plain.db.medics = make_roster(300, seed=2)
+    routed.db.medics = make_roster(300, seed=2)
+    patient = (24.70, 46.66)
+
+    a = plain._rank("cardiac", patient, 3, "ground")
+    b = routed._rank("cardiac", patient, 3, "ground")
+    assert [r["medic"].id for r in a] == [r["medic"].id for r in b]
+    for r in b:
+        assert r["score_data"]["eta_minutes"] == net.eta_minutes(r["medic"].gps_location, patient, 17)
+    assert routed._rank("cardiac", patient, 3, "aerial")[0]["score_data"] == \
+        plain._rank("cardiac", patient, 3, "aerial")[0]["score_data"]
@@ -0,0 +1,44 @@
+import numpy as np
+
+from src.medic_matcher import MedicMatcher
+from src.roster_generator import RosterSpec, generate_roster
+
+
+def test_same_spec_gives_same_roster_and_mixes_are_respected():
+    spec = RosterSpec(
+        n=5_000,
+        seed=3,
+        specialty_mix={"trauma": 3, "cardiac": 1},
+        status_mix={"available": 1, "off_duty": 1},
+        load_alpha=2.0,
+        load_beta=5.0,
+    )
+    roster = generate_roster(spec)
+    assert roster == generate_roster(spec)
+    assert roster != generate_roster(RosterSpec(n=5_000, seed=4))
+    assert [m.id for m in roster[:3]] == ["MED-0", "MED-1", "MED-2"]
+
+    trauma = np.mean([m.specialty == "trauma" for m in roster])
+    available = np.mean([m.status == "available" for m in roster])
+    assert abs(trauma - 0.75) < 0.03 and abs(available - 0.5) < 0.03
+    assert {m.specialty for m in roster} == {"trauma", "cardiac"}
+    loads = np.array([m.current_load for m in roster])
+    assert 0 <= loads.min() and loads.max() <= spec.max_load
+    assert abs(loads.mean() / spec.max_load - 2 / 7) < 0.02
+
+    matcher = MedicMatcher(traffic_hour=12)
+    matcher.db.medics = roster
+    assert matcher.db.count_medics("available") == sum(m.status == "available" for m in roster)
+
+
+def test_clusters_concentrate_medics_around_hubs():
+    uniform = generate_roster(RosterSpec(n=4_000, seed=1))
+    clustered = generate_roster(RosterSpec(n=4_000, seed=1, clusters=4, cluster_fraction=1.0,
+                                           cluster_spread_deg=0.005))
+
+    def occupied_cells(roster):
+        return len({(round(m.gps_location[0], 2), round(m.gps_location[1], 2)) for m in roster})
+
+    assert occupied_cells(clustered) < occupied_cells(uniform) / 4
+    lat0, lon0 = RosterSpec(n=0).center
+    assert all(abs(m.gps_location[0] - lat0) <= 0.18 and abs(m.gps_location[1] - lon0) <= 0.18 for m in uniform)
@@ -0,0 +1,44 @@
+import numpy as np
+
+from src.landing_zone import find_nearest_zone, get_all_zones_sorted, get_zones_within_radius
+from src.zone_index import LandingZoneIndex, UnitVectorKDTree, chord_for_km, load_zone_index
+
+
+def _zones(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(24.55, 24.95, n)
+    lon = rng.uniform(46.45, 46.95, n)
+    return [
+        {"name": f"Zone {i}", "latitude": float(a), "longitude": float(b), "area": "20 x 20 m"}
+        for i, (a, b) in enumerate(zip(lat, lon))
+    ]
+
+
+def test_index_answers_like_the_linear_scans():
+    zones = _zones(2_000) + [{"name": "Broken", "latitude": 0, "longitude": 0}]
+    index = LandingZoneIndex(zones)
+    assert len(index) == 2_000
+
+    rng = np.random.default_rng(1)
+    for lat, lon in zip(rng.uniform(24.5, 25.0, 20), rng.uniform(46.4, 47.0, 20)):
+        assert index.nearest(lat, lon) == find_nearest_zone(zones, lat, lon)
+        everything = get_all_zones_sorted(zones, lat, lon)
+        assert index.k_nearest(7, lat, lon) == everything[:7]
+        assert index.within_radius(1.5, lat, lon) == get_zones_within_radius(zones, 1.5, lat, lon)
+    assert index.within_radius(0.0, 10.0, 10.0) == []
+    assert len(index.k_nearest(5_000, 24.7, 46.7)) == 2_000
+
+
+def test_tree_handles_ties_empty_catalogues_and_the_real_zones():
+    lat = [24.70, 24.70, 24.71, 24.70]
+    lon = [46.60, 46.60, 46.61, 46.60]
+    tree = UnitVectorKDTree(lat, lon)
+    assert tree.query(24.70, 46.60, 2)[0].tolist() == [0, 1]
+    assert tree.query_radius(24.70, 46.60, chord_for_km(0.5))[0].tolist() == [0, 1, 3]
+
+    assert LandingZoneIndex([]).nearest() is None
+    assert LandingZoneIndex([]).within_radius(5.0) == []
+
+    index = load_zone_index()
+    assert index is load_zone_index()
+    assert index.nearest() == find_nearest_zone(index.zones)
@@ -0,0 +1,43 @@
+import numpy as np
+
+from src.landing_zone import calculate_bearing, estimate_flight_time, haversine_distance
+from src.zone_matrix import nearest_zones, zone_matrices
+
+
+def _points(n, seed):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(24.5, 25.0, n), rng.uniform(46.4, 47.0, n)
+
+
+def test_matrices_match_the_scalar_functions_at_any_chunk_size():
+    p_lat, p_lon = _points(37, 0)
+    z_lat, z_lon = _points(23, 1)
+    full = zone_matrices(p_lat, p_lon, z_lat, z_lon)
+    for i in range(37):
+        for j in range(23):
+            d = haversine_distance(p_lat[i], p_lon[i], z_lat[j], z_lon[j])
+            assert abs(full.distance_km[i, j] - d) < 1e-9
+            assert abs(full.bearing[i, j] - calculate_bearing(p_lat[i], p_lon[i], z_lat[j], z_lon[j])) < 1e-9
+            assert abs(full.flight_time_min[i, j] - estimate_flight_time(d)) < 1e-9
+
+    tiny = zone_matrices(p_lat, p_lon, z_lat, z_lon, max_chunk_bytes=1, dtype=np.float32)
+    assert tiny.distance_km.dtype == np.float32
+    assert np.allclose(tiny.distance_km, full.distance_km, rtol=1e-6)
+    assert zone_matrices(p_lat[0], p_lon[0], z_lat[0], z_lon[0]).flight_time_min.shape == (1, 1)
+
+
+def test_nearest_zones_are_the_sorted_prefix_with_index_ties():
+    p_lat, p_lon = _points(500, 2)
+    z_lat, z_lon = _points(300, 3)
+    z_lat[7], z_lon[7] = z_lat[5], z_lon[5]  # duplicate zone: tie goes to index 5
+    full = zone_matrices(p_lat, p_lon, z_lat, z_lon)
+
+    indexes, near = nearest_zones(p_lat, p_lon, z_lat, z_lon, k=4, max_chunk_bytes=200_000)
+    assert indexes.tolist() == np.argsort(full.distance_km, axis=1, kind="stable")[:, :4].tolist()
+    assert np.array_equal(near.distance_km, np.take_along_axis(full.distance_km, indexes, axis=1))
+    assert np.allclose(near.bearing, np.take_along_axis(full.bearing, indexes, axis=1))
+    assert np.allclose(near.flight_time_min, np.take_along_axis(full.flight_time_min, indexes, axis=1))
+
+    indexes, _ = nearest_zones([z_lat[5]], [z_lon[5]], z_lat, z_lon, k=2)
+    assert indexes.tolist() == [[5, 7]]
+    assert nearest_zones(p_lat, p_lon, z_lat[:2], z_lon[:2], k=10)[0].shape == (500, 2)
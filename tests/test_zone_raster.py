@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from src.landing_zone import AL_GHADIR_BOUNDS, find_nearest_zone
+from src.zone_index import load_zone_index
+from src.zone_raster import NearestZoneRaster
+from tests.test_zone_index import _zones
+
+
+BOUNDS = {"lat_min": 24.6, "lat_max": 24.9, "lon_min": 46.5, "lon_max": 46.9}
+
+
+def test_raster_answers_like_find_nearest_zone():
+    zones = _zones(300)
+    zones += [dict(z, name=f"Copy of {z['name']}") for z in zones[:3]]  # ties go to the lower index
+    raster = NearestZoneRaster.build(zones, BOUNDS)
+    assert 0 < raster.ambiguous_fraction < 1
+
+    rng = np.random.default_rng(2)
+    lat, lon = rng.uniform(24.55, 24.95, 1_500), rng.uniform(46.45, 46.95, 1_500)
+    names = [z["name"] for z in zones]
+    expected = [names.index(find_nearest_zone(zones, a, b).name) for a, b in zip(lat, lon)]
+    assert [raster.nearest_index(a, b) for a, b in zip(lat, lon)] == expected
+    assert raster.nearest_indexes(lat, lon).tolist() == expected
+    assert raster.nearest(lat[0], lon[0]) == find_nearest_zone(zones, lat[0], lon[0])
+
+
+def test_raster_is_saved_reused_and_rebuilt(tmp_path):
+    path = str(tmp_path / "zones.npz")
+    zones = _zones(50)
+    built = NearestZoneRaster.load_or_build(path, zones, BOUNDS)
+    loaded = NearestZoneRaster.load_or_build(path, zones, BOUNDS)
+    assert np.array_equal(built.cells, loaded.cells) and loaded.cell_deg == built.cell_deg
+
+    with pytest.raises(ValueError):
+        NearestZoneRaster.load(path, zones, AL_GHADIR_BOUNDS)
+    moved = _zones(50, seed=1)
+    with pytest.raises(ValueError):
+        NearestZoneRaster.load(path, moved)
+    rebuilt = NearestZoneRaster.load_or_build(path, moved, BOUNDS)
+    assert rebuilt.nearest(24.75, 46.7) == find_nearest_zone(moved, 24.75, 46.7)
+    assert NearestZoneRaster.load(path, moved).nearest_index(24.75, 46.7) == rebuilt.nearest_index(24.75, 46.7)
+
+    real = load_zone_index()
+    raster = NearestZoneRaster.build(real)
+    for lat, lon in zip(np.linspace(24.755, 24.785, 40), np.linspace(46.675, 46.635, 40)):
+        assert raster.nearest(lat, lon) == find_nearest_zone(real.zones, lat, lon)